@@ -230,7 +230,8 @@ Please provide a comprehensive answer based on the context above, and indicate w
         response = llm_complete_json(
             system=system_prompt,
             user={"query": request.query, "context": context},
-            max_tokens=800
+            max_tokens=800,
+            label="query",
         )
         
         if isinstance(response, dict) and response.get("answer"):
@@ -256,7 +257,7 @@ def get_recommendations(top_k: int = Query(default=5, ge=1, le=20)):
     
     try:
         recs = recommend(
-            vault_root=VAULT_ROOT.parent,  # Adjust path
+            vault_root=VAULT_ROOT,
             index_csv=INDEX_PATH,
             model_dir=MODEL_DIR,
             profile=profile,
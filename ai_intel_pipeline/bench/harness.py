@@ -0,0 +1,122 @@
+"""
+Reproducible, offline pipeline benchmark.
+
+For each synthetic vault size the harness builds a fresh vault in a scratch
+directory, then times ``export_jsonl``, ``build_embeddings`` (deterministic
+hashing embedder), ``run_ingest`` (fixture feeds, GitHub, transcripts and LLM
+responses; semantic novelty against the synthetic vault), ``recommend``
+(repeated, for latency percentiles) and ``write_report``. No network access
+or API key is needed; results depend only on the code, fixtures and machine.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+from .. import llm_metrics
+from ..config import load_profile, load_settings
+from ..exporter import export_jsonl
+from ..model.embedder import build_embeddings, hashing_embedder
+from ..model.recommend import recommend
+from ..pipeline import run_ingest
+from ..profiling import StageProfiler
+from ..report import write_report
+from ..storage.index import Index
+from ..storage.vault import Vault
+from . import synth
+from .stubs import bench_sources, load_fixtures, offline
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _timed(fn: Callable, items: int | None = None) -> Dict:
+    t0 = time.perf_counter()
+    out = fn()
+    seconds = time.perf_counter() - t0
+    n = out if items is None else items
+    res = {"seconds": round(seconds, 4), "items": n}
+    if n and seconds > 0:
+        res["items_per_second"] = round(n / seconds, 1)
+    return res
+
+
+def _percentiles(samples: Sequence[float]) -> Dict:
+    xs = sorted(samples)
+    pick = lambda q: xs[min(len(xs) - 1, int(round(q * (len(xs) - 1))))]
+    return {"runs": len(xs), "p50_ms": round(pick(0.5) * 1000, 2), "p95_ms": round(pick(0.95) * 1000, 2),
+            "max_ms": round(xs[-1] * 1000, 2)}
+
+
+def bench_size(n: int, ingest_limit: int = 10, recommend_runs: int = 20, pack: bool = False, seed: int = 0,
+               keep: bool = False) -> Dict:
+    """Benchmark one vault size in a scratch copy of ``config/`` and ``profile/``."""
+    home = Path.cwd()
+    work = Path(tempfile.mkdtemp(prefix=f"ai-intel-bench-{n}-"))
+    for d in ("config", "profile"):
+        if (home / d).is_dir():
+            shutil.copytree(home / d, work / d)
+    embed_fn = hashing_embedder()
+    phases: Dict[str, Dict] = {}
+    os.chdir(work)
+    try:
+        with offline(load_fixtures(), embed_fn=embed_fn) as fx:
+            vault_root, index_csv = Path("vault/ai-intel"), Path("vault/index.csv")
+            built: Dict = {}
+            phases["synth_vault"] = _timed(lambda: built.update(synth.build_vault(n, seed=seed, pack=pack)), items=n)
+
+            def export():
+                path = export_jsonl(vault_root, index_csv)
+                with path.open("r", encoding="utf-8") as f:
+                    return sum(1 for _ in f)
+            phases["export_jsonl"] = _timed(export)
+            phases["export_jsonl"]["vault_items"] = n
+
+            def embed():
+                emb, _ = build_embeddings(Path("vault/export/chunks.jsonl"), Path("vault/model"), embed_fn=embed_fn)
+                import numpy as np
+
+                return int(np.load(emb).shape[0])
+            phases["build_embeddings"] = _timed(embed)
+
+            created: list = []
+            profiler = StageProfiler()
+            phases["run_ingest"] = _timed(lambda: created.extend(run_ingest(
+                sources=bench_sources(fx), settings=load_settings(), vault=Vault(root=vault_root),
+                index=Index(index_path=index_csv), limit=ingest_limit, dry_run=False, profiler=profiler,
+            )) or len(created))
+            if created:
+                phases["run_ingest"]["ms_per_item"] = round(phases["run_ingest"]["seconds"] * 1000 / len(created), 1)
+            phases["run_ingest"]["stages"] = {k: v["seconds"] for k, v in profiler.to_dict()["stages"].items()}
+
+            profile = load_profile()
+            samples = []
+            for _ in range(max(1, recommend_runs)):
+                t0 = time.perf_counter()
+                recommend(vault_root, index_csv, Path("vault/model"), profile, top_k=10, embed_fn=embed_fn)
+                samples.append(time.perf_counter() - t0)
+            phases["recommend"] = _percentiles(samples)
+
+            phases["write_report"] = _timed(lambda: write_report(vault_root, index_csv) and None, items=n + len(created))
+            llm = {stage: {k: s[k] for k in ("calls", "failures", "parse_sliced", "input_tokens", "output_tokens")}
+                   for stage, s in llm_metrics.summarize().items()}
+        return {"vault_items": n, "months": built.get("months"), "packed": built.get("packed"), "phases": phases,
+                "llm": llm, "workdir": str(work) if keep else None}
+    finally:
+        os.chdir(home)
+        if not keep:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+def run_bench(sizes: Sequence[int] = DEFAULT_SIZES, **kwargs) -> Dict:
+    """``bench_size`` for every size; keyword arguments are passed through."""
+    return {
+        "started": datetime.utcnow().isoformat() + "Z",
+        "options": {"sizes": list(sizes), **kwargs},
+        "results": [bench_size(n, **kwargs) for n in sizes],
+    }
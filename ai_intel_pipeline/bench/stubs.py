@@ -0,0 +1,132 @@
+"""
+Offline stand-ins for every network call ``run_ingest`` makes, replaying the
+recorded fixtures in ``bench/fixtures``: vendor feeds, YouTube search results,
+yt-dlp metadata, captions and the Whisper fallback, GitHub releases, repo
+search and README/CHANGELOG fetches, the gate LLM responses and embeddings.
+
+Stubs replace only the functions that talk to the network, so the pipeline's
+own code (transcript cache, evidence selection, prompt budgets, LLM JSON
+parsing and metrics) still runs.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest import mock
+
+import numpy as np
+
+from ..model.embedder import EmbedFn, hashing_embedder
+from ..transcripts.youtube import extract_video_id
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixtures(root: Path = FIXTURES_DIR) -> Dict:
+    return {name: json.loads((root / f"{name}.json").read_text(encoding="utf-8")) for name in ("feeds", "github", "youtube", "llm")}
+
+
+def bench_sources(fixtures: Dict) -> Dict:
+    """A sources.yaml equivalent that fetches exactly what the fixtures hold."""
+    return {
+        "youtube": {"channels": [], "queries": ["bench"]},
+        "github": {"repos": list(fixtures["github"]["releases"]), "search_queries": ["bench"]},
+        "feeds": [{"url": f"https://feeds.example/{name}", "name": name} for name in fixtures["feeds"]],
+    }
+
+
+def _segments(rows: List) -> List[Dict]:
+    return [{"t_start": float(a), "t_end": float(b), "text": t} for a, b, t in rows]
+
+
+def _llm_provider(responses: List[Dict]):
+    """Stands in for ``llm._anthropic_complete_json``: picks the response whose
+    ``system_contains`` matches, reports its recorded usage and latency."""
+    from ..llm import _parse_json
+
+    def complete(system, user, max_tokens=400, model=None, usage=None, context=None):
+        resp = next((r for r in responses if r["system_contains"] in system), None)
+        if usage is not None:
+            usage["attempts"] = usage.get("attempts", 0) + 1
+        if resp is None:
+            return None
+        if resp.get("latency_ms"):
+            time.sleep(resp["latency_ms"] / 1000.0)
+        if usage is not None:
+            usage.update(provider="fixture", model=f"fixture-{resp['stage']}", cached_input_tokens=0, **resp["usage"])
+        return _parse_json(resp["text"], usage)
+
+    return complete
+
+
+@contextmanager
+def offline(fixtures: Dict | None = None, embed_fn: EmbedFn | None = None) -> Iterator[Dict]:
+    """Patch the pipeline's network calls with fixture replays for the block.
+
+    API keys are hidden meanwhile, so nothing can fall through to a real
+    provider. Yields the fixtures in use.
+    """
+    from .. import llm, pipeline, report
+    from ..fetchers import youtube as yt_fetch
+    from ..gates import gate1_validity, gate2_personalize
+    from ..model.novelty import NoveltyIndex
+    from ..model.recommend import recommend
+    from ..transcripts import prefetch, youtube as yt_transcripts
+
+    fx = fixtures or load_fixtures()
+    embed_fn = embed_fn or hashing_embedder()
+    feeds, gh, yt = fx["feeds"], fx["github"], fx["youtube"]
+
+    def feed_items(url, name=None):
+        return [dict(c) for c in feeds.get(name or url, [])]
+
+    def youtube_info(url):
+        vid = extract_video_id(url or "")
+        info = yt["info"].get(vid)
+        return {**info, "id": vid} if info else None
+
+    def captions(url, info=None):
+        rows = yt["captions"].get(extract_video_id(url or ""))
+        return _segments(rows) if rows else None
+
+    def transcribe_audio(url, chunk_seconds=600, max_workers=3, info=None):
+        fb = yt["fallback"].get(extract_video_id(url or ""))
+        if not fb:
+            return None
+        return {"segments": _segments(fb["segments"]), "minutes": fb["minutes"], "model": fb["model"], "complete": True}
+
+    def doc(kind):
+        return lambda owner_repo: (gh["docs"].get(owner_repo) or {}).get(kind)
+
+    patches = [
+        (pipeline, "fetch_feed_items", feed_items),
+        (pipeline, "fetch_youtube_channel_rss", lambda *a, **k: []),
+        (pipeline, "fetch_youtube_search_rss", lambda q: [dict(c) for c in yt["search"]]),
+        (pipeline, "fetch_github_releases", lambda repo: [dict(c) for c in gh["releases"].get(repo, [])]),
+        (pipeline, "search_innovative_repos", lambda queries, per_query=3: [dict(c) for c in gh["search"]]),
+        (pipeline, "fetch_readme", doc("readme")),
+        (pipeline, "fetch_changelog", doc("changelog")),
+        (yt_fetch, "extract_youtube_info", youtube_info),
+        (pipeline, "fetch_captions_segments", captions),
+        (prefetch, "fetch_captions_segments", captions),
+        (yt_transcripts, "transcribe_audio", transcribe_audio),
+        (llm, "_anthropic_complete_json", _llm_provider(fx["llm"])),
+        (llm, "_openai_complete_json", lambda *a, **k: None),
+        (gate1_validity, "have_llm", lambda: True),
+        (gate2_personalize, "have_llm", lambda: True),
+        # semantic novelty against the vault's (fake) embeddings
+        (pipeline, "_open_novelty_index", lambda settings, dry_run: NoveltyIndex.from_vault(Path("vault"))),
+        (pipeline, "create_embedding", lambda text: np.asarray(embed_fn([text])[0], dtype=np.float32)),
+        (report, "rec_top", lambda *a, **k: recommend(*a, **k, embed_fn=embed_fn)),
+    ]
+    with ExitStack() as stack:
+        for target, name, value in patches:
+            stack.enter_context(mock.patch.object(target, name, value))
+        saved = {k: os.environ.pop(k) for k in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY") if k in os.environ}
+        stack.callback(os.environ.update, saved)
+        yield fx
@@ -0,0 +1,114 @@
+"""
+Synthetic vaults of a given size for benchmarks: item folders (item.json,
+highlights.json, summary.md, evidence.json) spread over recent months, plus a
+matching index.csv. Content is drawn from a seeded RNG, so a size always
+produces the same vault.
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from ..config import load_pillars
+from ..storage.atomic import batched_fsync
+from ..storage.index import Index
+from ..storage.vault import Vault
+
+
+TOPICS = [
+    "Claude Code", "OpenAI", "Next.js", "Tailwind", "Agents", "Cursor", "Vercel", "Cloudflare",
+    "prompt caching", "evals", "RAG", "tool calling", "structured outputs", "subagents", "MCP",
+]
+ACTIONS = ["ships", "adds", "improves", "explains", "benchmarks", "simplifies", "automates", "refactors"]
+OBJECTS = [
+    "workflow", "pipeline", "UI components", "tests", "deploys", "code review", "streaming", "scaffolding",
+    "design system", "CI checks", "monitoring", "release notes",
+]
+SOURCES = [("vendor", "Anthropic News", "blog"), ("vendor", "OpenAI Blog", "blog"), ("github", "vercel/ai", "release"),
+           ("youtube", "YouTube Search", "talk"), ("github", "GitHub Search", "application")]
+
+
+def _item(rng: random.Random, i: int, pillars: List[str]) -> Dict:
+    topic, other = rng.sample(TOPICS, 2)
+    title = f"{topic} {rng.choice(ACTIONS)} {rng.choice(OBJECTS)} with {other} #{i}"
+    source_type, source_name, ctype = rng.choice(SOURCES)
+    scores = {
+        "validity_conf": round(rng.uniform(0.5, 0.95), 3),
+        "credibility": rng.choice([0.5, 0.8]),
+        "novelty": round(rng.uniform(0.3, 0.9), 3),
+        "relevance": round(rng.uniform(0.3, 0.9), 3),
+        "actionability": round(rng.uniform(0.3, 0.9), 3),
+    }
+    scores["overall"] = round(0.35 * scores["relevance"] + 0.25 * scores["novelty"] + 0.25 * scores["actionability"] + 0.075, 3)
+    return {
+        "title": title,
+        "url": f"https://synthetic.example/{source_type}/{i}",
+        "source_type": source_type,
+        "source_name": source_name,
+        "type": ctype,
+        "topic": topic,
+        "other": other,
+        "scores": scores,
+        "pillars": rng.sample(pillars, min(len(pillars), rng.randint(1, 3))) if pillars else [],
+    }
+
+
+def build_vault(n: int, months: int = 12, seed: int = 0, now: datetime | None = None, pack: bool = False) -> Dict:
+    """Write ``n`` synthetic items under ``vault/ai-intel`` and index them in ``vault/index.csv``.
+
+    With ``pack`` every month but the current one is moved into month packs.
+    Returns ``{"items", "months", "packed"}``.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.utcnow()
+    vault = Vault(root=Path("vault/ai-intel"))
+    index = Index(index_path=Path("vault/index.csv"))
+    pillars = [p.get("name") for p in (load_pillars().get("pillars") or []) if p.get("name")]
+    span = max(1, months) * 30 * 24 * 60
+    rows: List[Dict] = []
+    with batched_fsync(max_pending=4096):
+        for i in range(n):
+            it = _item(rng, i, pillars)
+            dt = now - timedelta(minutes=rng.randrange(span))
+            published = dt.replace(microsecond=0).isoformat() + "Z"
+            item_id, item_dir = vault.create_item_folder(dt=dt)
+            record = vault.new_item(
+                item_id=item_id, title=it["title"], canonical_url=it["url"], source_type=it["source_type"],
+                source_name=it["source_name"], published_at=published, content_type=it["type"], item_dir=item_dir,
+            )
+            record.update_scores(it["scores"])
+            record.update_fields({"pillars": it["pillars"]})
+            record.flush()
+            vault.write_json(item_dir / "highlights.json", {
+                "summary_bullets": [f"Source: {it['source_name']}", f"Title: {it['title']}",
+                                    f"Context: how {it['topic']} and {it['other']} fit an AI app workflow."],
+                "keyphrases": [it["topic"], it["other"]],
+                "key_claims": [{"claim": f"{it['topic']} improves {rng.choice(OBJECTS)}", "pointer": it["url"], "type": "tutorial"}],
+                "youtube_quotes": [],
+            })
+            vault.write_text(item_dir / "summary.md", (
+                f"TL;DR\n{it['topic']} with {it['other']}: a practical pattern for AI app workflows.\n\n"
+                f"Why it matters\n- Relevant to {it['topic']} work.\n- Small change, measurable gain.\n\n"
+                "Apply steps\n1) Read the source.\n2) Prototype on a branch.\n3) Measure and open a PR.\n"
+            ))
+            vault.write_json(item_dir / "evidence.json", {
+                "verdict": "pass" if it["scores"]["validity_conf"] >= 0.6 else "fail",
+                "confidence": it["scores"]["validity_conf"], "citations": [], "notes": "synthetic",
+            })
+            rows.append({
+                "item_id": item_id, "title": it["title"], "url": it["url"], "source": it["source_name"],
+                "type": it["type"], "date": published,
+                "validity": f"{it['scores']['validity_conf']:.3f}", "credibility": f"{it['scores']['credibility']:.3f}",
+                "relevance": f"{it['scores']['relevance']:.3f}", "actionability": f"{it['scores']['actionability']:.3f}",
+                "novelty": f"{it['scores']['novelty']:.3f}", "overall": f"{it['scores']['overall']:.3f}",
+                "route": "weekly", "drive_path": str(item_dir),
+            })
+        rows.sort(key=lambda r: r["item_id"])
+        index.rewrite(rows)
+    packed = 0
+    if pack:
+        for month in vault.cold_months(keep_months=1, now=now):
+            packed += vault.pack_month(month)
+    return {"items": n, "months": len(vault.months()), "packed": packed}
@@ -0,0 +1,117 @@
+"""
+Multi-keyword matcher compiled once into a single regex.
+
+All keywords are matched in one pass. A keyword must start on a word
+boundary, so "UI" no longer fires inside "build", and may end in a common
+inflection (-s, -es, -ed, -ing), so the stems in pillars.yaml still match
+"agents", "prompts" or "deploying". "Next.js" still matches as a unit.
+Matches that contain other keywords (e.g. "claude code" contains "claude")
+credit both, like the dictionary links of an Aho–Corasick automaton.
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+
+_WORD = "a-z0-9"
+# Inflections a keyword may carry before its trailing word boundary
+SUFFIX = "(?:s|es|ed|ing)?"
+
+
+def _bounded(kw: str) -> str:
+    return f"(?<![{_WORD}]){re.escape(kw)}(?![{_WORD}])"
+
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """Regex for ``words`` shaped as a character trie, so the engine rejects a
+    position after one character instead of trying every alternative.
+    Longer continuations are tried before ending a word (longest match)."""
+    trie: Dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        ends = "" in node
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if ends:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Match keyword groups (label -> keywords) case-insensitively in one scan."""
+
+    def __init__(self, groups: Sequence[Tuple[str, Sequence[str]]]):
+        self.labels: List[str] = []
+        self._labels_for: Dict[str, List[str]] = {}
+        for label, kws in groups:
+            if label not in self.labels:
+                self.labels.append(label)
+            for kw in kws:
+                k = " ".join((kw or "").split()).lower()
+                if k and label not in self._labels_for.setdefault(k, []):
+                    self._labels_for[k].append(label)
+        keywords = sorted(self._labels_for, key=len, reverse=True)
+        # Longest keyword wins at each position; one left-to-right scan. The
+        # group captures the keyword without its inflection.
+        self._re = (
+            re.compile(f"(?<![{_WORD}])({_trie_pattern(keywords)}){SUFFIX}(?![{_WORD}])") if keywords else None
+        )
+        # Shorter keywords inside a longer one (the automaton's dictionary links)
+        self._contained: Dict[str, List[str]] = {
+            k: [o for o in keywords if o != k and o in k and len(re.findall(_bounded(o), k)) > 0]
+            for k in keywords
+        }
+
+    def matches(self, text: str) -> List[str]:
+        """Every keyword occurrence (lowercased), in text order."""
+        if self._re is None or not text:
+            return []
+        out: List[str] = []
+        for k in self._re.findall(text.lower()):
+            out.append(k)
+            out.extend(self._contained[k])
+        return out
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Hit count per label for labels with at least one hit."""
+        if self._re is None or not text:
+            return {}
+        per_kw = Counter(self._re.findall(text.lower()))
+        for k, n in list(per_kw.items()):
+            for o in self._contained[k]:
+                per_kw[o] += n
+        counts: Dict[str, int] = {}
+        for k, n in per_kw.items():
+            for label in self._labels_for[k]:
+                counts[label] = counts.get(label, 0) + n
+        return counts
+
+    def ranked(self, text: str) -> List[Tuple[str, int]]:
+        """(label, hits) sorted by hits, ties in definition order."""
+        counts = self.counts(text)
+        return sorted(((l, counts[l]) for l in self.labels if l in counts), key=lambda x: -x[1])
+
+
+_CACHE: Dict[tuple, KeywordMatcher] = {}
+
+
+def compiled_matcher(groups: Sequence[Tuple[str, Sequence[str]]]) -> KeywordMatcher:
+    """Matcher for ``groups``, compiled once per distinct keyword configuration."""
+    key = tuple((label, tuple(kws)) for label, kws in groups)
+    m = _CACHE.get(key)
+    if m is None:
+        if len(_CACHE) > 32:
+            _CACHE.clear()
+        m = _CACHE[key] = KeywordMatcher(groups)
+    return m
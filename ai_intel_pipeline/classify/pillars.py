@@ -1,27 +1,21 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+from .matcher import KeywordMatcher, compiled_matcher
 
-def classify_pillars(text: str, keyphrases: List[str], pillars_cfg: Dict) -> List[str]:
-    t = text.lower()
-    hits: List[str] = []
+
+def pillar_matcher(pillars_cfg: Dict) -> KeywordMatcher:
     pillar_defs = pillars_cfg.get("pillars", []) if isinstance(pillars_cfg, dict) else []
-    for p in pillar_defs:
-        name = p.get("name")
-        kws = [k.lower() for k in (p.get("keywords") or [])]
-        if not name or not kws:
-            continue
-        if any(kw in t for kw in kws):
-            hits.append(name)
-            continue
-    # Boost with keyphrases
-    kp = " ".join(keyphrases).lower()
-    for p in pillar_defs:
-        name = p.get("name")
-        kws = [k.lower() for k in (p.get("keywords") or [])]
-        if name in hits:
-            continue
-        if any(kw in kp for kw in kws):
-            hits.append(name)
-    return hits[:3]
+    return compiled_matcher(
+        [(p.get("name"), p.get("keywords") or []) for p in pillar_defs if p.get("name") and p.get("keywords")]
+    )
+
+
+def pillar_hits(text: str, keyphrases: List[str], pillars_cfg: Dict) -> List[Tuple[str, int]]:
+    """(pillar, keyword hits) over text + keyphrases in one pass, most hits first."""
+    return pillar_matcher(pillars_cfg).ranked(text + "\n" + " ".join(keyphrases))
+
+
+def classify_pillars(text: str, keyphrases: List[str], pillars_cfg: Dict) -> List[str]:
+    return [name for name, _ in pillar_hits(text, keyphrases, pillars_cfg)[:3]]
@@ -0,0 +1,82 @@
+"""
+Cheap local triage: rank fetched candidates by expected value before any
+per-item network or LLM work, so the daily limit goes to the most promising
+items rather than simply the newest.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from .pillars import classify_pillars
+from ..gates.gate1_validity import source_credibility
+from ..normalize.highlights import extract_keyphrases
+
+
+DEFAULT_WEIGHTS = {"relevance": 0.3, "actionability": 0.2, "credibility": 0.1}
+ACTION_WORDS = ["how to", "tutorial", "guide", "walkthrough", "example", "template", "release", "launch", "introducing"]
+
+
+def _age_days(published_at: str | None, now: datetime) -> float | None:
+    if not published_at:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(published_at).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - dt).total_seconds() / 86400)
+
+
+def triage_score(
+    candidate: Dict,
+    profile: Dict,
+    pillars_cfg: Dict,
+    policy: Dict,
+    half_life_days: float = 7,
+    now: datetime | None = None,
+) -> Dict:
+    """Score a candidate from title/description only.
+
+    Mirrors the recommender's combination: weighted relevance, actionability and
+    credibility, boosted by profile priorities and learned pillar multipliers,
+    then decayed by age.
+    """
+    now = now or datetime.now(timezone.utc)
+    text = (candidate.get("title") or "") + "\n" + (candidate.get("raw_description") or "")
+    t = text.lower()
+    pillars = classify_pillars(text, extract_keyphrases(text), pillars_cfg)
+    priorities = [p.lower() for p in profile.get("priorities", [])]
+    prio_hits = sum(1 for p in priorities if p and p in t)
+
+    relevance = min(1.0, 0.3 * len(pillars) + 0.35 * prio_hits)
+    actionability = 0.5 if candidate.get("type") in ("release", "application") else 0.3
+    if any(w in t for w in ACTION_WORDS):
+        actionability += 0.3
+    if "github.com/" in t:
+        actionability += 0.2
+    credibility = source_credibility(candidate)
+
+    sw = {**DEFAULT_WEIGHTS, **(policy.get("score_weights") or {})}
+    total = sw["relevance"] + sw["actionability"] + sw["credibility"]
+    base = (sw["relevance"] * relevance + sw["actionability"] * min(1.0, actionability) + sw["credibility"] * credibility) / (total or 1)
+
+    learned = policy.get("pillars_multipliers") or {}
+    boost = 1.0 + 0.05 * prio_hits + sum(float(learned.get(p.lower(), 0)) for p in pillars)
+
+    age = _age_days(candidate.get("published_at"), now)
+    recency = 0.5 if age is None else (0.5 ** (age / half_life_days) if half_life_days else 1.0)
+    score = base * max(0.0, boost) * (0.5 + 0.5 * recency)
+    return {"score": round(score, 4), "pillars": pillars, "relevance": relevance, "credibility": credibility}
+
+
+def rank_candidates(candidates: List[Dict], profile: Dict, pillars_cfg: Dict, policy: Dict, half_life_days: float = 7) -> List[Dict]:
+    """Candidates sorted by triage score (stable, so ties keep newest-first order).
+
+    Each candidate gets a ``_triage`` score for later inspection.
+    """
+    now = datetime.now(timezone.utc)
+    for c in candidates:
+        c["_triage"] = triage_score(c, profile, pillars_cfg, policy, half_life_days, now)["score"]
+    return sorted(candidates, key=lambda c: c["_triage"], reverse=True)
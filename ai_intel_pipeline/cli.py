@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 import sys
+import time
 import typer
 from rich.console import Console
 from pathlib import Path
@@ -8,7 +9,9 @@ from pathlib import Path
 from .config import load_settings, load_sources, ensure_dirs
 from .storage.vault import Vault
 from .storage.index import Index
+from .storage.views import Views
 from .pipeline import run_ingest, run_digest
+from .profiling import StageProfiler
 from .exporter import export_jsonl
 from .apply.pr import apply_to_repo_from_item
 from .model.embedder import build_embeddings
@@ -37,8 +40,122 @@ def ingest(
     sources = load_sources()
     vault = Vault(root=Path("vault/ai-intel"))
     index = Index(index_path=Path("vault/index.csv"))
-    created = run_ingest(sources=sources, settings=settings, vault=vault, index=index, limit=limit, dry_run=dry_run)
+    profiler = StageProfiler()
+    created = run_ingest(
+        sources=sources, settings=settings, vault=vault, index=index, limit=limit, dry_run=dry_run, profiler=profiler,
+    )
     console.print(f"Ingested {len(created)} items")
+    prof = profiler.to_dict()
+    top = list(prof["stages"].items())[:5]
+    console.print(
+        f"Took {prof['total_seconds']:.1f}s; slowest stages: " + ", ".join(f"{k} {v['seconds']:.1f}s" for k, v in top)
+    )
+
+
+@app.command("ingest-coordinator")
+def ingest_coordinator(
+    limit: int = typer.Option(5, help="Max new items to ingest"),
+    workers: int = typer.Option(2, help="Local worker processes (0 = only workers on other nodes)"),
+    queue: str = typer.Option(None, help="Queue URL (default: distributed.queue setting)"),
+    dry_run: bool = typer.Option(False, help="Do not call external APIs"),
+):
+    """Fetch and triage candidates into the work queue, then index what workers finish."""
+    from .distributed import run_coordinator
+
+    console.rule("Ingest Coordinator")
+    settings = load_settings()
+    vault = Vault(root=Path("vault/ai-intel"))
+    index = Index(index_path=Path("vault/index.csv"))
+    created = run_coordinator(
+        sources=load_sources(), settings=settings, vault=vault, index=index, limit=limit, dry_run=dry_run,
+        workers=workers, url=queue,
+    )
+    console.print(f"Ingested {len(created)} items")
+
+
+@app.command("ingest-worker")
+def ingest_worker(
+    queue: str = typer.Option(None, help="Queue URL (default: distributed.queue setting)"),
+    idle_timeout: float = typer.Option(None, help="Exit after this many idle seconds (default: setting)"),
+    dry_run: bool = typer.Option(False, help="Do not call external APIs"),
+):
+    """Process enrich/transcript and gate tasks from the work queue."""
+    from .distributed import queue_url, run_worker
+    from .storage.queue import open_queue
+
+    settings = load_settings()
+    done = run_worker(
+        open_queue(queue_url(settings, queue)), settings, Vault(root=Path("vault/ai-intel")),
+        dry_run=dry_run, idle_timeout=idle_timeout,
+    )
+    console.print(f"Worker finished {done} tasks")
+
+
+@app.command("queue-status")
+def queue_status(queue: str = typer.Option(None, help="Queue URL (default: distributed.queue setting)")):
+    """Show work queue task counts per stage."""
+    from .distributed import queue_url
+    from .storage.queue import open_queue
+
+    for topic, counts in sorted(open_queue(queue_url(load_settings(), queue)).counts().items()):
+        console.print(f"{topic}: " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+
+
+@app.command("llm-metrics")
+def llm_metrics_cmd(
+    days: int = typer.Option(7, help="Summarize calls from the last N days"),
+    prom: bool = typer.Option(False, help="Also write the Prometheus text export"),
+):
+    """Show LLM call latency, tokens, retries and parse fallbacks per stage."""
+    from . import llm_metrics
+
+    stages = llm_metrics.summarize(days=days)
+    if not stages:
+        console.print("No LLM calls recorded.")
+    for stage, s in sorted(stages.items()):
+        lat = s["latency"]
+        console.print(
+            f"{stage}: calls={s['calls']} failures={s['failures']} retries={s['retries']} "
+            f"parse_sliced={s['parse_sliced']} parse_failed={s['parse_failed']} "
+            f"p50={lat['p50']}s p95={lat['p95']}s "
+            f"tokens in={s['input_tokens']} (cached {s['cached_input_tokens']}) out={s['output_tokens']}"
+        )
+    if prom:
+        console.print(f"Wrote {llm_metrics.write_prometheus()}")
+
+
+@app.command()
+def bench(
+    sizes: str = typer.Option("1000,10000,100000", help="Comma-separated synthetic vault sizes"),
+    ingest_limit: int = typer.Option(10, help="Max new items for the fixture ingest run"),
+    recommend_runs: int = typer.Option(20, help="Repeated recommend() calls for latency percentiles"),
+    pack: bool = typer.Option(False, help="Pack every month but the current one before benchmarking"),
+    keep: bool = typer.Option(False, help="Keep the scratch vaults for inspection"),
+    out: str = typer.Option("vault/status/bench.json", help="Where to write the results JSON"),
+):
+    """Benchmark ingest, export, embeddings, recommend and report offline on synthetic vaults."""
+    from .bench.harness import run_bench
+    from .storage.atomic import atomic_write_json
+
+    out_path = Path(out).resolve()
+    console.rule("Benchmark")
+    data = run_bench([int(s) for s in sizes.split(",") if s.strip()], ingest_limit=ingest_limit,
+                     recommend_runs=recommend_runs, pack=pack, keep=keep)
+    for res in data["results"]:
+        console.print(f"[bold]{res['vault_items']} items[/bold] ({res['months']} months, {res['packed']} packed)")
+        for name, ph in res["phases"].items():
+            if "p50_ms" in ph:
+                console.print(f"  {name}: p50={ph['p50_ms']}ms p95={ph['p95_ms']}ms over {ph['runs']} runs")
+            else:
+                rate = f" ({ph['items_per_second']}/s)" if ph.get("items_per_second") else ""
+                console.print(f"  {name}: {ph['seconds']}s for {ph['items']} items{rate}")
+        if res["phases"].get("run_ingest", {}).get("stages"):
+            top = list(res["phases"]["run_ingest"]["stages"].items())[:3]
+            console.print("  ingest slowest: " + ", ".join(f"{k} {v}s" for k, v in top))
+        if res.get("workdir"):
+            console.print(f"  kept: {res['workdir']}")
+    atomic_write_json(out_path, data)
+    console.print(f"Wrote {out_path}")
 
 
 @app.command()
@@ -87,13 +204,12 @@ def apply(
     dry_run: bool = typer.Option(True, help="Dry-run: do not write or run gh"),
 ):
     """Apply an insight to a local repo: add summary file and open PR via gh CLI (optional)."""
-    item_dir = Path("vault/ai-intel/items")
-    # find month shard containing item_id
-    matches = [p for p in Path("vault/ai-intel/items").rglob("*") if p.name == item_id]
-    if not matches:
-        console.print(f"Item {item_id} not found under vault/ai-intel/items")
+    vault = Vault(root=Path("vault/ai-intel"))
+    if vault.locate(item_id) is None:
+        console.print(f"Item {item_id} not found under vault/ai-intel")
         raise typer.Exit(code=1)
-    item_path = matches[0]
+    # packed items are restored to their folder first
+    item_path = vault.unpack_item(item_id)
     res = apply_to_repo_from_item(item_path, Path(repo_dir), dry_run=dry_run)
     console.print(res)
 
@@ -152,6 +268,84 @@ def recommend_top(
         console.print("")
 
 
+@app.command()
+def reclassify(
+    dry_run: bool = typer.Option(False, help="Show what would change without writing"),
+    workers: int = typer.Option(0, help="Worker processes (0 = CPU count)"),
+):
+    """Recompute pillars and heuristic scores for all items; rebuild views and index."""
+    from .reclassify import reclassify_vault
+
+    def show(r):
+        o, n = r["old"], r["new"]
+        parts = []
+        if o["pillars"] != n["pillars"]:
+            parts.append(f"pillars {o['pillars']} -> {n['pillars']}")
+        if o["credibility"] != n["credibility"]:
+            parts.append(f"credibility {o['credibility']} -> {n['credibility']}")
+        if o["triage"] != n["triage"]:
+            parts.append(f"triage {o['triage']} -> {n['triage']}")
+        console.print(f"{r['id']}: " + "; ".join(parts))
+
+    stats = reclassify_vault(
+        Path("vault/ai-intel"),
+        index=Index(index_path=Path("vault/index.csv")),
+        views=Views(root=Path("vault")),
+        dry_run=dry_run,
+        workers=workers or None,
+        on_change=show if dry_run else None,
+    )
+    verb = "would change" if dry_run else "changed"
+    console.print(f"{stats['items']} items, {stats['changed']} {verb}, {stats['items_per_sec']} items/sec")
+
+
+@app.command()
+def trending(
+    days: int = typer.Option(7, help="Window in days"),
+    k: int = typer.Option(20, help="Top K keyphrases"),
+):
+    """Show trending keyphrases from the keyphrase vocabulary."""
+    from .storage.keyphrases import KeyphraseIndex
+
+    kp = KeyphraseIndex(Path("vault/keyphrases.db"), vault=Vault(root=Path("vault/ai-intel")))
+    for i, t in enumerate(kp.trending(days=days, limit=k), 1):
+        console.print(f"{i}. {t['phrase']} — {t['count']} items (prev {t['previous']}){' [new]' if t['new'] else ''}")
+
+
+@app.command()
+def pack(
+    month: str = typer.Option(None, help="Month to pack (YYYY-MM); default: all cold months"),
+    keep_months: int = typer.Option(1, help="Leave this many recent months as loose folders"),
+):
+    """Pack cold months' item folders into one SQLite file per month."""
+    vault = Vault(root=Path("vault/ai-intel"))
+    months = [month] if month else vault.cold_months(keep_months)
+    started = time.perf_counter()
+    total = 0
+    for m in months:
+        n = vault.pack_month(m)
+        total += n
+        console.print(f"{m}: packed {n} items")
+    console.print(f"Packed {total} items in {time.perf_counter() - started:.1f}s")
+
+
+@app.command()
+def unpack(
+    month: str = typer.Option(None, help="Month to restore as item folders (YYYY-MM)"),
+    item_id: str = typer.Option(None, help="Single item to restore"),
+):
+    """Restore packed items to loose folders."""
+    vault = Vault(root=Path("vault/ai-intel"))
+    if item_id:
+        path = vault.unpack_item(item_id)
+        console.print(f"Restored {path}" if path else f"[red]Item not found: {item_id}")
+    elif month:
+        console.print(f"{month}: restored {vault.unpack_month(month)} items")
+    else:
+        console.print("[red]Pass --month or --item-id")
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def report():
     """Generate a daily status report with counts and top items."""
@@ -233,36 +427,22 @@ def extract_patterns():
 
     from .model.patterns import extract_patterns_from_item, save_pattern
 
-    items_dir = vault_root / "items"
+    vault = Vault(root=vault_root)
     count = 0
 
-    for month_dir in sorted(items_dir.iterdir(), reverse=True):
-        if not month_dir.is_dir():
-            continue
-        for item_dir in month_dir.iterdir():
-            if not item_dir.is_dir():
-                continue
-
-            item_id = item_dir.name
-            item_file = item_dir / "item.json"
-            highlights_file = item_dir / "highlights.json"
-            summary_file = item_dir / "summary.md"
-
-            if not all([item_file.exists(), highlights_file.exists(), summary_file.exists()]):
-                continue
-
+    for month in reversed(vault.months()):
+        for item_id in vault.item_ids(month):
             # Skip if pattern already extracted
             if (patterns_dir / f"{item_id}.json").exists():
                 continue
 
-            try:
-                import json
-                with open(item_file, encoding="utf-8") as f:
-                    item_data = json.load(f)
-                with open(highlights_file, encoding="utf-8") as f:
-                    highlights = json.load(f)
-                summary = summary_file.read_text(encoding="utf-8")
+            item_data = vault.read_json(item_id)
+            highlights = vault.read_json(item_id, "highlights.json")
+            summary = vault.read_text(item_id, "summary.md")
+            if item_data is None or highlights is None or summary is None:
+                continue
 
+            try:
                 pattern = extract_patterns_from_item(item_data, highlights, summary)
                 save_pattern(item_id, pattern, patterns_dir)
                 count += 1
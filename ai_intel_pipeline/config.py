@@ -23,11 +23,49 @@ DEFAULT_SETTINGS = {
     },
     "ingest": {
         "daily_limit": 12,
+        # a journaled item is resumed at most this many times before it is left alone
+        "max_attempts": 3,
+        # rank candidates by a cheap local score before the limit cut (else newest first)
+        "triage": {"enabled": True, "half_life_days": 7},
         "transcripts": {
             "max_whisper_video_minutes": 30,
             "daily_whisper_budget_minutes": 240,
+            # caption downloads run ahead of the item loop on this many threads (0: inline)
+            "prefetch_workers": 4,
+            # Whisper fallback: audio is cut into windows of this length, transcribed in parallel
+            "chunk_seconds": 600,
+            "chunk_workers": 3,
         },
     },
+    "dedup": {
+        # MinHash near-duplicate check on title + description before enrichment
+        "near_duplicate": {"enabled": True, "threshold": 0.8, "min_tokens": 12},
+    },
+    # Embedding novelty vs vault/model (needs OPENAI_API_KEY); off falls back to the gate1 heuristic
+    "novelty": {"semantic": True},
+    # pillar views larger than this are stored column-wise without indentation
+    "views": {"compact_after": 2000},
+    # input token budgets (system + user prompt) per gate; evidence and lists are trimmed to fit
+    "llm": {"budgets": {"gate1": 1500, "gate2": 1200}},
+    # queue-driven ingest (ingest-coordinator / ingest-worker); the queue is sqlite:///path or a .db path
+    "distributed": {
+        "queue": "vault/queue.db",
+        "lease_seconds": 900,
+        "max_attempts": 3,
+        "idle_timeout_seconds": 60,
+        "timeout_minutes": 120,
+    },
+    "state": {
+        # drop seen URLs/uids not re-seen for this many days (null keeps them forever)
+        "ttl_days": None,
+        "bloom": False,
+    },
+    "storage": {
+        # "always": fsync every write; "batch": atomic writes, fsyncs grouped per run
+        "fsync": "always",
+        # pack loose item folders older than this many months into packs/YYYY-MM.db after each run (null: never)
+        "pack_after_months": None,
+    },
 }
 
 
@@ -115,6 +153,17 @@ def load_profile() -> Dict[str, Any]:
         return json.load(f)
 
 
+def load_policy() -> Dict[str, Any]:
+    """Learned weights from feedback (``config/policy/weights.json``), empty if absent."""
+    path = Path("config/policy/weights.json")
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
 def load_pillars() -> Dict[str, Any]:
     path = Path("config/pillars.yaml")
     if not path.exists():
@@ -144,7 +193,7 @@ def load_pillars() -> Dict[str, Any]:
                     },
                     {
                         "name": "Agents",
-                        "keywords": ["agent", "multi-agent", "autonomous", "crew", "swarm"],
+                        "keywords": ["agent", "subagent", "multi-agent", "autonomous", "crew", "swarm"],
                     },
                     {
                         "name": "DevOps/Infra for AI",
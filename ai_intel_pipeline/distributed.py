@@ -0,0 +1,287 @@
+"""
+Queue-driven ingest across several worker processes or nodes.
+
+The ingest stages become queue topics:
+
+    fetch + triage (coordinator) -> "enrich" (highlights, metadata, transcript)
+    -> "gates" (novelty, gate1, gate2, pillars) -> "index" (coordinator)
+
+Workers only write inside their own item folder (and add to the shared
+speech-to-text budget). The coordinator is the single writer of the index,
+seen-state, views, fingerprints, near-dup and keyphrase stores. A worker that
+dies only loses its lease: the task is handed out again after
+``distributed.lease_seconds``.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import socket
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .config import load_pillars, load_profile
+from .gates.gate1_validity import gate1_validate
+from .gates.gate2_personalize import gate2_personalize
+from .normalize.highlights import build_highlights
+from .pipeline import (
+    _classify,
+    _collect_candidates,
+    _daily_limit,
+    _enrich_sources,
+    _index_item,
+    _open_neardup,
+    _open_novelty_index,
+    _open_state,
+    _open_views,
+    _pack_cold_months,
+    _semantic_novelty,
+)
+from .prompt_budget import gate_budget
+from .storage.fingerprints import FingerprintIndex
+from .storage.index import Index
+from .storage.journal import IngestJournal
+from .storage.keyphrases import KeyphraseIndex
+from .storage.queue import Task, WorkQueue, open_queue
+from .storage.vault import Vault
+
+
+ENRICH = "enrich"
+GATES = "gates"
+INDEX = "index"
+
+
+def _conf(settings: Dict) -> Dict:
+    return settings.get("distributed", {}) or {}
+
+
+def queue_url(settings: Dict, url: str | None = None) -> str:
+    return url or _conf(settings).get("queue") or "vault/queue.db"
+
+
+def _worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_candidates(
+    sources: Dict,
+    settings: Dict,
+    vault: Vault,
+    index: Index,
+    queue: WorkQueue,
+    limit: int = 10,
+) -> int:
+    """Fetch and triage candidates, allocate their item folders and queue them for enrichment."""
+    journal = IngestJournal(Path("vault/journal.jsonl"))
+    candidates = _collect_candidates(
+        sources, settings, vault, index, _open_state(settings),
+        FingerprintIndex(Path("vault/fingerprints.db"), index_csv=index.path), _open_neardup(settings),
+        load_profile(), load_pillars(), _daily_limit(settings, limit),
+        # waiting or leased in the queue, or left to the single-process journal;
+        # failed tasks are not in flight, so their candidates are queued again
+        in_flight=lambda uid: queue.has(uid) or journal.stage(uid) >= 0,
+    )
+    queued = 0
+    for c in candidates:
+        # a task parked as failed by an earlier run is retried in the folder it already has
+        prev = queue.payload(c["_uid"]) or {}
+        if prev.get("item_id") and Path(prev.get("item_dir") or "").is_dir():
+            item_id, item_dir, fresh = prev["item_id"], Path(prev["item_dir"]), False
+        else:
+            (item_id, item_dir), fresh = vault.create_item_folder(), True
+        if queue.put(ENRICH, c["_uid"], {"candidate": c, "item_id": item_id, "item_dir": str(item_dir)}):
+            queued += 1
+        elif fresh:
+            # not queued: drop the empty folder so it never shows up as an item
+            shutil.rmtree(item_dir, ignore_errors=True)
+    return queued
+
+
+def _enrich(task: Task, settings: Dict, vault: Vault, state, dry_run: bool) -> Dict:
+    p = task["payload"]
+    c, item_dir = p["candidate"], Path(p["item_dir"])
+    highlights = build_highlights(candidate=c, dry_run=dry_run)
+    vault.write_json(item_dir / "highlights.json", highlights)
+    fields = _enrich_sources(c, c.get("links", {}), item_dir, settings=settings, vault=vault, state=state, dry_run=dry_run)
+    return {**p, "fields": fields}
+
+
+def _gates(task: Task, settings: Dict, vault: Vault, profile: Dict, pillars_cfg: Dict, novelty_index, dry_run: bool) -> Dict:
+    p = task["payload"]
+    c, item_id, item_dir = p["candidate"], p["item_id"], Path(p["item_dir"])
+    highlights = vault.read_json(item_id, "highlights.json") or {}
+    record = vault.new_item(
+        item_id=item_id,
+        title=c.get("title"),
+        canonical_url=c.get("url"),
+        source_type=c.get("source_type"),
+        source_name=c.get("source_name"),
+        published_at=c.get("published_at"),
+        content_type=c.get("type"),
+        links=c.get("links", {}),
+        item_dir=item_dir,
+    )
+    record.update_fields(p.get("fields") or {})
+    if c.get("_triage") is not None:
+        record.update_fields({"triage_score": c["_triage"]})
+
+    novelty, vec, similar = _semantic_novelty(c, highlights, novelty_index)
+    if similar is not None:
+        record.update_fields({"similar_items": similar})
+    evidence, scores = gate1_validate(
+        candidate=c, highlights=highlights, item_dir=item_dir, dry_run=dry_run, novelty=novelty,
+        budget=gate_budget(settings, "gate1"),
+    )
+    if evidence:
+        vault.write_json(item_dir / "evidence.json", evidence)
+    if vec is not None:
+        novelty_index.add(vec, {"item_id": item_id, "title": c.get("title"), "url": c.get("url")})
+    record.update_scores(scores)
+
+    summary_md, scores2 = gate2_personalize(
+        highlights=highlights, profile=profile, candidate=c, item_dir=item_dir, dry_run=dry_run, novelty=novelty,
+        budget=gate_budget(settings, "gate2"),
+    )
+    vault.write_text(item_dir / "summary.md", summary_md)
+    record.update_scores(scores2)
+    record.update_fields({"pillars": _classify(c, highlights, pillars_cfg)})
+    record.flush()
+    return {"candidate": c, "item_id": item_id, "item_dir": str(item_dir), "scores": scores, "scores2": scores2}
+
+
+def run_worker(
+    queue: WorkQueue,
+    settings: Dict,
+    vault: Vault,
+    dry_run: bool = False,
+    idle_timeout: float | None = None,
+    topics: List[str] | None = None,
+) -> int:
+    """Process enrich/gates tasks until none has been available for ``idle_timeout`` seconds.
+
+    Returns the number of tasks completed.
+    """
+    conf = _conf(settings)
+    topics = topics or [ENRICH, GATES]
+    lease = float(conf.get("lease_seconds", 900))
+    max_attempts = int(conf.get("max_attempts", 3))
+    idle_timeout = float(conf.get("idle_timeout_seconds", 60) if idle_timeout is None else idle_timeout)
+    poll = float(conf.get("poll_seconds", 1.0))
+    name = _worker_name()
+    state = _open_state(settings)
+    profile, pillars_cfg = load_profile(), load_pillars()
+    novelty_index, novelty_opened = None, False
+
+    done = 0
+    idle_since = time.monotonic()
+    while True:
+        task = queue.claim(topics, name, lease)
+        if task is None:
+            if time.monotonic() - idle_since >= idle_timeout:
+                return done
+            time.sleep(poll)
+            continue
+        try:
+            # renew the lease while a long stage (e.g. speech-to-text) runs, so it is not handed out twice
+            with queue.heartbeat(task, lease):
+                if task["topic"] == ENRICH:
+                    next_topic, result = GATES, _enrich(task, settings, vault, state, dry_run)
+                else:
+                    if not novelty_opened:
+                        novelty_index, novelty_opened = _open_novelty_index(settings, dry_run), True
+                    next_topic, result = INDEX, _gates(task, settings, vault, profile, pillars_cfg, novelty_index, dry_run)
+            # False: the lease was lost and the task belongs to another worker now
+            if queue.ack(task, next_topic, result):
+                done += 1
+        except Exception as e:
+            queue.fail(task, f"{type(e).__name__}: {e}", max_attempts=max_attempts)
+        idle_since = time.monotonic()
+
+
+def _worker_main(url: str, settings: Dict, vault_root: str, dry_run: bool, idle_timeout: float):
+    run_worker(open_queue(url), settings, Vault(root=Path(vault_root)), dry_run=dry_run, idle_timeout=idle_timeout)
+
+
+def run_coordinator(
+    sources: Dict,
+    settings: Dict,
+    vault: Vault,
+    index: Index,
+    limit: int = 10,
+    dry_run: bool = False,
+    workers: int = 0,
+    url: str | None = None,
+    enqueue: bool = True,
+) -> List[str]:
+    """Queue this run's candidates, start ``workers`` local worker processes, and
+    index finished items until the queue is drained.
+
+    With ``workers=0`` the work is left to ``ingest-worker`` processes on other
+    nodes sharing the vault and queue. Returns the ids indexed by this call.
+    """
+    conf = _conf(settings)
+    url = queue_url(settings, url)
+    queue = open_queue(url)
+    if enqueue:
+        enqueue_candidates(sources, settings, vault, index, queue, limit=limit)
+
+    # local workers stop shortly after the queue runs dry
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_worker_main, args=(url, settings, str(vault.root), dry_run, 2.0), daemon=True)
+        for _ in range(max(0, workers))
+    ]
+    for proc in procs:
+        proc.start()
+
+    state = _open_state(settings)
+    journal = IngestJournal(Path("vault/journal.jsonl"))
+    views = _open_views(settings, journal)
+    fingerprints = FingerprintIndex(Path("vault/fingerprints.db"), index_csv=index.path)
+    keyphrases = KeyphraseIndex(Path("vault/keyphrases.db"), vault=vault)
+    neardup = _open_neardup(settings)
+    name = _worker_name()
+    lease = float(conf.get("lease_seconds", 900))
+    deadline = time.monotonic() + float(conf.get("timeout_minutes", 120)) * 60
+    poll = float(conf.get("poll_seconds", 1.0))
+
+    created: List[str] = []
+    while True:
+        # Single writer: index every finished item, flush views, then ack the batch
+        batch = []
+        while True:
+            task = queue.claim([INDEX], name, lease)
+            if task is None:
+                break
+            p = task["payload"]
+            data = vault.read_json(p["item_id"]) or {}
+            highlights = vault.read_json(p["item_id"], "highlights.json") or {}
+            keyphrases.add(p["item_id"], highlights.get("keyphrases", []))
+            _index_item(
+                p["candidate"], p["item_id"], Path(p["item_dir"]), data, p.get("scores") or {}, p.get("scores2") or {},
+                index, views, fingerprints, neardup, state,
+            )
+            batch.append(task)
+        if batch:
+            views.flush()
+            for task in batch:
+                queue.ack(task)
+            created += [t["payload"]["item_id"] for t in batch]
+            continue
+        if queue.active([ENRICH, GATES, INDEX]) == 0:
+            break
+        if procs and not any(proc.is_alive() for proc in procs) and queue.active([INDEX]) == 0:
+            # local workers gave up (e.g. tasks held by a dead node's lease); leave the rest queued
+            break
+        if time.monotonic() > deadline:
+            break
+        time.sleep(poll)
+
+    for proc in procs:
+        proc.join(timeout=10)
+    state.save()
+    if not dry_run:
+        _pack_cold_months(settings, vault)
+    return created
@@ -5,6 +5,8 @@ import csv
 import json
 from typing import Dict, List
 
+from .storage.vault import Vault
+
 
 def export_jsonl(vault_root: Path, index_csv: Path, out_path: Path | None = None, days: int | None = None) -> Path:
     """Create a compact JSONL for RAG (highlights + summary only).
@@ -17,30 +19,26 @@ def export_jsonl(vault_root: Path, index_csv: Path, out_path: Path | None = None
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_path or (out_dir / "chunks.jsonl")
     count = 0
+    vault = Vault(vault_root)
     with index_csv.open("r", encoding="utf-8") as f, out_path.open("w", encoding="utf-8") as out:
         reader = csv.DictReader(f)
         for row in reader:
             item_dir = Path(row.get("drive_path", ""))
-            if not item_dir.exists():
+            item_id = row.get("item_id", "")
+            # loose folder or packed month
+            if not item_dir.exists() and vault.locate(item_id) is None:
                 continue
             title = row.get("title", "")
             url = row.get("url", "")
             source = row.get("source", "")
             date = row.get("date", "")
-            item_id = row.get("item_id", "")
 
             # load item.json for pillars (if available)
-            try:
-                item_meta = json.loads((item_dir / "item.json").read_text(encoding="utf-8"))
-                pillars = item_meta.get("pillars", [])
-            except Exception:
-                pillars = []
+            item_meta = vault.read_json(item_id) or {}
+            pillars = item_meta.get("pillars", [])
 
             # highlights
-            try:
-                h = json.loads((item_dir / "highlights.json").read_text(encoding="utf-8"))
-            except Exception:
-                h = {}
+            h = vault.read_json(item_id, "highlights.json") or {}
             bullets = h.get("summary_bullets", [])
             claims = h.get("key_claims", [])
 
@@ -79,10 +77,7 @@ def export_jsonl(vault_root: Path, index_csv: Path, out_path: Path | None = None
                 count += 1
 
             # summary
-            try:
-                summary = (item_dir / "summary.md").read_text(encoding="utf-8")
-            except Exception:
-                summary = ""
+            summary = vault.read_text(item_id, "summary.md") or ""
             if summary:
                 rec = {
                     "id": f"{item_id}#summary",
@@ -4,6 +4,9 @@ import json
 from pathlib import Path
 from typing import Dict
 
+from .storage.atomic import atomic_write_json
+from .storage.vault import Vault
+
 
 def _safe_load(path: Path) -> Dict:
     if path.exists():
@@ -15,18 +18,12 @@ def _safe_load(path: Path) -> Dict:
 
 
 def _save(path: Path, data: Dict):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    atomic_write_json(path, data)
 
 
 def _load_item_pillars(vault_root: Path, item_id: str):
-    month = f"{item_id[:4]}-{item_id[4:6]}"
-    p = vault_root / "items" / month / item_id / "item.json"
-    try:
-        js = json.loads(p.read_text(encoding="utf-8"))
-        return [x.lower() for x in (js.get("pillars") or [])]
-    except Exception:
-        return []
+    js = Vault(vault_root).read_json(item_id) or {}
+    return [x.lower() for x in (js.get("pillars") or [])]
 
 
 def apply_feedback(item_id: str, decision: str, vault_root: Path, policy_path: Path):
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 from datetime import datetime
+import threading
 import feedparser
 from yt_dlp import YoutubeDL
+from ..utils.canonical import youtube_video_id
 from ..utils.links import extract_links
 
 
@@ -63,13 +65,55 @@ def fetch_youtube_search_rss(query: str) -> List[Dict]:
     return items
 
 
-def enrich_youtube_metadata(url: str) -> Dict:
+def extract_youtube_info(url: str) -> Optional[Dict]:
+    """yt-dlp ``extract_info`` without download (formats, captions, chapters, ...)."""
+    try:
+        with YoutubeDL({"quiet": True, "skip_download": True}) as ydl:
+            return ydl.extract_info(url, download=False)
+    except Exception:
+        return None
+
+
+class YouTubeInfoCache:
+    """``extract_info`` results for one run, keyed by video id.
+
+    Metadata enrichment, caption download and the Whisper fallback's audio
+    format selection all read the same extraction instead of running yt-dlp
+    again. Safe to share with the caption prefetch threads: concurrent callers
+    for one video wait for a single extraction.
+    """
+
+    def __init__(self):
+        self._infos: Dict[str, Optional[Dict]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str | None) -> Optional[Dict]:
+        vid = youtube_video_id(url or "")
+        if not vid:
+            return extract_youtube_info(url) if url else None
+        with self._lock:
+            lock = self._locks.setdefault(vid, threading.Lock())
+        with lock:
+            if vid not in self._infos:
+                # failures are cached too, so a broken video is not retried per stage
+                self._infos[vid] = extract_youtube_info(url)
+            return self._infos[vid]
+
+    def discard(self, url: str | None):
+        """Drop a finished video's extraction (they include every format manifest)."""
+        vid = youtube_video_id(url or "")
+        with self._lock:
+            self._infos.pop(vid, None)
+            self._locks.pop(vid, None)
+
+
+def enrich_youtube_metadata(url: str, info_cache: YouTubeInfoCache | None = None) -> Dict:
     """Use yt-dlp to grab full description and basic metadata without download."""
-    ydl_opts = {"quiet": True, "skip_download": True}
     info: Dict = {}
     try:
-        with YoutubeDL(ydl_opts) as ydl:
-            res = ydl.extract_info(url, download=False)
+        res = info_cache.get(url) if info_cache is not None else extract_youtube_info(url)
+        if res:
             desc = res.get("description") or ""
             chapters = res.get("chapters") or []
             info = {
@@ -0,0 +1,122 @@
+"""
+Evidence retrieval for gate1: pick the transcript windows (and source
+paragraphs) that best match each highlight claim with a local BM25 index,
+instead of sending the first few segments (usually intro chatter).
+
+Transcript segments are merged into windows aligned to the video's chapters
+(``chapters`` from ``enrich_youtube_metadata``, stored in transcript.json);
+long chapters, or videos without chapters, are cut into fixed-length windows.
+"""
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = set(
+    "a an and are as at be but by can do for from has have how i if in into is it its just like of on or our so "
+    "that the their then there these they this to up was we what when which will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+class BM25:
+    """Okapi BM25 over a small in-memory corpus (one item's windows)."""
+
+    def __init__(self, docs: Sequence[str], k1: float = 1.4, b: float = 0.75):
+        self.k1, self.b = k1, b
+        self.tfs = [Counter(tokenize(d)) for d in docs]
+        self.lens = [sum(tf.values()) for tf in self.tfs]
+        self.avg_len = (sum(self.lens) / len(self.lens)) if self.lens else 0.0
+        df: Counter = Counter()
+        for tf in self.tfs:
+            df.update(tf.keys())
+        n = len(self.tfs)
+        self.idf = {t: math.log(1 + (n - d + 0.5) / (d + 0.5)) for t, d in df.items()}
+
+    def scores(self, query: str) -> List[float]:
+        terms = [t for t in set(tokenize(query)) if t in self.idf]
+        out = []
+        for tf, length in zip(self.tfs, self.lens):
+            norm = self.k1 * (1 - self.b + self.b * length / self.avg_len) if self.avg_len else self.k1
+            out.append(sum(self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm) for t in terms if tf[t]))
+        return out
+
+
+def transcript_windows(segments: List[Dict], chapters: List[Dict] | None = None, max_seconds: float = 90.0) -> List[Dict]:
+    """Merge segments into ``{t, t_end, chapter, text}`` windows of at most ``max_seconds``,
+    never crossing a chapter boundary."""
+    bounds = sorted(
+        (float(c.get("start_time") or 0.0), c.get("title") or "") for c in (chapters or []) if c.get("start_time") is not None
+    )
+    windows: List[Dict] = []
+    cur: Dict | None = None
+    ci = -1
+    for seg in segments:
+        text = (seg.get("text") or "").strip()
+        if not text:
+            continue
+        start = float(seg.get("t_start") or 0.0)
+        end = float(seg.get("t_end") or start)
+        new_ci = ci
+        while new_ci + 1 < len(bounds) and start >= bounds[new_ci + 1][0]:
+            new_ci += 1
+        if cur is None or new_ci != ci or end - cur["t"] > max_seconds:
+            cur = {"t": start, "t_end": end, "chapter": bounds[new_ci][1] if new_ci >= 0 else "", "text": text}
+            windows.append(cur)
+            ci = new_ci
+        else:
+            cur["t_end"] = end
+            cur["text"] += " " + text
+    return windows
+
+
+def _excerpt(text: str, query: str, width: int) -> str:
+    """``width`` characters of ``text`` around the first query term it contains."""
+    if len(text) <= width:
+        return text
+    low = text.lower()
+    hits = [low.find(t) for t in tokenize(query)]
+    hits = [h for h in hits if h >= 0]
+    start = max(0, min(hits) - width // 4) if hits else 0
+    return text[start:start + width]
+
+
+def claim_queries(candidate: Dict, highlights: Dict) -> List[str]:
+    """One query per highlight claim, each widened with the item's keyphrases."""
+    extra = " ".join(highlights.get("keyphrases") or [])
+    claims = [k.get("claim", "") if isinstance(k, dict) else str(k) for k in highlights.get("key_claims") or []]
+    queries = [f"{c} {extra}".strip() for c in claims if c]
+    return queries or [f"{candidate.get('title') or ''} {extra}".strip()]
+
+
+def select_evidence(docs: List[Dict], queries: List[str], per_query: int = 1, limit: int = 3, width: int = 400) -> List[Dict]:
+    """Best ``docs`` (dicts with ``text``) for each query, at most ``limit`` overall.
+
+    Each pick keeps its other fields plus ``quote`` (an excerpt) and ``claim``
+    (index of the query it matched). Falls back to the first doc when nothing
+    matches.
+    """
+    if not docs:
+        return []
+    index = BM25([d["text"] for d in docs])
+    picked: Dict[int, Dict] = {}
+    for qi, q in enumerate(queries):
+        ranked = sorted(((s, i) for i, s in enumerate(index.scores(q)) if s > 0), reverse=True)
+        for s, i in ranked[:per_query]:
+            if i not in picked or picked[i]["score"] < s:
+                picked[i] = {"score": s, "claim": qi, "query": q}
+    if not picked:
+        picked[0] = {"score": 0.0, "claim": None, "query": ""}
+    best = sorted(picked.items(), key=lambda x: -x[1]["score"])[:limit]
+    out = []
+    for i, p in sorted(best):
+        d = {k: v for k, v in docs[i].items() if k != "text"}
+        d.update({"quote": _excerpt(docs[i]["text"], p["query"], width), "claim": p["claim"]})
+        out.append(d)
+    return out
@@ -3,33 +3,39 @@ from __future__ import annotations
 from typing import Dict, Tuple
 from pathlib import Path
 import json
+import re
 
 from ..llm import have_llm, llm_complete_json
+from ..prompt_budget import estimate_tokens, fit_evidence
+from .evidence import claim_queries, select_evidence, transcript_windows
 
 
 def _gather_evidence_snippets(item_dir: Path, candidate: Dict, highlights: Dict) -> Dict:
     snippets = {"transcript": [], "source": [], "repo": []}
-    # Transcript: pick up to 3 short segments
+    queries = claim_queries(candidate, highlights)
+    # Transcript: chapter-aligned windows that best match the claims (BM25)
     t_path = item_dir / "transcript.json"
     if t_path.exists():
         try:
             t = json.loads(t_path.read_text(encoding="utf-8"))
-            segs = t.get("segments", [])
-            for s in segs[:3]:
-                txt = s.get("text", "")
-                if txt:
-                    snippets["transcript"].append({
-                        "t": float(s.get("t_start", 0.0)),
-                        "quote": txt[:260],
-                    })
+            windows = transcript_windows(t.get("segments", []), t.get("chapters"))
+            for w in select_evidence(windows, queries, limit=3, width=400):
+                snippets["transcript"].append({
+                    "t": round(float(w["t"]), 1),
+                    "chapter": w.get("chapter") or None,
+                    "quote": w["quote"],
+                    "claim": w["claim"],
+                })
         except Exception:
             pass
-    # Source (video description or blog body): first paragraph
+    # Source (video description or blog body): best matching paragraphs
     s_path = item_dir / "source.md"
     if s_path.exists():
         try:
             body = s_path.read_text(encoding="utf-8")
-            snippets["source"].append({"quote": body.strip().splitlines()[0][:400]})
+            paras = [{"text": p.strip()} for p in re.split(r"\n\s*\n", body) if p.strip()]
+            for p in select_evidence(paras, queries, limit=2, width=400):
+                snippets["source"].append({"quote": p["quote"], "claim": p["claim"]})
         except Exception:
             pass
     # Repo snippets if present
@@ -44,15 +50,35 @@ def _gather_evidence_snippets(item_dir: Path, candidate: Dict, highlights: Dict)
     return snippets
 
 
-def gate1_validate(candidate: Dict, highlights: Dict, item_dir: Path, dry_run: bool = False) -> Tuple[Dict, Dict]:
+OFFICIAL_SOURCES = ["anthropic", "openai", "vercel", "cloudflare"]
+
+
+def source_credibility(candidate: Dict) -> float:
+    source = (candidate.get("source_name") or "").lower()
+    return 0.8 if any(s in source for s in OFFICIAL_SOURCES) else 0.5
+
+
+def baseline_novelty(candidate: Dict) -> float:
+    return 0.7 if candidate.get("type") == "release" else 0.5
+
+
+def gate1_validate(
+    candidate: Dict,
+    highlights: Dict,
+    item_dir: Path,
+    dry_run: bool = False,
+    novelty: float | None = None,
+    budget: int | None = None,
+) -> Tuple[Dict, Dict]:
     """
     Returns (evidence, scores). Evidence may be empty when dry_run or no LLM keys.
     scores includes validity_conf, credibility, novelty, and route (optional).
+    ``novelty`` (semantic novelty against the vault) replaces the type heuristic when given.
+    ``budget`` caps the prompt's input tokens; evidence least relevant to the claims is cut first.
     """
-    source = (candidate.get("source_name") or "").lower()
-    official_sources = ["anthropic", "openai", "vercel", "cloudflare"]
-    credibility = 0.8 if any(s in source for s in official_sources) else 0.5
-    novelty = 0.7 if candidate.get("type") == "release" else 0.5
+    credibility = source_credibility(candidate)
+    if novelty is None:
+        novelty = baseline_novelty(candidate)
 
     # Manual items: assume valid with high confidence
     if candidate.get("manual"):
@@ -103,7 +129,10 @@ def gate1_validate(candidate: Dict, highlights: Dict, item_dir: Path, dry_run: b
         "highlights": highlights,
         "evidence": snippets,
     }
-    resp = llm_complete_json(system=sys, user=user, max_tokens=400)
+    if budget:
+        fixed = estimate_tokens(sys) + estimate_tokens({**user, "evidence": {}})
+        user["evidence"] = fit_evidence(snippets, claim_queries(candidate, highlights), budget - fixed)
+    resp = llm_complete_json(system=sys, user=user, max_tokens=400, label="gate1", budget=budget)
     if isinstance(resp, dict):
         evidence = resp
         conf = float(resp.get("confidence", scores.get("validity_conf", 0.6)) or 0.6)
@@ -3,11 +3,43 @@ from __future__ import annotations
 from typing import Dict, Tuple
 from pathlib import Path
 from ..llm import have_llm, llm_complete_json
+from ..prompt_budget import estimate_tokens, shrink_until
 
 
-def gate2_personalize(highlights: Dict, profile: Dict, candidate: Dict, item_dir: Path, dry_run: bool = False) -> Tuple[str, Dict]:
+# Profile/highlight fields the personalization prompt actually uses
+PROFILE_FIELDS = ("goals", "stack", "priorities")
+HIGHLIGHT_FIELDS = ("summary_bullets", "keyphrases", "key_claims")
+
+
+def _cap(path: Tuple[str, ...], n: int):
+    """Shrink step: keep the first ``n`` entries of the list (or of each list in the dict) at ``path``."""
+    def step(payload: Dict):
+        parent = payload
+        for key in path[:-1]:
+            parent = parent.get(key) or {}
+        value = parent.get(path[-1])
+        if isinstance(value, list):
+            parent[path[-1]] = value[:n]
+        elif isinstance(value, dict):
+            parent[path[-1]] = {k: v[:n] if isinstance(v, list) else v for k, v in value.items()}
+    return step
+
+
+def gate2_personalize(
+    highlights: Dict,
+    profile: Dict,
+    candidate: Dict,
+    item_dir: Path,
+    dry_run: bool = False,
+    novelty: float | None = None,
+    budget: int | None = None,
+) -> Tuple[str, Dict]:
     """
     Returns (summary_md, scores2). Uses LLM when available; falls back to heuristic summary.
+    ``novelty`` (from gate1) feeds the overall score when known.
+    ``budget`` caps the prompt's input tokens: only the profile and highlight fields
+    the prompt uses are sent, and lists are shortened until it fits.
+    The profile goes in the cached prompt prefix, so it is never trimmed per item.
     """
     bullets = highlights.get("summary_bullets", [])
     keyphrases = highlights.get("keyphrases", [])
@@ -16,7 +48,7 @@ def gate2_personalize(highlights: Dict, profile: Dict, candidate: Dict, item_dir
     priorities = [p.lower() for p in profile.get("priorities", [])]
     relevance = 0.6 if any(p in " ".join(keyphrases).lower() for p in priorities) else 0.45
     actionability = 0.6 if key_claims else 0.45
-    overall = 0.35 * relevance + 0.25 * 0.6 + 0.25 * actionability + 0.15 * 0.5
+    overall = 0.35 * relevance + 0.25 * (0.6 if novelty is None else novelty) + 0.25 * actionability + 0.15 * 0.5
 
     if dry_run or not have_llm():
         why = [
@@ -60,10 +92,22 @@ def gate2_personalize(highlights: Dict, profile: Dict, candidate: Dict, item_dir
             "type": candidate.get("type"),
             "links": candidate.get("links", {}),
         },
-        "profile": profile,
         "highlights": highlights,
     }
-    resp = llm_complete_json(system=sys, user=user, max_tokens=700)
+    if novelty is not None:
+        user["novelty_vs_vault"] = round(novelty, 3)
+    context = {"profile": profile}
+    if budget:
+        context = {"profile": {k: profile[k] for k in PROFILE_FIELDS if profile.get(k)}}
+        user["highlights"] = {k: highlights[k] for k in HIGHLIGHT_FIELDS if highlights.get(k)}
+        steps = [
+            _cap(("item", "links"), 5),
+            _cap(("highlights", "key_claims"), 3),
+            _cap(("highlights", "summary_bullets"), 3),
+            _cap(("highlights", "keyphrases"), 8),
+        ]
+        shrink_until(user, budget, steps, fixed_tokens=estimate_tokens(sys) + estimate_tokens(context))
+    resp = llm_complete_json(system=sys, user=user, max_tokens=700, label="gate2", budget=budget, context=context)
     if isinstance(resp, dict) and (resp.get("tldr") or resp.get("apply_steps")):
         # render markdown
         md_lines = []
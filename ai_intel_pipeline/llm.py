@@ -2,14 +2,52 @@ from __future__ import annotations
 
 import os
 import json
+import time
 from typing import Any, Dict, Optional
 
+from . import llm_metrics
+
 
 def have_llm() -> bool:
     return bool(os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY"))
 
 
-def _anthropic_complete_json(system: str, user: Any, max_tokens: int = 400, model: Optional[str] = None) -> Optional[Dict]:
+def _context_text(context: Any) -> str:
+    """Byte-stable serialization of the static context, so repeated prefixes match exactly."""
+    if isinstance(context, str):
+        return context
+    return "Context (JSON):\n" + json.dumps(context, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _parse_json(text: str, stats: Optional[Dict] = None) -> Optional[Dict]:
+    """Strict JSON, else the outermost ``{...}`` slice; ``stats["parse"]`` records which worked."""
+    parse = "json"
+    try:
+        out = json.loads(text)
+    except Exception:
+        out = None
+        parse = "failed"
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end != -1 and end > start:
+            try:
+                out = json.loads(text[start : end + 1])
+                parse = "sliced"
+            except Exception:
+                pass
+    if stats is not None:
+        stats["parse"] = parse
+    return out
+
+
+def _anthropic_complete_json(
+    system: str,
+    user: Any,
+    max_tokens: int = 400,
+    model: Optional[str] = None,
+    usage: Optional[Dict] = None,
+    context: Any = None,
+) -> Optional[Dict]:
     try:
         import anthropic
         from anthropic._exceptions import APIStatusError
@@ -22,37 +60,59 @@ def _anthropic_complete_json(system: str, user: Any, max_tokens: int = 400, mode
     preferred = model or os.getenv("ANTHROPIC_MODEL")
     candidates = [m for m in [preferred, "claude-3-5-sonnet-20241022", "claude-3-5-sonnet-latest", "claude-3-sonnet-20240229"] if m]
     prompt_user = json.dumps(user, ensure_ascii=False)
+    # Static prefix (system prompt, then context); the breakpoint on its last block caches both
+    blocks = [{"type": "text", "text": system + " Always return strict JSON only."}]
+    if context is not None:
+        blocks.append({"type": "text", "text": _context_text(context)})
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
     last_err = None
     for m in candidates:
+        if usage is not None:
+            usage["attempts"] = usage.get("attempts", 0) + 1
         try:
             msg = client.messages.create(
                 model=m,
                 max_tokens=max_tokens,
                 temperature=0.2,
-                system=system + " Always return strict JSON only.",
+                system=blocks,
                 messages=[{"role": "user", "content": prompt_user}],
             )
+            if usage is not None:
+                u = getattr(msg, "usage", None)
+                read = getattr(u, "cache_read_input_tokens", None) or 0
+                written = getattr(u, "cache_creation_input_tokens", None) or 0
+                uncached = getattr(u, "input_tokens", None)
+                usage.update(
+                    provider="anthropic", model=m,
+                    input_tokens=None if uncached is None else uncached + read + written,
+                    cached_input_tokens=read, cache_write_tokens=written,
+                    output_tokens=getattr(u, "output_tokens", None),
+                )
             text = "".join([block.text for block in msg.content if getattr(block, "type", "") == "text"]) if hasattr(msg, "content") else str(msg)
-            try:
-                return json.loads(text)
-            except Exception:
-                start = text.find("{")
-                end = text.rfind("}")
-                if start != -1 and end != -1 and end > start:
-                    try:
-                        return json.loads(text[start : end + 1])
-                    except Exception:
-                        pass
+            out = _parse_json(text, usage)
+            if out is not None:
+                return out
         except APIStatusError as e:
             last_err = e
+            if usage is not None:
+                usage["error"] = type(e).__name__
             continue
         except Exception as e:
             last_err = e
+            if usage is not None:
+                usage["error"] = type(e).__name__
             continue
     return None
 
 
-def _openai_complete_json(system: str, user: Any, max_tokens: int = 400, model: Optional[str] = None) -> Optional[Dict]:
+def _openai_complete_json(
+    system: str,
+    user: Any,
+    max_tokens: int = 400,
+    model: Optional[str] = None,
+    usage: Optional[Dict] = None,
+    context: Any = None,
+) -> Optional[Dict]:
     try:
         from openai import OpenAI
     except Exception:
@@ -63,33 +123,72 @@ def _openai_complete_json(system: str, user: Any, max_tokens: int = 400, model:
     client = OpenAI()
     model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     prompt_user = json.dumps(user, ensure_ascii=False)
-    resp = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system + " Return strict JSON only."},
-            {"role": "user", "content": prompt_user},
-        ],
-        temperature=0.2,
-        max_tokens=max_tokens,
-        response_format={"type": "json_object"},
-    )
-    text = resp.choices[0].message.content if resp and resp.choices else ""
+    # OpenAI caches the longest previously seen prompt prefix automatically: keep static parts first
+    messages = [{"role": "system", "content": system + " Return strict JSON only."}]
+    if context is not None:
+        messages.append({"role": "system", "content": _context_text(context)})
+    messages.append({"role": "user", "content": prompt_user})
+    if usage is not None:
+        usage["attempts"] = usage.get("attempts", 0) + 1
     try:
-        return json.loads(text)
-    except Exception:
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            try:
-                return json.loads(text[start : end + 1])
-            except Exception:
-                return None
-        return None
+        resp = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.2,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+    except Exception as e:
+        if usage is not None:
+            usage.update(provider="openai", model=model, error=type(e).__name__)
+        raise
+    if usage is not None:
+        u = getattr(resp, "usage", None)
+        details = getattr(u, "prompt_tokens_details", None)
+        usage.update(
+            provider="openai", model=model,
+            input_tokens=getattr(u, "prompt_tokens", None),
+            cached_input_tokens=getattr(details, "cached_tokens", None) or 0,
+            output_tokens=getattr(u, "completion_tokens", None),
+        )
+    text = resp.choices[0].message.content if resp and resp.choices else ""
+    return _parse_json(text, usage)
+
 
+def llm_complete_json(
+    system: str,
+    user: Any,
+    max_tokens: int = 400,
+    label: str = "llm",
+    budget: int | None = None,
+    context: Any = None,
+) -> Optional[Dict]:
+    """JSON completion (Anthropic preferred, OpenAI fallback).
 
-def llm_complete_json(system: str, user: Any, max_tokens: int = 400) -> Optional[Dict]:
-    # Prefer Anthropic if available
-    out = _anthropic_complete_json(system, user, max_tokens=max_tokens)
-    if out is not None:
-        return out
-    return _openai_complete_json(system, user, max_tokens=max_tokens)
+    ``context`` is static data shared by many calls (e.g. the profile). It is
+    sent right after ``system`` as a stable prefix that the providers' prompt
+    caches can reuse; only ``user`` should vary per call.
+
+    Every call is recorded by ``llm_metrics`` under ``label`` (the calling
+    stage): latency, provider-reported and cached input tokens, output tokens,
+    the local estimate and the caller's ``budget``, model, attempts and how
+    the JSON was parsed.
+    """
+    from .prompt_budget import estimate_tokens
+
+    est_input = estimate_tokens(system) + estimate_tokens(user)
+    if context is not None:
+        est_input += estimate_tokens(_context_text(context))
+    started = time.perf_counter()
+    usage: Dict = {}
+    out = None
+    try:
+        # Prefer Anthropic if available
+        out = _anthropic_complete_json(system, user, max_tokens=max_tokens, usage=usage, context=context)
+        if out is None:
+            out = _openai_complete_json(system, user, max_tokens=max_tokens, usage=usage, context=context)
+    finally:
+        if usage.get("attempts"):
+            usage["ok"] = out is not None
+            llm_metrics.record(label, usage, est_input, budget, time.perf_counter() - started)
+    return out
@@ -0,0 +1,152 @@
+"""
+Metrics for LLM provider calls.
+
+``llm_complete_json`` records one JSONL line per call in
+``vault/logs/llm_usage.jsonl``, tagged with the calling stage (gate1, gate2,
+patterns, assistant, query, ...). ``summarize`` aggregates the log per stage
+(latency percentiles and histogram, tokens, models, retries, parse
+fallbacks); ``write_prometheus`` exports the same counters in the Prometheus
+text format for a node-exporter textfile collector or any scraper.
+"""
+from __future__ import annotations
+
+import json
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from .storage.atomic import append_text, atomic_write_text
+
+
+METRICS_LOG = Path("vault/logs/llm_usage.jsonl")
+PROM_FILE = Path("vault/ai-intel/status/llm_metrics.prom")
+
+# Latency histogram bucket bounds in seconds (Prometheus ``le`` labels)
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+def record(stage: str, usage: Dict, est_input: int | None, budget: int | None, seconds: float, path: Path | None = None):
+    rec = {
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "label": stage,
+        **usage,
+        "est_input_tokens": est_input,
+        "budget": budget,
+        "seconds": round(seconds, 3),
+    }
+    try:
+        append_text(path or METRICS_LOG, json.dumps(rec, ensure_ascii=False) + "\n")
+    except Exception:
+        pass
+
+
+def read_records(path: Path | None = None, days: int | None = None) -> Iterator[Dict]:
+    """Logged calls, optionally only those from the last ``days`` days."""
+    path = path or METRICS_LOG
+    if not path.exists():
+        return
+    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat() if days else ""
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except Exception:
+                continue
+            if cutoff and (rec.get("ts") or "") < cutoff:
+                continue
+            yield rec
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def summarize(path: Path | None = None, days: int | None = None) -> Dict[str, Dict]:
+    """Per-stage aggregates of the metrics log."""
+    latencies: Dict[str, List[float]] = {}
+    stages: Dict[str, Dict] = {}
+    for rec in read_records(path, days):
+        stage = rec.get("label") or "llm"
+        s = stages.setdefault(stage, {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "parse_sliced": 0,
+            "parse_failed": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "output_tokens": 0,
+            "seconds_sum": 0.0,
+            "models": Counter(),
+            "errors": Counter(),
+        })
+        seconds = float(rec.get("seconds") or 0.0)
+        latencies.setdefault(stage, []).append(seconds)
+        s["calls"] += 1
+        s["failures"] += 0 if rec.get("ok", True) else 1
+        s["retries"] += max(0, int(rec.get("attempts") or 1) - 1)
+        s["parse_sliced"] += rec.get("parse") == "sliced"
+        s["parse_failed"] += rec.get("parse") == "failed"
+        for k in ("input_tokens", "cached_input_tokens", "output_tokens"):
+            s[k] += int(rec.get(k) or 0)
+        s["seconds_sum"] += seconds
+        if rec.get("model"):
+            s["models"][rec["model"]] += 1
+        if rec.get("error"):
+            s["errors"][rec["error"]] += 1
+    for stage, s in stages.items():
+        lat = latencies[stage]
+        s["seconds_sum"] = round(s["seconds_sum"], 3)
+        s["latency"] = {
+            "mean": round(s["seconds_sum"] / len(lat), 3),
+            "p50": _percentile(lat, 0.5),
+            "p95": _percentile(lat, 0.95),
+            "max": max(lat),
+        }
+        s["latency_buckets"] = {str(b): sum(1 for x in lat if x <= b) for b in LATENCY_BUCKETS}
+        s["models"] = dict(s["models"])
+        s["errors"] = dict(s["errors"])
+    return stages
+
+
+def prometheus_text(stages: Dict[str, Dict]) -> str:
+    lines = [
+        "# HELP ai_intel_llm_request_duration_seconds LLM call latency by stage.",
+        "# TYPE ai_intel_llm_request_duration_seconds histogram",
+    ]
+    for stage, s in sorted(stages.items()):
+        for b, n in s["latency_buckets"].items():
+            lines.append(f'ai_intel_llm_request_duration_seconds_bucket{{stage="{stage}",le="{b}"}} {n}')
+        lines.append(f'ai_intel_llm_request_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {s["calls"]}')
+        lines.append(f'ai_intel_llm_request_duration_seconds_sum{{stage="{stage}"}} {s["seconds_sum"]}')
+        lines.append(f'ai_intel_llm_request_duration_seconds_count{{stage="{stage}"}} {s["calls"]}')
+    counters = [
+        ("tokens_total", "Tokens by stage and kind (input includes cached).", None),
+        ("failures_total", "Calls that returned no parsed JSON.", "failures"),
+        ("retries_total", "Extra provider attempts (model or provider fallbacks).", "retries"),
+        ("parse_fallbacks_total", "Responses parsed by brace slicing or not parsed.", None),
+    ]
+    for name, help_text, key in counters:
+        lines.append(f"# HELP ai_intel_llm_{name} {help_text}")
+        lines.append(f"# TYPE ai_intel_llm_{name} counter")
+        for stage, s in sorted(stages.items()):
+            if name == "tokens_total":
+                for kind in ("input", "cached_input", "output"):
+                    lines.append(f'ai_intel_llm_tokens_total{{stage="{stage}",kind="{kind}"}} {s[kind + "_tokens"]}')
+            elif name == "parse_fallbacks_total":
+                for kind in ("sliced", "failed"):
+                    lines.append(f'ai_intel_llm_parse_fallbacks_total{{stage="{stage}",kind="{kind}"}} {s["parse_" + kind]}')
+            else:
+                lines.append(f'ai_intel_llm_{name}{{stage="{stage}"}} {s[key]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: Path | None = None, log_path: Path | None = None) -> Path:
+    """Export cumulative metrics (whole log) in the Prometheus text format."""
+    path = path or PROM_FILE
+    atomic_write_text(path, prometheus_text(summarize(log_path)))
+    return path
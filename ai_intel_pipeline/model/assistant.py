@@ -166,7 +166,7 @@ def generate_solution(query: str, user_profile: Dict, vault_path: Path) -> Dict:
         "meta_insights": knowledge["meta_insights"]
     }
 
-    resp = llm_complete_json(system=sys, user=user_data, max_tokens=1200)
+    resp = llm_complete_json(system=sys, user=user_data, max_tokens=1200, label="assistant")
 
     if isinstance(resp, dict):
         # Add source examples from items
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import re
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Sequence, Tuple
 import numpy as np
 
 
+# Batch embedder: texts -> one vector per text (default: the OpenAI embeddings API)
+EmbedFn = Callable[[List[str]], Sequence[Sequence[float]]]
+
+
 def _iter_export_chunks(export_path: Path):
     with export_path.open("r", encoding="utf-8") as f:
         for line in f:
@@ -17,19 +23,54 @@ def _iter_export_chunks(export_path: Path):
                 continue
 
 
-def build_embeddings(export_jsonl: Path, out_dir: Path, model: str = "text-embedding-3-small", batch: int = 64) -> Tuple[Path, Path]:
+def _openai_embed_fn(model: str) -> EmbedFn:
+    from openai import OpenAI
+
+    client = OpenAI()
+
+    def embed(texts: List[str]):
+        # openai>=2 returns data list with embedding
+        return [d.embedding for d in client.embeddings.create(model=model, input=texts).data]
+
+    return embed
+
+
+def hashing_embedder(dim: int = 256) -> EmbedFn:
+    """Deterministic offline embedder (signed feature hashing of word tokens).
+
+    No semantics beyond shared words, but stable across runs and machines, so
+    benchmarks and tests can exercise the vector paths without an API key.
+    """
+    def embed(texts: List[str]):
+        out = np.zeros((len(texts), dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for tok in re.findall(r"[a-z0-9]+", (text or "").lower()):
+                h = int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "little")
+                out[i, h % dim] += 1.0 if (h >> 63) else -1.0
+        return out
+
+    return embed
+
+
+def build_embeddings(
+    export_jsonl: Path,
+    out_dir: Path,
+    model: str = "text-embedding-3-small",
+    batch: int = 64,
+    embed_fn: EmbedFn | None = None,
+) -> Tuple[Path, Path]:
     """Embed chunks.jsonl and store vectors + meta for retrieval.
 
     Outputs:
     - out_dir/embeddings.npy (float32, shape [N, D])
     - out_dir/meta.jsonl (one line per vector with item metadata)
-    """
-    from openai import OpenAI
 
+    ``embed_fn`` replaces the OpenAI embeddings API (e.g. ``hashing_embedder()``).
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
     meta_path = out_dir / "meta.jsonl"
     emb_path = out_dir / "embeddings.npy"
-    client = OpenAI()
+    embed_fn = embed_fn or _openai_embed_fn(model)
 
     chunks = list(_iter_export_chunks(export_jsonl))
     texts = [c.get("text", "")[:3000] for c in chunks]
@@ -40,10 +81,7 @@ def build_embeddings(export_jsonl: Path, out_dir: Path, model: str = "text-embed
         batch_texts = texts[i : i + batch]
         if not batch_texts:
             continue
-        resp = client.embeddings.create(model=model, input=batch_texts)
-        # openai>=2 returns data list with embedding
-        vecs = [np.array(d.embedding, dtype=np.float32) for d in resp.data]
-        vectors.extend(vecs)
+        vectors.extend(np.asarray(v, dtype=np.float32) for v in embed_fn(batch_texts))
 
     if not vectors:
         # empty fallback
@@ -65,9 +103,9 @@ def cosine_sim(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     return np.dot(a_norm, b_norm.T)
 
 
-def query_embeddings(index_dir: Path, query: str, top_k: int = 10, model: str = "text-embedding-3-small") -> List[Dict]:
-    from openai import OpenAI
-
+def query_embeddings(
+    index_dir: Path, query: str, top_k: int = 10, model: str = "text-embedding-3-small", embed_fn: EmbedFn | None = None
+) -> List[Dict]:
     emb_path = index_dir / "embeddings.npy"
     meta_path = index_dir / "meta.jsonl"
     if not emb_path.exists() or not meta_path.exists():
@@ -76,8 +114,8 @@ def query_embeddings(index_dir: Path, query: str, top_k: int = 10, model: str =
     metas = [json.loads(line) for line in meta_path.read_text(encoding="utf-8").splitlines() if line.strip()]
     if mat.shape[0] == 0 or not metas:
         return []
-    client = OpenAI()
-    qv = np.array(client.embeddings.create(model=model, input=[query]).data[0].embedding, dtype=np.float32)[None, :]
+    embed_fn = embed_fn or _openai_embed_fn(model)
+    qv = np.asarray(embed_fn([query])[0], dtype=np.float32)[None, :]
     sims = cosine_sim(qv, mat)[0]
     idx = np.argsort(-sims)[:top_k]
     out = []
@@ -0,0 +1,121 @@
+"""
+Local near-duplicate detection with MinHash LSH.
+Catches re-uploads, mirrored posts and syndicated release notes before any
+network or LLM work, without embeddings.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..storage.sqlite import connect
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_PRIME = (1 << 31) - 1
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: pairs above ~0.5 Jaccard share a band with high probability
+ROWS = NUM_PERM // BANDS
+
+_rng = np.random.RandomState(1729)
+_A = _rng.randint(1, _PRIME, size=NUM_PERM, dtype=np.int64)[:, None]
+_B = _rng.randint(0, _PRIME, size=NUM_PERM, dtype=np.int64)[:, None]
+
+
+def shingles(text: str, size: int = 3) -> List[str]:
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    if len(tokens) <= size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def minhash(text: str, size: int = 3, min_tokens: int = 1) -> Optional[np.ndarray]:
+    """MinHash signature (NUM_PERM uint32) over word shingles.
+
+    Returns None for text under ``min_tokens`` words, which is too short to
+    compare reliably.
+    """
+    if len(_TOKEN_RE.findall((text or "").lower())) < max(1, min_tokens):
+        return None
+    sh = set(shingles(text, size))
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest() for s in sh)
+    h = (np.frombuffer(digests, dtype="<u4").astype(np.int64) % _PRIME)[None, :]
+    return ((_A * h + _B) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def candidate_text(candidate: Dict) -> str:
+    return (candidate.get("title") or "") + "\n" + (candidate.get("raw_description") or "")
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def _band_keys(sig: np.ndarray) -> List[Tuple[int, int]]:
+    keys = []
+    for i in range(BANDS):
+        d = hashlib.blake2b(sig[i * ROWS : (i + 1) * ROWS].tobytes(), digest_size=8).digest()
+        keys.append((i, int.from_bytes(d, "little", signed=True)))
+    return keys
+
+
+class NearDupIndex:
+    """Persistent MinHash signatures (``vault/neardup.db``) with LSH band lookups.
+
+    ``remember`` keeps signatures of this run's accepted candidates in memory so
+    two copies arriving in the same run are caught too; ``add`` persists the
+    signature of an ingested item.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.8):
+        self.threshold = threshold
+        self._conn = connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (item_id TEXT PRIMARY KEY, sig BLOB NOT NULL);
+            CREATE TABLE IF NOT EXISTS bands (band INTEGER NOT NULL, hash INTEGER NOT NULL, item_id TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS bands_lookup ON bands (band, hash);
+            """
+        )
+        self._mem: Dict[Tuple[int, int], List[Tuple[str, np.ndarray]]] = {}
+
+    def find(self, sig: np.ndarray) -> Optional[Tuple[str, float, bool]]:
+        """Most similar stored signature at or above ``threshold``.
+
+        Returns (key, similarity, persisted) or None; ``persisted`` is False for
+        matches against this run's in-memory signatures.
+        """
+        best: Optional[Tuple[str, float, bool]] = None
+        keys = _band_keys(sig)
+        rows = self._conn.execute(
+            "SELECT s.item_id, s.sig FROM signatures s WHERE s.item_id IN "
+            "(SELECT item_id FROM bands WHERE " + " OR ".join(["(band = ? AND hash = ?)"] * len(keys)) + ")",
+            [v for k in keys for v in k],
+        ).fetchall()
+        found = [(item_id, np.frombuffer(blob, dtype=np.uint32), True) for item_id, blob in rows]
+        for k in keys:
+            found += [(key, other, False) for key, other in self._mem.get(k, [])]
+        for key, other, persisted in found:
+            s = similarity(sig, other)
+            if s >= self.threshold and (best is None or s > best[1]):
+                best = (key, s, persisted)
+        return best
+
+    def remember(self, key: str, sig: np.ndarray):
+        for k in _band_keys(sig):
+            self._mem.setdefault(k, []).append((key, sig))
+
+    def add(self, item_id: str, sig: np.ndarray):
+        sig = np.asarray(sig, dtype=np.uint32)
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO signatures (item_id, sig) VALUES (?, ?)", (item_id, sig.tobytes()))
+            self._conn.execute("DELETE FROM bands WHERE item_id = ?", (item_id,))
+            self._conn.executemany(
+                "INSERT INTO bands (band, hash, item_id) VALUES (?, ?, ?)",
+                [(b, h, item_id) for b, h in _band_keys(sig)],
+            )
@@ -10,13 +10,27 @@ import json
 import numpy as np
 
 from .embedder import create_embedding
+from ..gates.gate1_validity import baseline_novelty
+from ..storage.keyphrases import KeyphraseIndex
+from ..storage.vault import Vault
 
 
 def load_vault_embeddings(vault_path: Path) -> Optional[Dict]:
     """
-    Load existing embeddings from vault/export/embeddings.npz
+    Load existing embeddings written by ``index-model`` (vault/model/embeddings.npy
+    + meta.jsonl), falling back to a legacy vault/export/embeddings.npz.
     Returns dict with 'embeddings' (np.array) and 'metadata' (list)
     """
+    emb_file = vault_path / "model" / "embeddings.npy"
+    meta_file = vault_path / "model" / "meta.jsonl"
+    if emb_file.exists() and meta_file.exists():
+        try:
+            embeddings = np.load(emb_file)
+            metadata = [json.loads(line) for line in meta_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+            return {"embeddings": embeddings, "metadata": metadata}
+        except Exception:
+            return None
+
     emb_file = vault_path / "export" / "embeddings.npz"
     meta_file = vault_path / "export" / "metadata.json"
 
@@ -33,9 +47,83 @@ def load_vault_embeddings(vault_path: Path) -> Optional[Dict]:
         return None
 
 
-def compute_semantic_novelty(candidate: Dict, highlights: Dict, vault_path: Path, threshold: float = 0.7) -> Dict:
+class NoveltyIndex:
+    """
+    Resident, incrementally updated matrix of normalized item vectors.
+
+    Loaded once per ingest run; each gated item's vector is appended (amortized
+    growth), so novelty is a single matrix-vector product rather than a reload
+    of the embeddings file per item.
+    """
+
+    def __init__(self, dim: Optional[int] = None, capacity: int = 1024):
+        self.dim = dim
+        self._mat = np.zeros((capacity, dim), dtype=np.float32) if dim else None
+        self.size = 0
+        self.metadata: List[Dict] = []
+
+    @classmethod
+    def from_vault(cls, vault_path: Path) -> "NoveltyIndex":
+        index = cls()
+        data = load_vault_embeddings(vault_path)
+        if data is not None and data["embeddings"].ndim == 2 and data["embeddings"].shape[1] > 1:
+            metas = list(data["metadata"])[: len(data["embeddings"])]
+            index.add_batch(data["embeddings"][: len(metas)], metas)
+        return index
+
+    def add_batch(self, vectors: np.ndarray, metadata: List[Dict]):
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if not len(vectors):
+            return
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self._mat = np.zeros((max(1024, len(vectors)), self.dim), dtype=np.float32)
+        if vectors.shape[1] != self.dim:
+            return
+        need = self.size + len(vectors)
+        if need > len(self._mat):
+            grown = np.zeros((max(need, 2 * len(self._mat)), self.dim), dtype=np.float32)
+            grown[: self.size] = self._mat[: self.size]
+            self._mat = grown
+        self._mat[self.size : need] = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-10)
+        self.metadata.extend(metadata)
+        self.size = need
+
+    def add(self, vector: np.ndarray, meta: Dict):
+        self.add_batch(vector[None, :], [meta])
+
+    def similarities(self, vectors: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each query row against every stored vector, shape [Q, N]."""
+        q = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        q = q / (np.linalg.norm(q, axis=1, keepdims=True) + 1e-10)
+        return q @ self._mat[: self.size].T
+
+    def compatible(self, vector: np.ndarray) -> bool:
+        return self.dim is None or vector.shape[-1] == self.dim
+
+
+def novelty_text(candidate: Dict, highlights: Dict) -> str:
+    text_parts = [
+        candidate.get("title", ""),
+        candidate.get("description") or candidate.get("raw_description", ""),
+        " ".join(highlights.get("keyphrases", [])),
+        " ".join(k.get("claim", "") if isinstance(k, dict) else str(k) for k in highlights.get("key_claims", []))
+    ]
+    return " ".join(part for part in text_parts if part).strip()
+
+
+def compute_semantic_novelty(
+    candidate: Dict,
+    highlights: Dict,
+    vault_path: Path,
+    threshold: float = 0.7,
+    index: Optional[NoveltyIndex] = None,
+    embedding: Optional[np.ndarray] = None,
+) -> Dict:
     """
     Compute semantic novelty by comparing candidate against vault history.
+    Pass a resident ``index`` (and a precomputed ``embedding``) to avoid
+    loading the vault matrix and re-embedding per call.
 
     Returns:
         {
@@ -45,15 +133,9 @@ def compute_semantic_novelty(candidate: Dict, highlights: Dict, vault_path: Path
         }
     """
     # Create embedding for new item
-    text_parts = [
-        candidate.get("title", ""),
-        candidate.get("description", ""),
-        " ".join(highlights.get("keyphrases", [])),
-        " ".join(highlights.get("key_claims", []))
-    ]
-    new_text = " ".join(part for part in text_parts if part).strip()
+    new_text = novelty_text(candidate, highlights)
 
-    if not new_text:
+    if embedding is None and not new_text:
         return {
             "novelty_score": 0.5,
             "similar_items": [],
@@ -61,7 +143,7 @@ def compute_semantic_novelty(candidate: Dict, highlights: Dict, vault_path: Path
         }
 
     try:
-        new_embedding = create_embedding(new_text)
+        new_embedding = embedding if embedding is not None else create_embedding(new_text)
     except Exception as e:
         return {
             "novelty_score": 0.5,
@@ -70,42 +152,39 @@ def compute_semantic_novelty(candidate: Dict, highlights: Dict, vault_path: Path
         }
 
     # Load vault embeddings
-    vault_data = load_vault_embeddings(vault_path)
-    if not vault_data or len(vault_data["embeddings"]) == 0:
+    if index is None:
+        index = NoveltyIndex.from_vault(vault_path)
+    if index.size == 0 or not index.compatible(new_embedding):
+        # Nothing to compare against (e.g. CI without vault/model): same score as without embeddings
         return {
-            "novelty_score": 0.9,  # High novelty if no history
+            "novelty_score": baseline_novelty(candidate),
             "similar_items": [],
             "reasoning": "No vault history to compare against"
         }
 
     # Compute cosine similarity with all vault items
-    vault_embeddings = vault_data["embeddings"]
-    vault_metadata = vault_data["metadata"]
-
-    # Normalize embeddings
-    new_emb_norm = new_embedding / (np.linalg.norm(new_embedding) + 1e-10)
-    vault_embs_norm = vault_embeddings / (np.linalg.norm(vault_embeddings, axis=1, keepdims=True) + 1e-10)
-
-    # Compute similarities
-    similarities = np.dot(vault_embs_norm, new_emb_norm)
+    vault_metadata = index.metadata
+    similarities = index.similarities(new_embedding)[0]
 
-    # Find top 3 most similar
-    top_indices = np.argsort(similarities)[::-1][:3]
-    top_similarities = similarities[top_indices]
+    # Find top 3 most similar items (several chunks can belong to one item)
+    top_indices = np.argsort(similarities)[::-1][:12]
 
     similar_items = []
-    for idx, sim in zip(top_indices, top_similarities):
-        if idx < len(vault_metadata):
-            meta = vault_metadata[idx]
-            similar_items.append({
-                "item_id": meta.get("item_id"),
-                "title": meta.get("title"),
-                "similarity": float(sim),
-                "url": meta.get("url")
-            })
+    for idx in top_indices:
+        meta = vault_metadata[idx]
+        if any(s["item_id"] == meta.get("item_id") for s in similar_items):
+            continue
+        similar_items.append({
+            "item_id": meta.get("item_id"),
+            "title": meta.get("title"),
+            "similarity": float(similarities[idx]),
+            "url": meta.get("url")
+        })
+        if len(similar_items) == 3:
+            break
 
     # Compute novelty score: inverse of max similarity
-    max_similarity = float(top_similarities[0]) if len(top_similarities) > 0 else 0.0
+    max_similarity = float(similarities[top_indices[0]])
     novelty_score = 1.0 - max_similarity
 
     # Determine reasoning
@@ -123,9 +202,10 @@ def compute_semantic_novelty(candidate: Dict, highlights: Dict, vault_path: Path
     }
 
 
-def detect_new_keyphrases(highlights: Dict, vault_path: Path) -> Dict:
+def detect_new_keyphrases(highlights: Dict, vault_path: Path, index: Optional[KeyphraseIndex] = None) -> Dict:
     """
     Detect keyphrases that haven't been seen before in the vault.
+    Uses the keyphrase vocabulary (vault/keyphrases.db, seeded from the vault on first use).
 
     Returns:
         {
@@ -143,31 +223,14 @@ def detect_new_keyphrases(highlights: Dict, vault_path: Path) -> Dict:
             "novelty_ratio": 0.0
         }
 
-    # Load all existing keyphrases from vault
-    known_keyphrases = set()
-    items_dir = vault_path / "ai-intel" / "items"
-
-    if items_dir.exists():
-        for month_dir in items_dir.iterdir():
-            if not month_dir.is_dir():
-                continue
-            for item_dir in month_dir.iterdir():
-                highlights_file = item_dir / "highlights.json"
-                if highlights_file.exists():
-                    try:
-                        with open(highlights_file, encoding="utf-8") as f:
-                            item_highlights = json.load(f)
-                            item_kp = item_highlights.get("keyphrases", [])
-                            known_keyphrases.update(item_kp)
-                    except Exception:
-                        continue
-
-    new_kp = list(keyphrases - known_keyphrases)
-    known_kp = list(keyphrases & known_keyphrases)
+    if index is None:
+        index = KeyphraseIndex(vault_path / "keyphrases.db", vault=Vault(vault_path / "ai-intel"))
+    known_kp = index.known(keyphrases)
+    new_kp = list(keyphrases - known_kp)
     novelty_ratio = len(new_kp) / len(keyphrases) if keyphrases else 0.0
 
     return {
         "new_keyphrases": new_kp,
-        "known_keyphrases": known_kp,
+        "known_keyphrases": list(known_kp),
         "novelty_ratio": novelty_ratio
     }
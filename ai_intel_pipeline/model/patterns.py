@@ -55,7 +55,7 @@ def extract_patterns_from_item(item_data: Dict, highlights: Dict, summary: str)
         "summary": summary[:800]  # Truncate for token efficiency
     }
 
-    resp = llm_complete_json(system=sys, user=user, max_tokens=500)
+    resp = llm_complete_json(system=sys, user=user, max_tokens=500, label="patterns")
     if isinstance(resp, dict):
         return {
             "techniques": resp.get("techniques", []),
@@ -238,7 +238,7 @@ def synthesize_meta_insights(patterns: List[Dict], clusters: List[Dict]) -> List
         "instruction": "Generate 3-5 meta-insights that connect multiple patterns."
     }
 
-    resp = llm_complete_json(system=sys, user=user, max_tokens=800)
+    resp = llm_complete_json(system=sys, user=user, max_tokens=800, label="meta_insights")
     if isinstance(resp, dict) and "insights" in resp:
         return resp["insights"]
 
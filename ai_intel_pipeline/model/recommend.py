@@ -8,8 +8,8 @@ from typing import Dict, List
 
 import numpy as np
 
-from .embedder import query_embeddings
-import json
+from .embedder import EmbedFn, query_embeddings
+from ..storage.vault import Vault
 
 
 def _load_index(index_csv: Path) -> Dict[str, Dict]:
@@ -23,26 +23,13 @@ def _load_index(index_csv: Path) -> Dict[str, Dict]:
     return out
 
 
-def _item_dir_from_meta(vault_root: Path, item_id: str) -> Path:
-    month = f"{item_id[:4]}-{item_id[4:6]}"
-    return vault_root / "ai-intel" / "items" / month / item_id
-
-
-def _load_pillars(vault_root: Path, item_id: str) -> List[str]:
-    p = _item_dir_from_meta(vault_root, item_id) / "item.json"
-    try:
-        js = json.loads(p.read_text(encoding="utf-8"))
-        return js.get("pillars", [])
-    except Exception:
-        return []
+def _load_pillars(vault: Vault, item_id: str) -> List[str]:
+    js = vault.read_json(item_id) or {}
+    return js.get("pillars", [])
 
 
-def _load_summary(vault_root: Path, item_id: str) -> str:
-    p = _item_dir_from_meta(vault_root, item_id) / "summary.md"
-    try:
-        return p.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+def _load_summary(vault: Vault, item_id: str) -> str:
+    return vault.read_text(item_id, "summary.md") or ""
 
 
 def _load_policy_weights(policy_path: Path) -> Dict:
@@ -54,11 +41,13 @@ def _load_policy_weights(policy_path: Path) -> Dict:
     return {}
 
 
-def recommend(vault_root: Path, index_csv: Path, model_dir: Path, profile: Dict, top_k: int = 10) -> List[Dict]:
+def recommend(
+    vault_root: Path, index_csv: Path, model_dir: Path, profile: Dict, top_k: int = 10, embed_fn: EmbedFn | None = None
+) -> List[Dict]:
     # Build a query from profile priorities
     priorities = profile.get("priorities", [])
     query = ", ".join(priorities) + ", AI app workflows, best practices"
-    hits = query_embeddings(model_dir, query=query, top_k=top_k * 5)
+    hits = query_embeddings(model_dir, query=query, top_k=top_k * 5, embed_fn=embed_fn)
 
     index = _load_index(index_csv)
 
@@ -83,6 +72,7 @@ def recommend(vault_root: Path, index_csv: Path, model_dir: Path, profile: Dict,
     base_pillar = {p.lower(): 1.0 for p in priorities}
     learned_pillars = (policy.get("pillars_multipliers") or {})
 
+    vault = Vault(vault_root)
     results = []
     for item_id, data in per_item.items():
         idx = index.get(item_id, {})
@@ -90,7 +80,7 @@ def recommend(vault_root: Path, index_csv: Path, model_dir: Path, profile: Dict,
         rel = float(idx.get("relevance", 0) or 0)
         act = float(idx.get("actionability", 0) or 0)
         cred = float(idx.get("credibility", 0) or 0)
-        pillars = _load_pillars(vault_root, item_id)
+        pillars = _load_pillars(vault, item_id)
         # Pillar boost if matches priorities
         boost_prior = 0.05 * sum(base_pillar.get(p.lower(), 0) for p in pillars)
         boost_learn = sum(float(learned_pillars.get(p, 0)) for p in [pi.lower() for pi in pillars])
@@ -103,7 +93,7 @@ def recommend(vault_root: Path, index_csv: Path, model_dir: Path, profile: Dict,
                 "url": idx.get("url", data["meta"].get("url", "")),
                 "pillars": pillars,
                 "scores": {"sim": sim, "relevance": rel, "actionability": act, "credibility": cred, "combined": score},
-                "summary": _load_summary(vault_root, item_id)[:600],
+                "summary": _load_summary(vault, item_id)[:600],
             }
         )
 
@@ -3,20 +3,23 @@ from __future__ import annotations
 from typing import Dict, List
 import re
 
+from ..classify.matcher import compiled_matcher
 
-def _extract_keyphrases(text: str, max_k: int = 5) -> List[str]:
+
+KEYWORDS = [
+    "Claude", "Claude Code", "OpenAI", "GPT", "Next.js", "Vercel",
+    "Cloudflare", "Cursor", "Agents", "UI", "Tailwind", "Radix",
+    "Shadcn", "Release", "Benchmark", "SOTA",
+]
+
+
+def extract_keyphrases(text: str, max_k: int = 5) -> List[str]:
+    """Known keywords and Title Case chunks in ``text`` (highlights and triage)."""
     if not text:
         return []
     # Simple heuristic: pick capitalized phrases and known keywords
-    keywords = [
-        "Claude", "Claude Code", "OpenAI", "GPT", "Next.js", "Vercel",
-        "Cloudflare", "Cursor", "Agents", "UI", "Tailwind", "Radix",
-        "Shadcn", "Release", "Benchmark", "SOTA",
-    ]
-    found = []
-    for k in keywords:
-        if k.lower() in text.lower():
-            found.append(k)
+    hits = compiled_matcher([(k, [k]) for k in KEYWORDS]).counts(text)
+    found = [k for k in KEYWORDS if k in hits]
     # Add some camel-case or Title Case chunks
     caps = re.findall(r"\b([A-Z][a-zA-Z0-9\-/+]{2,}(?:\s+[A-Z][a-zA-Z0-9\-/+]{2,})*)\b", text)
     for c in caps:
@@ -49,7 +52,7 @@ def build_highlights(candidate: Dict, dry_run: bool = False) -> Dict:
         if preview:
             bullets.append(f"Context: {preview[:240]}")
 
-    keyphrases = _extract_keyphrases((title + "\n" + desc))
+    keyphrases = extract_keyphrases((title + "\n" + desc))
     key_claims = []
     # Minimal claim placeholder
     if "release" in (candidate.get("type") or ""):
@@ -1,24 +1,40 @@
 from __future__ import annotations
 
 from pathlib import Path
+from contextlib import nullcontext
 import json
-from typing import Dict, List
+import os
+import time
+from typing import Callable, Dict, List
 from datetime import datetime
 
 from .storage.vault import Vault
 from .storage.index import Index
 from .storage.state import State
 from .storage.views import Views
-from .config import load_profile, load_settings, load_pillars
+from .storage.journal import IngestJournal, stage_rank
+from .storage.atomic import batched_fsync
+from .storage.fingerprints import FingerprintIndex
+from .storage.keyphrases import KeyphraseIndex
+from .utils.canonical import canonical_url, candidate_fingerprints
+from .model.neardup import NearDupIndex, minhash, candidate_text
+from .model.novelty import NoveltyIndex, compute_semantic_novelty, novelty_text
+from .model.embedder import create_embedding
+from .config import load_profile, load_settings, load_pillars, load_policy
 from .fetchers.github import fetch_github_releases
 from .fetchers.rss import fetch_feed_items
-from .fetchers.youtube import fetch_youtube_channel_rss, fetch_youtube_search_rss, enrich_youtube_metadata
+from .fetchers.youtube import fetch_youtube_channel_rss, fetch_youtube_search_rss, enrich_youtube_metadata, YouTubeInfoCache
 from .normalize.highlights import build_highlights
 from .gates.gate1_validity import gate1_validate
 from .gates.gate2_personalize import gate2_personalize
+from .prompt_budget import gate_budget
+from .profiling import StageProfiler
+from .classify.triage import rank_candidates
 # Alerts disabled by default; Slack integration optional
 # from .delivery.alerts import send_webhook_alert
-from .transcripts.youtube import get_transcript_segments
+from .transcripts.prefetch import TranscriptPrefetcher
+from .transcripts.cache import TranscriptCache
+from .transcripts.youtube import extract_video_id, fetch_captions_segments
 from .fetchers.github_search import search_innovative_repos
 from .fetchers.github_docs import fetch_readme, fetch_changelog
 
@@ -30,23 +46,108 @@ def run_ingest(
     index: Index,
     limit: int = 10,
     dry_run: bool = False,
+    profiler: StageProfiler | None = None,
 ) -> List[str]:
+    """Ingest up to ``limit`` new items; returns their ids.
+
+    Stage timings go to ``vault/status/ingest_profile.json``; pass a
+    ``profiler`` to read them back without re-reading that file.
+    """
     profile = load_profile()
     pillars_cfg = load_pillars()
-    state = State(Path("vault/state.json"))
-    views = Views(root=Path("vault"))
+    state = _open_state(settings)
+    journal = IngestJournal(Path("vault/journal.jsonl"))
+    views = _open_views(settings, journal)
+    fingerprints = FingerprintIndex(Path("vault/fingerprints.db"), index_csv=index.path)
+    keyphrases = KeyphraseIndex(Path("vault/keyphrases.db"), vault=vault)
+    neardup = _open_neardup(settings)
     created_ids: List[str] = []
+    limit = _daily_limit(settings, limit)
+    profiler = profiler if profiler is not None else StageProfiler()
 
-    # normalize limit against settings daily cap
-    daily_cap = int(settings.get("ingest", {}).get("daily_limit", 12))
-    limit = min(limit or daily_cap, daily_cap)
+    # 1) Fetch, dedupe and triage candidates
+    candidates = _collect_candidates(
+        sources, settings, vault, index, state, fingerprints, neardup, profile, pillars_cfg, limit,
+        in_flight=lambda uid: journal.stage(uid) >= 0, profiler=profiler,
+    )
+
+    # 2) Resume items a previous (crashed) run left half-processed, then process new ones.
+    # Captions download in the background meanwhile, so videos go after the other new items.
+    prefetch = _open_prefetcher(settings)
+    if prefetch is not None:
+        candidates = [c for c in candidates if c.get("source_type") != "youtube"] + [
+            c for c in candidates if c.get("source_type") == "youtube"
+        ]
+    # items that crashed a run max_attempts times are not resumed again
+    max_attempts = int(settings.get("ingest", {}).get("max_attempts", 3))
+    resumed = journal.pending(max_attempts)
+    for e in resumed:
+        journal.retry(e["uid"])
+    candidates = [e["candidate"] for e in resumed] + candidates
+    novelty_index = _open_novelty_index(settings, dry_run) if candidates else None
+    if prefetch is not None:
+        transcripts = TranscriptCache()
+        for c in candidates:
+            if c.get("source_type") != "youtube" or journal.stage(c.get("_uid")) >= stage_rank("transcript"):
+                continue
+            if not transcripts.has(extract_video_id(c.get("url") or "")):
+                prefetch.submit(c.get("url"))
+    with _fsync_mode(settings), (prefetch or nullcontext()):
+        for c in candidates:
+            item_id = _process_candidate(
+                c, settings=settings, vault=vault, index=index, state=state, views=views,
+                journal=journal, fingerprints=fingerprints, profile=profile, pillars_cfg=pillars_cfg, dry_run=dry_run,
+                neardup=neardup, novelty_index=novelty_index, keyphrases=keyphrases, prefetch=prefetch,
+                profiler=profiler,
+            )
+            if item_id:
+                created_ids.append(item_id)
+
+        # Save state and views at end, then drop finished entries from the journal
+        with profiler.stage("index", items=0):
+            state.save()
+            views.flush()
+            journal.compact()
+    if not dry_run:
+        with profiler.stage("pack", items=0):
+            _pack_cold_months(settings, vault)
+
+    profiler.write(
+        candidates=len(candidates), created=len(created_ids), failed=len(journal.failed(max_attempts)), dry_run=dry_run,
+    )
+    return created_ids
 
-    # 1) Fetch candidates (YouTube channels RSS, GitHub releases, vendor feeds)
+
+def _collect_candidates(
+    sources: Dict,
+    settings: Dict,
+    vault: Vault,
+    index: Index,
+    state: State,
+    fingerprints: FingerprintIndex,
+    neardup: NearDupIndex | None,
+    profile: Dict,
+    pillars_cfg: Dict,
+    limit: int,
+    in_flight: Callable[[str], bool],
+    profiler: StageProfiler | None = None,
+) -> List[Dict]:
+    """Fetch candidates (YouTube channels RSS, GitHub releases, vendor feeds),
+    drop ones already seen or ``in_flight``, and return the top ``limit`` by triage."""
+    profiler = profiler or StageProfiler()
+    nd_conf = (settings.get("dedup", {}) or {}).get("near_duplicate", {}) or {}
     candidates = []
+
+    def fetch(source: str, fn: Callable, *args):
+        with profiler.stage("fetch", detail=source) as n:
+            got = fn(*args)
+            n["items"] = len(got)
+        candidates.extend(got)
+
     # YouTube discovery: channel RSS and query RSS (channels optional)
     yt_conf = sources.get("youtube", {})
     for ch in yt_conf.get("channels", []) or []:
-        candidates += fetch_youtube_channel_rss(ch.get("channel_id"), ch.get("name"))
+        fetch(f"youtube:{ch.get('name') or ch.get('channel_id')}", fetch_youtube_channel_rss, ch.get("channel_id"), ch.get("name"))
     # dynamic query expansion from profile priorities
     dyn_q = []
     for p in (profile.get("priorities") or []):
@@ -58,25 +159,26 @@ def run_ingest(
         if q in seen_q:
             continue
         seen_q.add(q)
-        candidates += fetch_youtube_search_rss(q)
+        fetch(f"youtube-search:{q}", fetch_youtube_search_rss, q)
 
     # GitHub releases (optional; can be pruned later)
     for repo in sources.get("github", {}).get("repos", []) or []:
-        candidates += fetch_github_releases(repo)
+        fetch(f"github:{repo}", fetch_github_releases, repo)
 
     # GitHub innovative apps search
     gh_search_q = sources.get("github", {}).get("search_queries", []) or []
     if gh_search_q:
-        candidates += search_innovative_repos(gh_search_q, per_query=3)
+        fetch("github-search", lambda: search_innovative_repos(gh_search_q, per_query=3))
 
     # Vendor feeds
     for feed in sources.get("feeds", []):
-        candidates += fetch_feed_items(feed.get("url"), feed.get("name"))
+        fetch(f"feed:{feed.get('name') or feed.get('url')}", fetch_feed_items, feed.get("url"), feed.get("name"))
+
+    dedup_started = time.perf_counter()
 
-    # Compute uids and sort newest first, then limit
+    # Canonicalize URLs, compute uids and fingerprints, sort newest first
     def uid_for(c: Dict) -> str:
         if c.get("source_type") == "youtube":
-            from .transcripts.youtube import extract_video_id
             vid = extract_video_id(c.get("url") or "") or ""
             return f"yt:{vid}" if vid else c.get("url", "")
         if c.get("source_type") == "github" and c.get("type") == "application":
@@ -84,142 +186,285 @@ def run_ingest(
         return c.get("url", "")
 
     for c in candidates:
+        raw = c.get("url") or ""
+        c["url"] = canonical_url(raw) or raw
+        if raw != c["url"]:
+            c["raw_url"] = raw
         c["_uid"] = uid_for(c)
+        c["_fp"] = candidate_fingerprints(c)
 
     candidates.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-    # Filter out already seen items by state and index
+    # Filter out already seen items by state, index and fingerprints (before any enrichment)
     filtered = []
+    run_fps = set()
     for c in candidates:
-        if state.seen(url=c.get("url"), uid=c.get("_uid")):
+        if in_flight(c.get("_uid")):
+            # already in flight (journaled by a previous run, or queued)
             continue
-        if index.has_url(c.get("url")):
+        if state.seen(url=c.get("url"), uid=c.get("_uid")) or state.seen(url=c.get("raw_url")):
+            continue
+        if index.has_url(c.get("url")) or fingerprints.lookup(c["_fp"]):
             # mark in state as well to avoid rework next run
             state.mark(url=c.get("url"), uid=c.get("_uid"))
             continue
+        if run_fps.intersection(c["_fp"]):
+            # same content from another feed in this run
+            continue
+        if neardup is not None:
+            sig = minhash(candidate_text(c), min_tokens=int(nd_conf.get("min_tokens", 12)))
+            hit = neardup.find(sig) if sig is not None else None
+            if hit:
+                # re-upload / mirror / syndicated copy: merge into the existing item and drop
+                dup_of, _, persisted = hit
+                if persisted:
+                    _record_mirror(vault, dup_of, c)
+                    fingerprints.add(c["_fp"], dup_of)
+                    state.mark(url=c.get("url"), uid=c.get("_uid"))
+                continue
+            if sig is not None:
+                c["_minhash"] = sig.tolist()
+                neardup.remember(c["_uid"], sig)
+        run_fps.update(c["_fp"])
         filtered.append(c)
-    candidates = filtered[:limit]
+    profiler.add("dedup", time.perf_counter() - dedup_started, items=len(candidates))
+    # Triage: spend transcripts and LLM gates on the highest expected-value items
+    triage_conf = settings.get("ingest", {}).get("triage") or {}
+    if triage_conf.get("enabled", True):
+        with profiler.stage("triage", items=len(filtered)):
+            filtered = rank_candidates(
+                filtered, profile, pillars_cfg, load_policy(), half_life_days=float(triage_conf.get("half_life_days", 7))
+            )
+    return filtered[:limit]
+
+
+def _pack_cold_months(settings: Dict, vault: Vault):
+    keep = (settings.get("storage", {}) or {}).get("pack_after_months")
+    if keep is None:
+        return
+    try:
+        for month in vault.cold_months(int(keep)):
+            vault.pack_month(month)
+    except Exception:
+        # an interrupted pack is repeated on the next run; items stay readable meanwhile
+        pass
 
-    # 2) For each candidate, create vault item and run highlights
-    for c in candidates:
-        if index.has_url(c.get("url")):
+
+def _daily_limit(settings: Dict, limit: int) -> int:
+    """``limit`` normalized against the settings daily cap."""
+    daily_cap = int(settings.get("ingest", {}).get("daily_limit", 12))
+    return min(limit or daily_cap, daily_cap)
+
+
+def _open_neardup(settings: Dict) -> NearDupIndex | None:
+    nd_conf = (settings.get("dedup", {}) or {}).get("near_duplicate", {}) or {}
+    if not nd_conf.get("enabled", True):
+        return None
+    return NearDupIndex(Path("vault/neardup.db"), threshold=float(nd_conf.get("threshold", 0.8)))
+
+
+def _open_prefetcher(settings: Dict) -> TranscriptPrefetcher | None:
+    workers = int(((settings.get("ingest", {}) or {}).get("transcripts") or {}).get("prefetch_workers", 4))
+    return TranscriptPrefetcher(max_workers=workers) if workers > 0 else None
+
+
+def _open_state(settings: Dict) -> State:
+    conf = settings.get("state", {}) or {}
+    return State(Path("vault/state.json"), ttl_days=conf.get("ttl_days"), bloom=bool(conf.get("bloom", False)))
+
+
+def _open_novelty_index(settings: Dict, dry_run: bool) -> NoveltyIndex | None:
+    """Vault embeddings held in memory for the run; None when semantic novelty can't be scored."""
+    if dry_run or not (settings.get("novelty", {}) or {}).get("semantic", True) or not os.getenv("OPENAI_API_KEY"):
+        return None
+    try:
+        return NoveltyIndex.from_vault(Path("vault"))
+    except Exception:
+        return None
+
+
+def _open_views(settings: Dict, journal: IngestJournal) -> Views:
+    """Batched pillar views; re-applies items a crashed run indexed but never flushed."""
+    conf = settings.get("views", {}) or {}
+    views = Views(root=Path("vault"), compact_after=int(conf.get("compact_after", 2000)))
+    for e in journal.finished():
+        try:
+            data = json.loads((Path(e["item_dir"]) / "item.json").read_text(encoding="utf-8"))
+        except Exception:
             continue
+        views.add_item_to_pillars(data.get("pillars") or [], data)
+    return views
+
+
+def _fsync_mode(settings: Dict):
+    storage = settings.get("storage", {}) or {}
+    if storage.get("fsync") == "batch":
+        return batched_fsync(max_pending=int(storage.get("fsync_batch_files", 256)))
+    return nullcontext()
+
+
+def _process_candidate(
+    c: Dict,
+    settings: Dict,
+    vault: Vault,
+    index: Index,
+    state: State,
+    views: Views,
+    journal: IngestJournal,
+    fingerprints: FingerprintIndex,
+    profile: Dict,
+    pillars_cfg: Dict,
+    dry_run: bool = False,
+    neardup: NearDupIndex | None = None,
+    novelty_index: NoveltyIndex | None = None,
+    keyphrases: KeyphraseIndex | None = None,
+    prefetch: TranscriptPrefetcher | None = None,
+    profiler: StageProfiler | None = None,
+) -> str:
+    """Run one candidate through every ingest stage, resuming from the journal.
+
+    Each completed stage is journaled; stages already recorded for this uid are
+    skipped and their outputs reloaded from the item folder.
+    """
+    profiler = profiler or StageProfiler()
+    uid = c.get("_uid") or c.get("url") or ""
+    entry = journal.get(uid)
+    done = journal.stage(uid)
+
+    if done < 0 and index.has_url(c.get("url")):
+        return ""
+    if done >= 0 and entry.get("item_dir"):
+        item_id, item_dir = entry["item_id"], Path(entry["item_dir"])
+    else:
         item_id, item_dir = vault.create_item_folder(dt=datetime.utcnow())
+        journal.record(uid, "created", item_id=item_id, item_dir=str(item_dir), candidate=c)
 
-        # Write item.json base
-        item = vault.init_item_json(
-            item_id=item_id,
-            title=c.get("title"),
-            canonical_url=c.get("url"),
-            source_type=c.get("source_type"),
-            source_name=c.get("source_name"),
-            published_at=c.get("published_at"),
-            content_type=c.get("type"),
-            links=c.get("links", {}),
+    # item.json base; stage updates stay in memory and are flushed once below.
+    # A resumed item is rebuilt from the candidate plus its journaled stage outputs.
+    record = vault.new_item(
+        item_id=item_id,
+        title=c.get("title"),
+        canonical_url=c.get("url"),
+        source_type=c.get("source_type"),
+        source_name=c.get("source_name"),
+        published_at=c.get("published_at"),
+        content_type=c.get("type"),
+        links=c.get("links", {}),
+        item_dir=item_dir,
+    )
+    record.update_fields(entry.get("fields") or {})
+    if c.get("_triage") is not None:
+        record.update_fields({"triage_score": c["_triage"]})
+
+    # Build highlights (LLM optional)
+    if done >= stage_rank("highlights"):
+        highlights = json.loads((item_dir / "highlights.json").read_text(encoding="utf-8"))
+    else:
+        with profiler.stage("highlights"):
+            highlights = build_highlights(candidate=c, dry_run=dry_run)
+            vault.write_json(item_dir / "highlights.json", highlights)
+            if keyphrases is not None:
+                keyphrases.add(item_id, highlights.get("keyphrases", []))
+        journal.record(uid, "highlights")
+
+    if done < stage_rank("transcript"):
+        fields = _enrich_sources(
+            c, record.links, item_dir, settings=settings, vault=vault, state=state, dry_run=dry_run, prefetch=prefetch,
+            profiler=profiler,
         )
+        record.update_fields(fields)
+        # budget spent on Whisper must survive a crash in the gates
+        state.save()
+        journal.record(uid, "transcript", fields=fields)
+
+    # Gate 1 validity
+    if done >= stage_rank("gate1"):
+        scores = entry.get("scores") or {}
+        novelty = entry.get("novelty")
+    else:
+        with profiler.stage("novelty"):
+            novelty, vec, similar = _semantic_novelty(c, highlights, novelty_index)
+        if similar is not None:
+            record.update_fields({"similar_items": similar})
+        with profiler.stage("gate1"):
+            evidence, scores = gate1_validate(
+                candidate=c, highlights=highlights, item_dir=item_dir, dry_run=dry_run, novelty=novelty,
+                budget=gate_budget(settings, "gate1"),
+            )
+            if evidence:
+                vault.write_json(item_dir / "evidence.json", evidence)
+        if vec is not None:
+            # later items in this run are scored against this one too
+            novelty_index.add(vec, {"item_id": item_id, "title": c.get("title"), "url": c.get("url")})
+        journal.record(uid, "gate1", scores=scores, novelty=novelty)
+    record.update_scores(scores)
+
+    # Gate 2 personalization
+    if done >= stage_rank("gate2"):
+        scores2 = entry.get("scores2") or {}
+    else:
+        with profiler.stage("gate2"):
+            summary_md, scores2 = gate2_personalize(
+                highlights=highlights, profile=profile, candidate=c, item_dir=item_dir, dry_run=dry_run, novelty=novelty,
+                budget=gate_budget(settings, "gate2"),
+            )
+            vault.write_text(item_dir / "summary.md", summary_md)
+        journal.record(uid, "gate2", scores2=scores2)
+    record.update_scores(scores2)
+
+    # Classify pillars (heuristic for now) and update views
+    with profiler.stage("classify"):
+        record.update_fields({"pillars": _classify(c, highlights, pillars_cfg)})
+    with profiler.stage("index"):
+        record.flush()
+        _index_item(c, item_id, item_dir, record.data, scores, scores2, index, views, fingerprints, neardup, state)
+    journal.record(uid, "indexed")
+    return item_id
 
-        # Build highlights (LLM optional)
-        highlights = build_highlights(candidate=c, dry_run=dry_run)
-        vault.write_json(item_dir / "highlights.json", highlights)
 
-        # If YouTube, enrich description/links and capture transcript
-        if c.get("source_type") == "youtube":
-            meta = enrich_youtube_metadata(c.get("url"))
-            if meta:
-                # augment links
-                links = item.get("links", {})
-                links.setdefault("repos", [])
-                links.setdefault("urls", [])
-                links["repos"] = sorted(list(set(links["repos"] + meta.get("extracted_links", {}).get("repos", []))))
-                links["urls"] = sorted(list(set(links["urls"] + meta.get("extracted_links", {}).get("urls", []))))
-                extra_fields = {"links": links}
-                if meta.get("duration") is not None:
-                    extra_fields["duration_seconds"] = int(meta.get("duration") or 0)
-                vault.update_fields(item_dir / "item.json", extra_fields)
-                # store source description if substantial
-                desc = meta.get("description") or ""
-                if len(desc) > 40:
-                    vault.write_text(item_dir / "source.md", desc)
-            # captions-first
-            segs = get_transcript_segments(c.get("url"))
-            used_fallback = False
-            if not segs:
-                # consider Whisper fallback if allowed by settings and budget
-                dur_sec = (meta.get("duration") or 0) if meta else 0
-                dur_min = int(dur_sec // 60)
-                max_min = int(settings.get("ingest", {}).get("transcripts", {}).get("max_whisper_video_minutes", 30))
-                daily_cap = int(settings.get("ingest", {}).get("transcripts", {}).get("daily_whisper_budget_minutes", 240))
-                if dur_min and dur_min <= max_min:
-                    date_key = datetime.utcnow().strftime("%Y-%m-%d")
-                    if state.can_spend_stt(dur_min, date_key, daily_cap):
-                        from .transcripts.youtube import transcribe_with_openai
-                        fallback = transcribe_with_openai(c.get("url")) if not dry_run else None
-                        if fallback:
-                            segs = fallback
-                            state.spend_stt(dur_min, date_key)
-                            used_fallback = True
-            if segs:
-                vault.write_json(item_dir / "transcript.json", {"segments": segs, "fallback": used_fallback})
-
-            # Fetch repo README/CHANGELOG snippets for top 1-2 repos discovered in description
-            links = (json.loads((item_dir / "item.json").read_text(encoding="utf-8"))).get("links", {})
-            repos = links.get("repos", []) if isinstance(links, dict) else []
-            if repos:
-                (item_dir / "repo_snippets").mkdir(parents=True, exist_ok=True)
-                for repo in repos[:2]:
-                    rd = fetch_readme(repo)
-                    if rd:
-                        (item_dir / "repo_snippets" / f"{repo.replace('/', '_')}_README.md").write_text(rd[:4000], encoding="utf-8")
-                    ch = fetch_changelog(repo)
-                    if ch:
-                        (item_dir / "repo_snippets" / f"{repo.replace('/', '_')}_CHANGELOG.md").write_text(ch[:4000], encoding="utf-8")
-
-        # If GitHub application or release, add evidence sources
-        if c.get("source_type") == "github":
-            links = (json.loads((item_dir / "item.json").read_text(encoding="utf-8"))).get("links", {})
-            # For releases, store raw description as source.md if present
-            if (c.get("type") == "release") and c.get("raw_description"):
-                vault.write_text(item_dir / "source.md", (c.get("raw_description") or "")[:10000])
-            # For application repos, fetch README/CHANGELOG
-            repo_url = None
-            if isinstance(links, dict):
-                repo_url = links.get("repo") or (links.get("repos", [None])[0] if links.get("repos") else None)
-            if repo_url and "/" in repo_url:
-                owner_repo = repo_url.split("github.com/")[-1].split("/")[:2]
-                if len(owner_repo) == 2:
-                    orpath = "/".join(owner_repo)
-                    (item_dir / "repo_snippets").mkdir(parents=True, exist_ok=True)
-                    rd = fetch_readme(orpath)
-                    if rd:
-                        (item_dir / "repo_snippets" / f"{orpath.replace('/', '_')}_README.md").write_text(rd[:4000], encoding="utf-8")
-                    ch = fetch_changelog(orpath)
-                    if ch:
-                        (item_dir / "repo_snippets" / f"{orpath.replace('/', '_')}_CHANGELOG.md").write_text(ch[:4000], encoding="utf-8")
-
-        # Gate 1 validity
-        evidence, scores = gate1_validate(candidate=c, highlights=highlights, item_dir=item_dir, dry_run=dry_run)
-        if evidence:
-            vault.write_json(item_dir / "evidence.json", evidence)
-        vault.update_scores(item_dir / "item.json", scores)
-
-        # Gate 2 personalization
-        summary_md, scores2 = gate2_personalize(highlights=highlights, profile=profile, candidate=c, item_dir=item_dir, dry_run=dry_run)
-        vault.write_text(item_dir / "summary.md", summary_md)
-        vault.update_scores(item_dir / "item.json", scores2)
-
-        # Classify pillars (heuristic for now) and update views
-        from .classify.pillars import classify_pillars
-        text_for_class = (c.get("title") or "") + "\n" + (" ".join(highlights.get("summary_bullets", [])))[-1:]
-        pillars = classify_pillars(text_for_class, highlights.get("keyphrases", []), pillars_cfg)
-        vault.update_fields(item_dir / "item.json", {"pillars": pillars})
-        # Add to views
-        try:
-            item_meta = json.loads((item_dir / "item.json").read_text(encoding="utf-8"))
-        except Exception:
-            item_meta = {"id": item_id, "title": c.get("title"), "canonical_url": c.get("url"), "published_at": c.get("published_at")}
-        views.add_item_to_pillars(pillars, item_meta)
+def _semantic_novelty(c: Dict, highlights: Dict, novelty_index: NoveltyIndex | None):
+    """(novelty, embedding, similar_items) against the resident vault matrix.
+
+    All None when it can't be scored, so gate1 falls back to its heuristic.
+    """
+    if novelty_index is None:
+        return None, None, None
+    try:
+        vec = create_embedding(novelty_text(c, highlights))
+        nov = compute_semantic_novelty(c, highlights, Path("vault"), index=novelty_index, embedding=vec)
+    except Exception:
+        return None, None, None
+    return nov["novelty_score"], vec, nov["similar_items"]
+
+
+def _classify(c: Dict, highlights: Dict, pillars_cfg: Dict) -> List[str]:
+    from .classify.pillars import classify_pillars
+    text_for_class = (c.get("title") or "") + "\n" + " ".join(highlights.get("summary_bullets", []))
+    return classify_pillars(text_for_class, highlights.get("keyphrases", []), pillars_cfg)
+
 
-        # Update index
-        overall = scores2.get("overall") or scores.get("overall")
+def _index_item(
+    c: Dict,
+    item_id: str,
+    item_dir: Path,
+    data: Dict,
+    scores: Dict,
+    scores2: Dict,
+    index: Index,
+    views: Views,
+    fingerprints: FingerprintIndex,
+    neardup: NearDupIndex | None,
+    state: State,
+):
+    """Record a finished item in views, index, fingerprints and state.
+
+    Safe to repeat for the same item (resumed or re-delivered work).
+    """
+    # Add to views (written once per run by views.flush)
+    views.add_item_to_pillars(data.get("pillars") or [], data)
+
+    # Update index (a resumed item may have been indexed right before the crash)
+    overall = scores2.get("overall") or scores.get("overall")
+    if not index.has_url(c.get("url")):
         index.add(
             item_id=item_id,
             title=c.get("title"),
@@ -232,17 +477,152 @@ def run_ingest(
             drive_path=str(item_dir),
         )
 
-        # Alerts if routed
-        # Alerts intentionally disabled (weekly digest only in MVP)
+    # Alerts if routed
+    # Alerts intentionally disabled (weekly digest only in MVP)
 
-        # Mark as seen
-        state.mark(url=c.get("url"), uid=c.get("_uid"))
-        created_ids.append(item_id)
+    fingerprints.add(c.get("_fp") or candidate_fingerprints(c), item_id)
+    if neardup is not None and c.get("_minhash"):
+        neardup.add(item_id, c["_minhash"])
 
-    # Save state at end
+    # Mark as seen and checkpoint, so a later crash never re-creates this item
+    state.mark(url=c.get("url"), uid=c.get("_uid"))
     state.save()
 
-    return created_ids
+
+def _record_mirror(vault: Vault, item_id: str, c: Dict):
+    """Attach a near-duplicate candidate to the item it duplicates as a mirror."""
+    data = vault.read_json(item_id)
+    if data is None:
+        return
+    mirrors = data.get("mirrors") or []
+    if c.get("url") in {m.get("url") for m in mirrors}:
+        return
+    mirrors.append({"url": c.get("url"), "title": c.get("title"), "source_name": c.get("source_name")})
+    data["mirrors"] = mirrors
+    # the original may live in a packed month
+    vault.write_item_json(item_id, data)
+
+
+def _enrich_sources(
+    c: Dict,
+    links: Dict,
+    item_dir: Path,
+    settings: Dict,
+    vault: Vault,
+    state: State,
+    dry_run: bool = False,
+    prefetch: TranscriptPrefetcher | None = None,
+    profiler: StageProfiler | None = None,
+) -> Dict:
+    """YouTube metadata/transcripts and README/CHANGELOG snippets for an item.
+
+    Returns the item.json fields discovered along the way (links, duration).
+    """
+    profiler = profiler or StageProfiler()
+    fields: Dict = {}
+    # If YouTube, enrich description/links and capture transcript
+    if c.get("source_type") == "youtube":
+        # one yt-dlp extraction per video for metadata, captions and audio
+        yt_info = prefetch.info if prefetch is not None else YouTubeInfoCache()
+        transcripts = TranscriptCache()
+        with profiler.stage("youtube_metadata"):
+            meta = enrich_youtube_metadata(c.get("url"), info_cache=yt_info)
+        if meta:
+            # augment links
+            links = dict(links)
+            links.setdefault("repos", [])
+            links.setdefault("urls", [])
+            links["repos"] = sorted(list(set(links["repos"] + meta.get("extracted_links", {}).get("repos", []))))
+            links["urls"] = sorted(list(set(links["urls"] + meta.get("extracted_links", {}).get("urls", []))))
+            fields["links"] = links
+            if meta.get("duration") is not None:
+                fields["duration_seconds"] = int(meta.get("duration") or 0)
+            # store source description if substantial
+            desc = meta.get("description") or ""
+            if len(desc) > 40:
+                vault.write_text(item_dir / "source.md", desc)
+        # captions-first (prefetched in the background when a prefetcher is given)
+        transcript_started = time.perf_counter()
+        # transcript cache first: a re-ingested video never costs captions or STT minutes again
+        video_id = extract_video_id(c.get("url") or "")
+        cached = transcripts.get(video_id)
+        if cached:
+            segs, used_fallback = cached["segments"], cached.get("source") == "fallback"
+        else:
+            if prefetch is not None:
+                segs = prefetch.captions(c.get("url"))
+            else:
+                segs = fetch_captions_segments(c.get("url"), info=yt_info.get(c.get("url")))
+            transcripts.put(video_id, segs or [], "captions")
+            used_fallback = False
+        if not segs:
+            # consider Whisper fallback if allowed by settings and budget
+            tconf = settings.get("ingest", {}).get("transcripts", {}) or {}
+            dur_sec = (meta.get("duration") or 0) if meta else 0
+            dur_min = float(dur_sec) / 60.0
+            max_min = float(tconf.get("max_whisper_video_minutes", 30))
+            daily_cap = float(tconf.get("daily_whisper_budget_minutes", 240))
+            if dur_min and dur_min <= max_min:
+                date_key = datetime.utcnow().strftime("%Y-%m-%d")
+                if state.can_spend_stt(dur_min, date_key, daily_cap):
+                    from .transcripts.youtube import transcribe_audio
+                    fallback = None if dry_run else transcribe_audio(
+                        c.get("url"),
+                        chunk_seconds=int(tconf.get("chunk_seconds", 600)),
+                        max_workers=int(tconf.get("chunk_workers", 3)),
+                        info=yt_info.get(c.get("url")),
+                    )
+                    if fallback:
+                        # charge the audio actually sent, even if some chunks failed
+                        state.spend_stt(fallback["minutes"], date_key)
+                        if fallback["segments"]:
+                            segs = fallback["segments"]
+                            used_fallback = True
+                            transcripts.put(
+                                video_id, segs, "fallback", model=fallback["model"],
+                                minutes=fallback["minutes"], complete=fallback["complete"],
+                            )
+        if segs:
+            transcript = {"segments": segs, "fallback": used_fallback}
+            if meta and meta.get("chapters"):
+                # gate1 aligns its evidence windows to chapters
+                transcript["chapters"] = [
+                    {"title": ch.get("title"), "start_time": ch.get("start_time"), "end_time": ch.get("end_time")}
+                    for ch in meta["chapters"]
+                ]
+            vault.write_json(item_dir / "transcript.json", transcript)
+        profiler.add("transcripts", time.perf_counter() - transcript_started, items=1 if segs else 0)
+        yt_info.discard(c.get("url"))
+
+        # Fetch repo README/CHANGELOG snippets for top 1-2 repos discovered in description
+        repos = links.get("repos", [])
+        for repo in repos[:2]:
+            with profiler.stage("repo_docs"):
+                _write_repo_snippets(item_dir, repo, vault)
+
+    # If GitHub application or release, add evidence sources
+    if c.get("source_type") == "github":
+        # For releases, store raw description as source.md if present
+        if (c.get("type") == "release") and c.get("raw_description"):
+            vault.write_text(item_dir / "source.md", (c.get("raw_description") or "")[:10000])
+        # For application repos, fetch README/CHANGELOG
+        repo_url = links.get("repo") or (links.get("repos", [None])[0] if links.get("repos") else None)
+        if repo_url and "/" in repo_url:
+            owner_repo = repo_url.split("github.com/")[-1].split("/")[:2]
+            if len(owner_repo) == 2:
+                with profiler.stage("repo_docs"):
+                    _write_repo_snippets(item_dir, "/".join(owner_repo), vault)
+    return fields
+
+
+def _write_repo_snippets(item_dir: Path, owner_repo: str, vault: Vault):
+    (item_dir / "repo_snippets").mkdir(parents=True, exist_ok=True)
+    rd = fetch_readme(owner_repo)
+    if rd:
+        vault.write_text(item_dir / "repo_snippets" / f"{owner_repo.replace('/', '_')}_README.md", rd[:4000])
+    ch = fetch_changelog(owner_repo)
+    if ch:
+        vault.write_text(item_dir / "repo_snippets" / f"{owner_repo.replace('/', '_')}_CHANGELOG.md", ch[:4000])
 
 
 def run_digest(settings: Dict, vault: Vault, index: Index, week: str = "current") -> Path:
@@ -250,16 +630,13 @@ def run_digest(settings: Dict, vault: Vault, index: Index, week: str = "current"
     items = index.top_items(limit=5, days=7)
     lines = ["# Weekly Digest\n"]
     for it in items:
-        item_dir = Path(it["drive_path"]) if it.get("drive_path") else None
         title = it.get("title", "")
         url = it.get("url", "")
         lines.append(f"## {title}\n")
         lines.append(f"Source: {url}\n")
-        try:
-            summary = (item_dir / "summary.md").read_text(encoding="utf-8") if item_dir else ""
-        except Exception:
-            summary = "(summary not found)\n"
-        lines.append(summary)
+        # through the vault, so items already moved into a month pack still resolve
+        summary = vault.read_text(it["item_id"], "summary.md") if it.get("item_id") else None
+        lines.append(summary if summary is not None else "(summary not found)\n")
         lines.append("\n---\n")
 
     out_dir = Path("vault/digests/weekly")
@@ -275,8 +652,7 @@ def run_ingest_url(url: str, settings: Dict, vault: Vault, index: Index, dry_run
     """Ingest a single URL manually. Supports YouTube and GitHub links currently."""
     profile = load_profile()
     pillars_cfg = load_pillars()
-    state = State(Path("vault/state.json"))
-    views = Views(root=Path("vault"))
+    state = _open_state(settings)
 
     # Build minimal candidate
     c: Dict = {"url": url, "manual": True, "links": {}}
@@ -306,92 +682,20 @@ def run_ingest_url(url: str, settings: Dict, vault: Vault, index: Index, dry_run
             "type": "blog",
         })
 
-    # Skip if seen
-    if state.seen(url=url, uid=url):
+    # Skip if seen (directly or as another form of an ingested URL)
+    c["_uid"] = url
+    c["_fp"] = candidate_fingerprints({"url": url})
+    journal = IngestJournal(Path("vault/journal.jsonl"))
+    views = _open_views(settings, journal)
+    fingerprints = FingerprintIndex(Path("vault/fingerprints.db"), index_csv=index.path)
+    if journal.stage(url) < 0 and (state.seen(url=url, uid=url) or fingerprints.lookup(c["_fp"])):
         return ""
 
-    item_id, item_dir = vault.create_item_folder(dt=datetime.utcnow())
-    item = vault.init_item_json(
-        item_id=item_id,
-        title=c.get("title"),
-        canonical_url=c.get("url"),
-        source_type=c.get("source_type"),
-        source_name=c.get("source_name"),
-        published_at=c.get("published_at"),
-        content_type=c.get("type"),
-        links=c.get("links", {}),
+    item_id = _process_candidate(
+        c, settings=settings, vault=vault, index=index, state=state, views=views,
+        journal=journal, fingerprints=fingerprints, profile=profile, pillars_cfg=pillars_cfg, dry_run=dry_run,
+        keyphrases=KeyphraseIndex(Path("vault/keyphrases.db"), vault=vault),
     )
-
-    # Build highlights
-    highlights = build_highlights(candidate=c, dry_run=dry_run)
-    vault.write_json(item_dir / "highlights.json", highlights)
-
-    # Enrichment
-    if c.get("source_type") == "youtube":
-        meta = enrich_youtube_metadata(c.get("url"))
-        if meta:
-            links = item.get("links", {})
-            links.setdefault("repos", [])
-            links.setdefault("urls", [])
-            links["repos"] = sorted(list(set(links["repos"] + meta.get("extracted_links", {}).get("repos", []))))
-            links["urls"] = sorted(list(set(links["urls"] + meta.get("extracted_links", {}).get("urls", []))))
-            extra_fields = {"links": links}
-            if meta.get("duration") is not None:
-                extra_fields["duration_seconds"] = int(meta.get("duration") or 0)
-            vault.update_fields(item_dir / "item.json", extra_fields)
-            desc = meta.get("description") or ""
-            if len(desc) > 40:
-                vault.write_text(item_dir / "source.md", desc)
-        segs = get_transcript_segments(c.get("url"))
-        if segs:
-            vault.write_json(item_dir / "transcript.json", {"segments": segs, "fallback": False})
-
-    if c.get("source_type") == "github" and c.get("links", {}).get("repo"):
-        (item_dir / "repo_snippets").mkdir(parents=True, exist_ok=True)
-        orpath = c.get("links", {}).get("repo").split("github.com/")[-1]
-        rd = fetch_readme(orpath)
-        if rd:
-            (item_dir / "repo_snippets" / f"{orpath.replace('/', '_')}_README.md").write_text(rd[:4000], encoding="utf-8")
-        ch = fetch_changelog(orpath)
-        if ch:
-            (item_dir / "repo_snippets" / f"{orpath.replace('/', '_')}_CHANGELOG.md").write_text(ch[:4000], encoding="utf-8")
-
-    # Gates
-    evidence, scores = gate1_validate(candidate=c, highlights=highlights, item_dir=item_dir, dry_run=dry_run)
-    if evidence:
-        vault.write_json(item_dir / "evidence.json", evidence)
-    vault.update_scores(item_dir / "item.json", scores)
-
-    summary_md, scores2 = gate2_personalize(highlights=highlights, profile=profile, candidate=c, item_dir=item_dir, dry_run=dry_run)
-    vault.write_text(item_dir / "summary.md", summary_md)
-    vault.update_scores(item_dir / "item.json", scores2)
-
-    # Pillars + views
-    from .classify.pillars import classify_pillars
-    text_for_class = (c.get("title") or "") + "\n" + (" ".join(highlights.get("summary_bullets", [])))[-1:]
-    pillars = classify_pillars(text_for_class, highlights.get("keyphrases", []), pillars_cfg)
-    vault.update_fields(item_dir / "item.json", {"pillars": pillars})
-    try:
-        item_meta = json.loads((item_dir / "item.json").read_text(encoding="utf-8"))
-    except Exception:
-        item_meta = {"id": item_id, "title": c.get("title"), "canonical_url": c.get("url"), "published_at": c.get("published_at")}
-    views.add_item_to_pillars(pillars, item_meta)
-
-    # Index
-    overall = scores2.get("overall") or scores.get("overall")
-    index.add(
-        item_id=item_id,
-        title=c.get("title"),
-        url=c.get("url"),
-        source=c.get("source_name"),
-        ctype=c.get("type"),
-        date=c.get("published_at"),
-        scores={**scores, **scores2, "overall": overall},
-        route=scores2.get("route") or scores.get("route") or "weekly",
-        drive_path=str(item_dir),
-    )
-
-    # Mark seen
-    state.mark(url=c.get("url"), uid=c.get("url"))
-    state.save()
+    views.flush()
+    journal.compact()
     return item_id
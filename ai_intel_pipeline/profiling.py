@@ -0,0 +1,101 @@
+"""
+Per-stage wall-time profile of an ingest run.
+
+``run_ingest`` times each stage (fetch per source, dedup, triage, highlights,
+YouTube metadata, transcripts, README/CHANGELOG fetches, novelty, gate1,
+gate2, classification, index/view writes) and writes the totals to
+``vault/status/ingest_profile.json``; every run is also appended to
+``ingest_profile_history.jsonl`` next to it so regressions show up over time.
+"""
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from .storage.atomic import append_text, atomic_write_json
+
+
+PROFILE_PATH = Path("vault/status/ingest_profile.json")
+HISTORY_PATH = Path("vault/status/ingest_profile_history.jsonl")
+
+
+class StageProfiler:
+    """Accumulates wall seconds, calls and items per stage (and per source for ``detail``)."""
+
+    def __init__(self):
+        self.started = datetime.utcnow()
+        self._t0 = time.perf_counter()
+        self.stages: Dict[str, Dict] = {}
+
+    def add(self, name: str, seconds: float, items: int = 1, detail: str | None = None):
+        s = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "items": 0})
+        s["seconds"] += seconds
+        s["calls"] += 1
+        s["items"] += items
+        if detail is not None:
+            d = s.setdefault("detail", {}).setdefault(detail, {"seconds": 0.0, "items": 0})
+            d["seconds"] += seconds
+            d["items"] += items
+
+    @contextmanager
+    def stage(self, name: str, items: int = 1, detail: str | None = None) -> Iterator[Dict]:
+        """Time the block; set ``counter["items"]`` inside it when the count is only known at the end."""
+        counter = {"items": items}
+        t0 = time.perf_counter()
+        try:
+            yield counter
+        finally:
+            self.add(name, time.perf_counter() - t0, counter["items"], detail)
+
+    def to_dict(self, **extra) -> Dict:
+        total = time.perf_counter() - self._t0
+        stages = {}
+        for name, s in sorted(self.stages.items(), key=lambda kv: -kv[1]["seconds"]):
+            out = {
+                "seconds": round(s["seconds"], 3),
+                "calls": s["calls"],
+                "items": s["items"],
+                "share": round(s["seconds"] / total, 3) if total else 0.0,
+            }
+            if s.get("detail"):
+                out["detail"] = {
+                    k: {"seconds": round(v["seconds"], 3), "items": v["items"]}
+                    for k, v in sorted(s["detail"].items(), key=lambda kv: -kv[1]["seconds"])
+                }
+            stages[name] = out
+        return {
+            "started": self.started.isoformat() + "Z",
+            "finished": datetime.utcnow().isoformat() + "Z",
+            "total_seconds": round(total, 3),
+            **extra,
+            "stages": stages,
+        }
+
+    def write(self, path: Path = PROFILE_PATH, history: Path | None = HISTORY_PATH, **extra) -> Dict:
+        data = self.to_dict(**extra)
+        try:
+            atomic_write_json(path, data)
+            if history is not None:
+                # history keeps per-stage seconds only, one line per run
+                slim = {**{k: v for k, v in data.items() if k != "stages"},
+                        "stages": {k: v["seconds"] for k, v in data["stages"].items()}}
+                append_text(history, json.dumps(slim, ensure_ascii=False) + "\n")
+        except Exception:
+            pass
+        return data
+
+
+def load_profile_history(path: Path = HISTORY_PATH, last: int = 30) -> List[Dict]:
+    if not path.exists():
+        return []
+    out = []
+    for line in path.read_text(encoding="utf-8").splitlines()[-last:]:
+        try:
+            out.append(json.loads(line))
+        except Exception:
+            continue
+    return out
@@ -0,0 +1,105 @@
+"""
+Token budgets for gate prompts.
+
+Tokens are counted with tiktoken when it is installed, else estimated at
+~4 characters per token (close enough for JSON-heavy English prompts).
+Gates build their full payload, then compact it until it fits the budget
+from ``settings.llm.budgets``: evidence is dropped or shortened least
+relevant first, other fields by the gate's own shrink steps.
+"""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Dict, List, Sequence
+
+from .gates.evidence import BM25
+
+
+# Input token budgets (system + user) when settings don't set one
+DEFAULT_BUDGETS = {"gate1": 1500, "gate2": 1200}
+
+_ENCODER: Any = False
+
+
+def _encoder():
+    global _ENCODER
+    if _ENCODER is False:
+        try:
+            import tiktoken
+
+            _ENCODER = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _ENCODER = None
+    return _ENCODER
+
+
+def _text(obj: Any) -> str:
+    return obj if isinstance(obj, str) else json.dumps(obj, ensure_ascii=False)
+
+
+def estimate_tokens(obj: Any) -> int:
+    """Tokens in ``obj`` (a string, or anything sent as JSON)."""
+    text = _text(obj)
+    enc = _encoder()
+    if enc is not None:
+        return len(enc.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def truncate_tokens(text: str, tokens: int) -> str:
+    enc = _encoder()
+    if enc is not None:
+        ids = enc.encode(text)
+        return text if len(ids) <= tokens else enc.decode(ids[:tokens])
+    return text[: max(0, tokens) * 4]
+
+
+def gate_budget(settings: Dict | None, gate: str) -> int:
+    budgets = ((settings or {}).get("llm", {}) or {}).get("budgets") or {}
+    return int(budgets.get(gate) or DEFAULT_BUDGETS.get(gate, 1500))
+
+
+def fit_evidence(snippets: Dict[str, List[Dict]], queries: Sequence[str], budget: int, min_quote_tokens: int = 40) -> Dict[str, List[Dict]]:
+    """Keep the snippets most relevant to ``queries`` within ``budget`` tokens.
+
+    Snippets (``{kind: [{..., "quote"}]}``) are ranked by BM25 against all
+    queries; one that no longer fits is shortened if at least
+    ``min_quote_tokens`` remain, else skipped. Kept snippets stay in their
+    original order.
+    """
+    entries = [(kind, i, s) for kind, items in snippets.items() for i, s in enumerate(items)]
+    if not entries:
+        return snippets
+    index = BM25([str(s.get("quote") or "") for _, _, s in entries])
+    relevance = [0.0] * len(entries)
+    for q in queries:
+        for j, sc in enumerate(index.scores(q)):
+            relevance[j] += sc
+    order = sorted(range(len(entries)), key=lambda j: -relevance[j])
+    keep: Dict[int, Dict] = {}
+    used = 0
+    for j in order:
+        kind, i, s = entries[j]
+        cost = estimate_tokens(s)
+        if used + cost <= budget:
+            keep[j] = s
+            used += cost
+            continue
+        room = budget - used - (cost - estimate_tokens(str(s.get("quote") or "")))
+        if room >= min_quote_tokens:
+            keep[j] = {**s, "quote": truncate_tokens(str(s.get("quote") or ""), room)}
+            used += estimate_tokens(keep[j])
+    out: Dict[str, List[Dict]] = {kind: [] for kind in snippets}
+    for j in sorted(keep):
+        out[entries[j][0]].append(keep[j])
+    return out
+
+
+def shrink_until(payload: Dict, budget: int, steps: Sequence[Callable[[Dict], None]], fixed_tokens: int = 0) -> Dict:
+    """Apply ``steps`` (each mutating ``payload``) in order until it fits ``budget``."""
+    for step in steps:
+        if fixed_tokens + estimate_tokens(payload) <= budget:
+            break
+        step(payload)
+    return payload
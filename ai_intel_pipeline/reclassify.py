@@ -0,0 +1,137 @@
+"""
+Re-apply the current pillars config and policy weights to every vault item.
+
+Recomputes ``pillars`` and the heuristic scores (source credibility, triage
+score) of existing items, then rebuilds the pillar views and the index in a
+single pass. LLM gate scores are left as they are.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .classify.pillars import classify_pillars
+from .classify.triage import triage_score
+from .config import load_pillars, load_policy, load_profile, load_settings
+from .gates.gate1_validity import source_credibility
+from .storage.index import Index
+from .storage.vault import Vault
+from .storage.views import Views
+
+
+_ctx: Dict = {}
+
+
+def _init_worker(vault_root: str, pillars_cfg: Dict, profile: Dict, policy: Dict, half_life_days: float, dry_run: bool):
+    _ctx.update(
+        vault=Vault(Path(vault_root)), pillars_cfg=pillars_cfg, profile=profile, policy=policy,
+        half_life_days=half_life_days, dry_run=dry_run,
+    )
+
+
+def _reclassify_one(item_id: str) -> Optional[Dict]:
+    vault: Vault = _ctx["vault"]
+    data = vault.read_json(item_id)
+    if data is None:
+        return None
+    highlights = vault.read_json(item_id, "highlights.json") or {}
+
+    text = (data.get("title") or "") + "\n" + " ".join(highlights.get("summary_bullets", []))
+    pillars = classify_pillars(text, highlights.get("keyphrases", []), _ctx["pillars_cfg"])
+    candidate = {
+        "title": data.get("title"),
+        "raw_description": " ".join(highlights.get("summary_bullets", [])),
+        "source_name": data.get("source_name"),
+        "type": data.get("type"),
+        "published_at": data.get("published_at"),
+    }
+    scores = dict(data.get("scores") or {})
+    scores["credibility"] = source_credibility(candidate)
+    # recency as of ingest time (encoded in the item id), so only config changes move the score
+    try:
+        ingested = datetime.strptime(item_id[:13], "%Y%m%d-%H%M").replace(tzinfo=timezone.utc)
+    except ValueError:
+        ingested = None
+    triage = triage_score(
+        candidate, _ctx["profile"], _ctx["pillars_cfg"], _ctx["policy"], _ctx["half_life_days"], now=ingested
+    )["score"]
+
+    old = {"pillars": data.get("pillars") or [], "credibility": (data.get("scores") or {}).get("credibility"), "triage": data.get("triage_score")}
+    new = {"pillars": pillars, "credibility": scores["credibility"], "triage": triage}
+    changed = old != new
+    if changed and not _ctx["dry_run"]:
+        data.update({"pillars": pillars, "scores": scores, "triage_score": triage})
+        vault.write_item_json(item_id, data)
+    return {
+        "id": data.get("id") or item_id,
+        "title": data.get("title"),
+        "url": data.get("canonical_url"),
+        "date": data.get("published_at"),
+        "old": old,
+        "new": new,
+        "changed": changed,
+    }
+
+
+def reclassify_vault(
+    vault_root: Path,
+    index: Index,
+    views: Views,
+    dry_run: bool = False,
+    workers: int | None = None,
+    on_change=None,
+) -> Dict:
+    """Reclassify every item in parallel; rebuild views and index once at the end.
+
+    ``on_change(result)`` is called for each item whose pillars or scores change.
+    Returns counts and throughput.
+    """
+    settings = load_settings()
+    half_life = float(((settings.get("ingest", {}) or {}).get("triage") or {}).get("half_life_days", 7))
+    init = (str(vault_root), load_pillars(), load_profile(), load_policy(), half_life, dry_run)
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    results: List[Dict] = []
+    item_ids = Vault(vault_root).item_ids()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init) as ex:
+            for r in ex.map(_reclassify_one, item_ids, chunksize=64):
+                if r:
+                    results.append(r)
+                    if r["changed"] and on_change:
+                        on_change(r)
+    else:
+        _init_worker(*init)
+        for item_id in item_ids:
+            r = _reclassify_one(item_id)
+            if r:
+                results.append(r)
+                if r["changed"] and on_change:
+                    on_change(r)
+
+    changed = [r for r in results if r["changed"]]
+    if changed and not dry_run:
+        by_pillar: Dict[str, List[Dict]] = {}
+        for r in results:
+            for p in r["new"]["pillars"]:
+                by_pillar.setdefault(p, []).append({"id": r["id"], "title": r["title"], "url": r["url"], "date": r["date"]})
+        views.replace_all(by_pillar)
+        cred = {r["id"]: r["new"]["credibility"] for r in changed}
+        rows = index.rows()
+        for row in rows:
+            if row.get("item_id") in cred:
+                row["credibility"] = f"{cred[row['item_id']]:.3f}"
+        index.rewrite(rows)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "items": len(results),
+        "changed": len(changed),
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(len(results) / elapsed, 1) if elapsed else 0.0,
+    }
@@ -7,7 +7,10 @@ from datetime import datetime, timezone
 import shutil
 from pathlib import Path
 from typing import Dict, List
+from . import llm_metrics
+from .profiling import PROFILE_PATH, load_profile_history
 from .model.recommend import recommend as rec_top
+from .storage.vault import Vault
 
 
 def _safe_read_json(path: Path):
@@ -22,8 +25,8 @@ def generate_status(vault_root: Path, index_csv: Path) -> Dict:
     if index_csv.exists():
         with index_csv.open("r", encoding="utf-8") as f:
             idx_rows = list(csv.DictReader(f))
-    items_dir = vault_root / "items"
-    item_folders = [p for p in items_dir.rglob("*") if p.is_dir() and (p / "item.json").exists()]
+    vault = Vault(vault_root)
+    item_ids = list(vault.item_ids())
 
     source_counts: Dict[str, int] = {}
     type_counts: Dict[str, int] = {}
@@ -34,8 +37,8 @@ def generate_status(vault_root: Path, index_csv: Path) -> Dict:
     transcripts = 0
     transcripts_fallback = 0
 
-    for folder in item_folders:
-        item = _safe_read_json(folder / "item.json") or {}
+    for item_id in item_ids:
+        item = vault.read_json(item_id) or {}
         src = item.get("source_type", "unknown")
         typ = item.get("type", "unknown")
         source_counts[src] = source_counts.get(src, 0) + 1
@@ -43,7 +46,7 @@ def generate_status(vault_root: Path, index_csv: Path) -> Dict:
         for p in item.get("pillars", []) or []:
             pillar_counts[p] = pillar_counts.get(p, 0) + 1
 
-        ev = _safe_read_json(folder / "evidence.json") or {}
+        ev = vault.read_json(item_id, "evidence.json") or {}
         verdict = (ev.get("verdict") or "").lower()
         if verdict == "pass":
             ev_pass += 1
@@ -56,7 +59,7 @@ def generate_status(vault_root: Path, index_csv: Path) -> Dict:
         except Exception:
             pass
 
-        tr = _safe_read_json(folder / "transcript.json")
+        tr = vault.read_json(item_id, "transcript.json")
         if tr:
             transcripts += 1
             if tr.get("fallback"):
@@ -83,7 +86,7 @@ def generate_status(vault_root: Path, index_csv: Path) -> Dict:
 
     data = {
         "counts": {
-            "items": len(item_folders),
+            "items": len(item_ids),
             "evidence": ev_pass + ev_fail,
             "evidence_pass": ev_pass,
             "evidence_fail": ev_fail,
@@ -103,14 +106,13 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
     data = generate_status(vault_root, index_csv)
     out_dir = vault_root / "status"
     out_dir.mkdir(parents=True, exist_ok=True)
+    vault = Vault(vault_root)
     # Augment with recommendations for consumers, enriched with TL;DR and apply steps
     def _enrich_summary(item_id: str) -> Dict:
-        month = f"{item_id[:4]}-{item_id[4:6]}"
-        s_path = out_dir.parent / "items" / month / item_id / "summary.md"
         out = {"tldr": "", "apply_steps": [], "why": "", "pillars": [], "source": "", "source_type": "", "type": "", "date": ""}
         try:
-            if s_path.exists():
-                txt = s_path.read_text(encoding="utf-8")
+            txt = vault.read_text(item_id, "summary.md")
+            if txt is not None:
                 lines = [l.rstrip() for l in txt.splitlines()]
                 def _extract(name: str) -> str:
                     if name in lines:
@@ -128,9 +130,8 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
         except Exception:
             pass
         try:
-            j_path = out_dir.parent / "items" / month / item_id / "item.json"
-            if j_path.exists():
-                meta = json.loads(j_path.read_text(encoding="utf-8"))
+            meta = vault.read_json(item_id)
+            if meta:
                 out["pillars"] = meta.get("pillars") or []
                 out["source_type"] = meta.get("source_type") or ""
                 out["type"] = meta.get("type") or ""
@@ -195,10 +196,6 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
     # Derive daily history buckets (items, pass_rate, avg_conf where available)
     try:
         day_stats = {}
-        items_root = vault_root / 'items'
-        for day_dir in items_root.rglob('*'):
-            if not day_dir.is_dir():
-                continue
         # Use items.json to build per-day counts quickly
         _items_text = (out_dir / 'items.json').read_text(encoding='utf-8')
         _items = json.loads(_items_text) if _items_text else []
@@ -224,6 +221,18 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
             data['model_index'] = {'doc_count': 0, 'last_built_ts': None}
     except Exception:
         data['model_index'] = {'doc_count': 0, 'last_built_ts': None}
+    # LLM call metrics (last 30 days) plus a Prometheus export of the cumulative counters
+    try:
+        data['llm_metrics'] = {'window_days': 30, 'stages': llm_metrics.summarize(days=30)}
+        llm_metrics.write_prometheus(out_dir / 'llm_metrics.prom')
+    except Exception:
+        data['llm_metrics'] = {'window_days': 30, 'stages': {}}
+    # Latest ingest stage profile and per-stage seconds of recent runs
+    data['ingest_profile'] = _safe_read_json(PROFILE_PATH)
+    try:
+        data['ingest_profile_history'] = load_profile_history(last=30)
+    except Exception:
+        data['ingest_profile_history'] = []
     (out_dir / "report.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
     # Surface useful artifacts alongside the dashboard when available
     try:
@@ -399,7 +408,8 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
             <div id="healthLastRun" class="mb-1 text-gray-300">Last run: -</div>
             <div id="healthItems" class="mb-1 text-gray-300">Items: -</div>
             <div id="healthPassRate" class="mb-1 text-gray-300">Pass rate: -</div>
-            <div id="healthRuns30d" class="text-gray-300">Runs (30d): -</div>
+            <div id="healthRuns30d" class="mb-1 text-gray-300">Runs (30d): -</div>
+            <div id="healthStages" class="text-xs text-gray-400"></div>
           </div>
         </div>
       </aside>
@@ -534,7 +544,7 @@ def write_report(vault_root: Path, index_csv: Path) -> Path:
 
       function renderCharts(rep){ const sL = Object.keys(rep.by_source), sV = Object.values(rep.by_source); const tL = Object.keys(rep.by_type), tV = Object.values(rep.by_type); const pL = Object.keys(rep.pillars), pV = Object.values(rep.pillars); barChart(document.getElementById('chartSource'), sL, sV); barChart(document.getElementById('chartType'), tL, tV); barChart(document.getElementById('chartPillars'), pL, pV); }
 
-      function updateHealth(rep, hist){ try { const c = rep.counts||{}; const last = (hist&&hist.length)? hist[hist.length-1] : null; const runs30 = (hist||[]).filter(h => dayjs(h.ts).isAfter(dayjs().subtract(30,'day'))).length; const items = c.items || 0; const pass = c.evidence_pass || 0; const ev = (c.evidence !== undefined) ? c.evidence : ((c.evidence_pass||0)+(c.evidence_fail||0)); const passRate = ev ? (pass/ev) : 0; const set=(id,txt)=>{ const el=document.getElementById(id); if(el) el.textContent = txt; }; set('healthItems', `Items: ${items}`); set('healthPassRate', `Pass rate: ${(passRate*100).toFixed(1)}%`); set('healthRuns30d', `Runs (30d): ${runs30}`); const lr = document.getElementById('healthLastRun'); if(lr){ if(last){ const lu = new Date(last.ts).toLocaleString(); const run = last.run_url ? ' - ' + `<a target='_blank' href='${last.run_url}'>run</a>` : ''; const status = last.status ? ` (${last.status})` : ''; lr.innerHTML = `Last run: ${lu}${status}${run}`; } else { lr.textContent = 'Last run: —'; } } } catch(e){} }).sort((a,b)=>b[1]-a[1]).slice(0,10);
+      function updateHealth(rep, hist){ try { const c = rep.counts||{}; const last = (hist&&hist.length)? hist[hist.length-1] : null; const runs30 = (hist||[]).filter(h => dayjs(h.ts).isAfter(dayjs().subtract(30,'day'))).length; const items = c.items || 0; const pass = c.evidence_pass || 0; const ev = (c.evidence !== undefined) ? c.evidence : ((c.evidence_pass||0)+(c.evidence_fail||0)); const passRate = ev ? (pass/ev) : 0; const set=(id,txt)=>{ const el=document.getElementById(id); if(el) el.textContent = txt; }; set('healthItems', `Items: ${items}`); set('healthPassRate', `Pass rate: ${(passRate*100).toFixed(1)}%`); set('healthRuns30d', `Runs (30d): ${runs30}`); const ip = rep.ingest_profile; if(ip && ip.stages){ const top = Object.entries(ip.stages).slice(0,3).map(([k,v])=>`${k} ${v.seconds.toFixed(1)}s`).join(', '); set('healthStages', `Last ingest ${ip.total_seconds.toFixed(1)}s: ${top}`); } const lr = document.getElementById('healthLastRun'); if(lr){ if(last){ const lu = new Date(last.ts).toLocaleString(); const run = last.run_url ? ' - ' + `<a target='_blank' href='${last.run_url}'>run</a>` : ''; const status = last.status ? ` (${last.status})` : ''; lr.innerHTML = `Last run: ${lu}${status}${run}`; } else { lr.textContent = 'Last run: —'; } } } catch(e){} }).sort((a,b)=>b[1]-a[1]).slice(0,10);
             sP.innerHTML = pillars.map(([k,v])=>`<a class='sidebar-link' href='items.html?pillar=${encodeURIComponent(k)}&days=30'>${k} <span class="text-gray-500">(${v})</span></a>`).join('');
           }
           if (sS) {
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Set
+
+
+# Batched fsync state: while a batch is open, writes are still atomic (temp file
+# + rename) but their fsyncs are deferred and issued together on flush.
+_lock = threading.Lock()
+_batch_depth = 0
+_pending: Set[Path] = set()
+_max_pending = 256
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def _fsync_dir(path: Path):
+    # Directory fsync makes the rename itself durable; not supported on Windows.
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: Path):
+    try:
+        with path.open("rb+") as f:
+            os.fsync(f.fileno())
+    except OSError:
+        pass
+
+
+def _after_write(path: Path) -> bool:
+    """Register ``path`` with an open batch. Returns False when not batching."""
+    with _lock:
+        if not _batch_depth:
+            return False
+        _pending.add(path)
+        full = len(_pending) >= _max_pending
+    if full:
+        flush_pending()
+    return True
+
+
+def flush_pending():
+    """fsync every file written during the current batch, then their directories."""
+    with _lock:
+        paths = list(_pending)
+        _pending.clear()
+    for p in paths:
+        _fsync_file(p)
+    for d in {p.parent for p in paths}:
+        _fsync_dir(d)
+
+
+@contextmanager
+def batched_fsync(max_pending: int = 256) -> Iterator[None]:
+    """Defer fsyncs for all atomic writes inside the block.
+
+    Each file is still replaced atomically, so a crashed process never leaves a
+    truncated file; only durability across power loss is delayed until the
+    batch flushes (every ``max_pending`` files and on exit).
+    """
+    global _batch_depth, _max_pending
+    with _lock:
+        _batch_depth += 1
+        _max_pending = max(1, int(max_pending))
+    try:
+        yield
+    finally:
+        with _lock:
+            _batch_depth -= 1
+            last = _batch_depth == 0
+        if last:
+            flush_pending()
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for a rewrite of ``path``: the existing file's, else what ``open()`` would create."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_umask
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write ``data`` to ``path`` via temp file, fsync and rename.
+
+    The temp file (created 0600 by ``mkstemp``) gets the target's mode first,
+    so other readers of the vault (web UI, another user) keep access.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _file_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            if not _batch_depth:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if not _after_write(path):
+        _fsync_dir(path.parent)
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8"):
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_json(path: Path, data: Any, indent: int | None = 2, ensure_ascii: bool = True):
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=ensure_ascii))
+
+
+def append_text(path: Path, text: str, encoding: str = "utf-8"):
+    """Append ``text`` and fsync (deferred while a batch is open)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding=encoding, newline="") as f:
+        f.write(text)
+        f.flush()
+        if not _batch_depth:
+            os.fsync(f.fileno())
+    _after_write(path)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import csv
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .sqlite import connect
+from ..utils.canonical import candidate_fingerprints
+
+
+class FingerprintIndex:
+    """Cross-source dedup keys (canonical URL, host-scoped title hash) mapped to item ids.
+
+    Checked before any enrichment so the same content arriving through another
+    feed, URL form or tracking link never reaches transcripts or the LLM gates.
+    On first open it is seeded from ``index.csv`` when given.
+    """
+
+    def __init__(self, path: Path, index_csv: Path | None = None):
+        self.path = path
+        fresh = not path.exists()
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints (key TEXT PRIMARY KEY, item_id TEXT NOT NULL, ts INTEGER NOT NULL) WITHOUT ROWID"
+        )
+        if fresh and index_csv is not None and index_csv.exists():
+            self._seed(index_csv)
+
+    def _seed(self, index_csv: Path):
+        with index_csv.open("r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        now = int(time.time())
+        with self._conn:
+            for r in rows:
+                keys = candidate_fingerprints({"url": r.get("url"), "title": r.get("title"), "published_at": r.get("date")})
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO fingerprints (key, item_id, ts) VALUES (?, ?, ?)",
+                    [(k, r.get("item_id") or "", now) for k in keys],
+                )
+
+    def lookup(self, keys: Iterable[str]) -> Optional[str]:
+        """Item id already holding any of ``keys``, else None."""
+        for k in keys:
+            row = self._conn.execute("SELECT item_id FROM fingerprints WHERE key = ?", (k,)).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    def add(self, keys: Iterable[str], item_id: str):
+        now = int(time.time())
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO fingerprints (key, item_id, ts) VALUES (?, ?, ?)",
+                [(k, item_id, now) for k in keys],
+            )
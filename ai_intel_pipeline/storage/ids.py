@@ -0,0 +1,46 @@
+"""
+Item ids: ``YYYYMMDD-HHMM-`` (UTC) followed by a ULID-style suffix.
+
+The suffix is the millisecond within the minute (4 chars) plus 50 random bits
+(10 chars), in lowercase Crockford base32, so ids sort by creation time and
+ids from different processes or machines do not collide. Within a process
+ids are monotonic: several ids in the same millisecond increment the random
+part instead of drawing a new one.
+"""
+from __future__ import annotations
+
+import secrets
+import threading
+from datetime import datetime
+
+# Crockford base32 (no i, l, o, u); ASCII order matches numeric order
+_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+_RANDOM_BITS = 50
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_rand = 0
+
+
+def _b32(n: int, width: int) -> str:
+    out = []
+    for _ in range(width):
+        n, r = divmod(n, 32)
+        out.append(_ALPHABET[r])
+    return "".join(reversed(out))
+
+
+def new_item_id(dt: datetime | None = None) -> str:
+    global _last_ms, _last_rand
+    dt = dt or datetime.utcnow()
+    ms = int(dt.timestamp() * 1000) if dt.tzinfo else int((dt - datetime(1970, 1, 1)).total_seconds() * 1000)
+    with _lock:
+        if ms == _last_ms and _last_rand + 1 < (1 << _RANDOM_BITS):
+            # same millisecond: stay sortable after the previous id
+            rand = _last_rand + 1
+        else:
+            rand = secrets.randbits(_RANDOM_BITS)
+        _last_ms, _last_rand = ms, rand
+    minute_ms = ms % 60000
+    prefix_dt = datetime.utcfromtimestamp((ms - minute_ms) / 1000)
+    return prefix_dt.strftime("%Y%m%d-%H%M-") + _b32(minute_ms, 4) + _b32(rand, _RANDOM_BITS // 5)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import csv
+import io
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime, timedelta
 
+from .atomic import append_text, atomic_write_text
+
 
 CSV_HEADERS = [
     "item_id",
@@ -28,10 +31,9 @@ class Index:
     def __init__(self, index_path: Path):
         self.path = index_path
         if not self.path.exists():
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            with self.path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(CSV_HEADERS)
+            buf = io.StringIO()
+            csv.writer(buf).writerow(CSV_HEADERS)
+            atomic_write_text(self.path, buf.getvalue())
 
     def has_url(self, url: str) -> bool:
         with self.path.open("r", encoding="utf-8") as f:
@@ -41,6 +43,18 @@ class Index:
                     return True
         return False
 
+    def rows(self) -> List[Dict]:
+        with self.path.open("r", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def rewrite(self, rows: List[Dict]) -> None:
+        """Replace the whole index in one atomic write."""
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=CSV_HEADERS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+        atomic_write_text(self.path, buf.getvalue())
+
     def add(
         self,
         item_id: str,
@@ -69,9 +83,10 @@ class Index:
             route,
             drive_path,
         ]
-        with self.path.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        buf = io.StringIO()
+        csv.writer(buf).writerow(row)
+        # one write per row, so an interrupted append can only tear the last line
+        append_text(self.path, buf.getvalue())
 
     def top_items(self, limit: int = 5, days: int = 7) -> List[Dict]:
         cutoff = datetime.utcnow() - timedelta(days=days)
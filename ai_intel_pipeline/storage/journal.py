@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+from .atomic import append_text, atomic_write_text
+
+
+# Ordered ingest stages; an item is finished once it reaches the last one.
+STAGES = ["created", "highlights", "transcript", "gate1", "gate2", "indexed"]
+
+
+def stage_rank(stage: str | None) -> int:
+    """Position of ``stage`` in STAGES (-1 when unknown or not started)."""
+    try:
+        return STAGES.index(stage or "")
+    except ValueError:
+        return -1
+
+
+class IngestJournal:
+    """Write-ahead log of per-item ingest progress.
+
+    Every finished stage is appended as one JSON line and flushed to disk before
+    the pipeline moves on, so a crashed run can resume partially processed items
+    from their last completed stage instead of re-creating them. Each resume
+    counts as another attempt; an item that keeps crashing is left alone once
+    it reaches ``max_attempts``.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                except Exception:
+                    # torn final line from a crash mid-append
+                    continue
+                uid = rec.get("uid")
+                if not uid:
+                    continue
+                self.entries.setdefault(uid, {}).update(rec)
+
+    def record(self, uid: str, stage: str, **data) -> Dict:
+        rec = {"uid": uid, "stage": stage, "ts": datetime.utcnow().isoformat() + "Z", **data}
+        append_text(self.path, json.dumps(rec, ensure_ascii=False) + "\n")
+        entry = self.entries.setdefault(uid, {})
+        entry.update(rec)
+        return entry
+
+    def get(self, uid: str | None) -> Dict:
+        return self.entries.get(uid or "", {})
+
+    def stage(self, uid: str | None) -> int:
+        return stage_rank(self.get(uid).get("stage"))
+
+    def retry(self, uid: str) -> int:
+        """Count another attempt at an unfinished entry; returns the new attempt count."""
+        entry = self.get(uid)
+        attempts = int(entry.get("attempts") or 1) + 1
+        self.record(uid, entry.get("stage"), attempts=attempts)
+        return attempts
+
+    def pending(self, max_attempts: int | None = None) -> List[Dict]:
+        """Entries that were started but never reached the final stage.
+
+        With ``max_attempts`` only those tried fewer times than that.
+        """
+        last = len(STAGES) - 1
+        return [
+            e for e in self.entries.values()
+            if stage_rank(e.get("stage")) < last and e.get("candidate")
+            and (max_attempts is None or int(e.get("attempts") or 1) < max_attempts)
+        ]
+
+    def failed(self, max_attempts: int) -> List[Dict]:
+        """Unfinished entries that used up their attempts; they stay journaled but are not resumed."""
+        return [e for e in self.pending() if int(e.get("attempts") or 1) >= max_attempts]
+
+    def finished(self) -> List[Dict]:
+        """Entries that reached the final stage but were not compacted away yet."""
+        last = len(STAGES) - 1
+        return [e for e in self.entries.values() if stage_rank(e.get("stage")) == last]
+
+    def compact(self):
+        """Rewrite the journal keeping only unfinished items."""
+        keep = self.pending()
+        atomic_write_text(self.path, "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in keep))
+        self.entries = {e["uid"]: e for e in keep}
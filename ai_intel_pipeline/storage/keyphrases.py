@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from .sqlite import connect
+from .vault import Vault
+
+
+def _norm(phrase: str) -> str:
+    return " ".join((phrase or "").split()).lower()
+
+
+def _item_ts(item_id: str) -> int:
+    """Creation time encoded in an item id (``YYYYMMDD-HHMM-...``, UTC), else now."""
+    try:
+        return int(datetime.strptime(item_id[:13], "%Y%m%d-%H%M").replace(tzinfo=timezone.utc).timestamp())
+    except ValueError:
+        return int(time.time())
+
+
+class KeyphraseIndex:
+    """Keyphrase vocabulary (``vault/keyphrases.db``): counts, first/last seen and item ids.
+
+    Updated as highlights are written, so new-vs-known checks are one lookup
+    per keyphrase instead of a scan of every ``highlights.json``. On first open
+    it is seeded from the existing highlights of ``vault`` when given.
+    """
+
+    def __init__(self, path: Path, vault: Vault | None = None):
+        self.path = path
+        fresh = not path.exists()
+        self._conn = connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS keyphrases (
+                key TEXT PRIMARY KEY, phrase TEXT NOT NULL, count INTEGER NOT NULL,
+                first_seen INTEGER NOT NULL, last_seen INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS keyphrase_items (
+                key TEXT NOT NULL, item_id TEXT NOT NULL, ts INTEGER NOT NULL, PRIMARY KEY (key, item_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS keyphrase_items_ts ON keyphrase_items (ts);
+            """
+        )
+        if fresh and vault is not None:
+            self._seed(vault)
+
+    def _seed(self, vault: Vault):
+        for item_id in vault.item_ids():
+            hl = vault.read_json(item_id, "highlights.json")
+            if hl:
+                self.add(item_id, hl.get("keyphrases", []), ts=_item_ts(item_id))
+
+    def add(self, item_id: str, keyphrases: Iterable[str], ts: int | None = None):
+        """Record an item's keyphrases; re-adding the same item is a no-op."""
+        ts = int(ts or time.time())
+        with self._conn:
+            for phrase in keyphrases:
+                key = _norm(phrase)
+                if not key:
+                    continue
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO keyphrase_items (key, item_id, ts) VALUES (?, ?, ?)", (key, item_id, ts)
+                )
+                if not cur.rowcount:
+                    continue
+                self._conn.execute(
+                    "INSERT INTO keyphrases (key, phrase, count, first_seen, last_seen) VALUES (?, ?, 1, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET count = count + 1, "
+                    "first_seen = MIN(first_seen, excluded.first_seen), last_seen = MAX(last_seen, excluded.last_seen)",
+                    (key, phrase.strip(), ts, ts),
+                )
+
+    def known(self, keyphrases: Iterable[str]) -> Set[str]:
+        """The subset of ``keyphrases`` already in the vocabulary."""
+        return {
+            kp for kp in keyphrases
+            if self._conn.execute("SELECT 1 FROM keyphrases WHERE key = ?", (_norm(kp),)).fetchone()
+        }
+
+    def get(self, phrase: str) -> Dict | None:
+        key = _norm(phrase)
+        row = self._conn.execute("SELECT phrase, count, first_seen, last_seen FROM keyphrases WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        items = [r[0] for r in self._conn.execute("SELECT item_id FROM keyphrase_items WHERE key = ? ORDER BY ts", (key,))]
+        return {"phrase": row[0], "count": row[1], "first_seen": row[2], "last_seen": row[3], "item_ids": items}
+
+    def trending(self, days: int = 7, limit: int = 20, now: int | None = None) -> List[Dict]:
+        """Keyphrases ranked by item count in the last ``days``, with the previous window for growth."""
+        now = int(now or time.time())
+        start, prev = now - days * 86400, now - 2 * days * 86400
+        rows = self._conn.execute(
+            """
+            SELECT k.phrase, k.first_seen,
+                   SUM(i.ts >= ?) AS recent, SUM(i.ts < ?) AS previous
+            FROM keyphrase_items i JOIN keyphrases k ON k.key = i.key
+            WHERE i.ts >= ? AND i.ts <= ?
+            GROUP BY i.key HAVING recent > 0
+            ORDER BY recent DESC, previous ASC, k.phrase
+            LIMIT ?
+            """,
+            (start, start, prev, now, limit),
+        ).fetchall()
+        return [
+            {"phrase": p, "count": r, "previous": pv, "new": first >= start} for p, first, r, pv in rows
+        ]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from .sqlite import connect
+
+
+class MonthPack:
+    """All files of one month's items in a single SQLite file (``packs/YYYY-MM.db``).
+
+    Each row is one item file (``item.json``, ``highlights.json``, ``summary.md``,
+    ``repo_snippets/...``) stored zlib-compressed; the (item_id, name) primary
+    key doubles as the item-id lookup index.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files (item_id TEXT NOT NULL, name TEXT NOT NULL, data BLOB NOT NULL, "
+            "PRIMARY KEY (item_id, name)) WITHOUT ROWID"
+        )
+
+    def item_ids(self) -> List[str]:
+        return [r[0] for r in self._conn.execute("SELECT DISTINCT item_id FROM files ORDER BY item_id")]
+
+    def has(self, item_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM files WHERE item_id = ? LIMIT 1", (item_id,)).fetchone() is not None
+
+    def names(self, item_id: str) -> List[str]:
+        return [r[0] for r in self._conn.execute("SELECT name FROM files WHERE item_id = ? ORDER BY name", (item_id,))]
+
+    def read(self, item_id: str, name: str) -> bytes | None:
+        row = self._conn.execute("SELECT data FROM files WHERE item_id = ? AND name = ?", (item_id, name)).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def write(self, item_id: str, name: str, data: bytes):
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (item_id, name, data) VALUES (?, ?, ?)", (item_id, name, zlib.compress(data, 6))
+            )
+
+    def add_item_dir(self, item_id: str, item_dir: Path):
+        """Copy every file under ``item_dir`` into the pack in one transaction."""
+        rows = [
+            (item_id, f.relative_to(item_dir).as_posix(), zlib.compress(f.read_bytes(), 6))
+            for f in sorted(item_dir.rglob("*"))
+            if f.is_file()
+        ]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO files (item_id, name, data) VALUES (?, ?, ?)", rows)
+
+    def files(self, item_id: str) -> Iterator[tuple]:
+        for name, data in self._conn.execute("SELECT name, data FROM files WHERE item_id = ?", (item_id,)):
+            yield name, zlib.decompress(data)
+
+    def delete(self, item_id: str):
+        with self._conn:
+            self._conn.execute("DELETE FROM files WHERE item_id = ?", (item_id,))
+
+    def close(self):
+        self._conn.close()
+
+
+def month_of(item_id: str) -> str:
+    """``YYYY-MM`` shard of an item id (ids start with ``YYYYMMDD``)."""
+    return f"{item_id[:4]}-{item_id[4:6]}"
+
+
+def open_packs(packs_dir: Path, cache: Dict[str, MonthPack], month: str, create: bool = False) -> MonthPack | None:
+    pack = cache.get(month)
+    if pack is None:
+        path = packs_dir / f"{month}.db"
+        if not create and not path.exists():
+            return None
+        pack = cache[month] = MonthPack(path)
+    return pack
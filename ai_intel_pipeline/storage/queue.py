@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Protocol
+
+from .sqlite import connect
+
+
+# A claimed queue entry: id, topic, key, payload, attempts, worker
+Task = Dict
+
+
+class WorkQueue(Protocol):
+    """Topic-based work queue with leases, shared by ingest workers.
+
+    A claimed task is leased to one worker; if the worker dies the lease
+    expires and the task is handed out again. Long tasks keep their lease with
+    ``extend`` (or ``heartbeat``). ``ack``/``fail`` only apply while the caller
+    still holds the lease and return False otherwise, so a worker whose lease
+    ran out cannot overwrite the new holder's result. ``ack`` can enqueue the
+    next stage in the same step, so an item is never lost between stages.
+    """
+
+    def put(self, topic: str, key: str, payload: Dict) -> bool: ...
+
+    def has(self, key: str) -> bool: ...
+
+    def payload(self, key: str) -> Optional[Dict]: ...
+
+    def claim(self, topics: List[str], worker: str, lease_seconds: float) -> Optional[Task]: ...
+
+    def extend(self, task: Task, lease_seconds: float) -> bool: ...
+
+    def heartbeat(self, task: Task, lease_seconds: float) -> Iterator[None]: ...
+
+    def ack(self, task: Task, next_topic: str | None = None, payload: Dict | None = None) -> bool: ...
+
+    def fail(self, task: Task, error: str, max_attempts: int) -> bool: ...
+
+    def counts(self) -> Dict[str, Dict[str, int]]: ...
+
+    def active(self, topics: List[str]) -> int: ...
+
+
+class SQLiteQueue:
+    """WorkQueue in one SQLite file (WAL, ``BEGIN IMMEDIATE`` claims).
+
+    Good for several processes on one machine, or nodes sharing a volume with
+    working file locks. Done rows are kept so a key is not enqueued twice while
+    it is in flight; once none of its rows is ready or leased (it finished or
+    was parked as failed) ``put`` starts it over.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = connect(path)
+        self._conn.isolation_level = None  # explicit transactions below
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                topic TEXT NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'ready',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_until REAL NOT NULL DEFAULT 0,
+                worker TEXT,
+                error TEXT,
+                updated REAL NOT NULL,
+                UNIQUE (topic, key)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (topic, state, id);
+            CREATE INDEX IF NOT EXISTS tasks_key ON tasks (key);
+            """
+        )
+
+    def _insert(self, topic: str, key: str, payload: Dict) -> bool:
+        cur = self._conn.execute(
+            "INSERT OR IGNORE INTO tasks (topic, key, payload, updated) VALUES (?, ?, ?, ?)",
+            (topic, key, json.dumps(payload, ensure_ascii=False), time.time()),
+        )
+        return cur.rowcount > 0
+
+    def _active(self, key: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM tasks WHERE key = ? AND state IN ('ready', 'leased') LIMIT 1", (key,)
+        ).fetchone() is not None
+
+    def put(self, topic: str, key: str, payload: Dict) -> bool:
+        """Enqueue ``payload`` unless ``key`` is already waiting or being worked on.
+
+        A key whose earlier rows are all done or failed is requeued from scratch.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = self._insert(topic, key, payload)
+            if not added and not self._active(key):
+                self._conn.execute("DELETE FROM tasks WHERE key = ?", (key,))
+                added = self._insert(topic, key, payload)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def has(self, key: str) -> bool:
+        """True while ``key`` has a ready or leased task (finished and failed ones don't count)."""
+        return self._active(key)
+
+    def payload(self, key: str) -> Optional[Dict]:
+        """Payload ``key`` was first enqueued with, if it is still in the queue."""
+        row = self._conn.execute("SELECT payload FROM tasks WHERE key = ? ORDER BY id LIMIT 1", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def claim(self, topics: List[str], worker: str, lease_seconds: float = 900) -> Optional[Task]:
+        """Lease the oldest ready (or lease-expired) task of ``topics``."""
+        now = time.time()
+        marks = ",".join("?" * len(topics))
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                f"SELECT id, topic, key, payload, attempts FROM tasks WHERE topic IN ({marks}) "
+                "AND (state = 'ready' OR (state = 'leased' AND lease_until < ?)) ORDER BY id LIMIT 1",
+                (*topics, now),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE tasks SET state = 'leased', attempts = attempts + 1, lease_until = ?, worker = ?, updated = ? WHERE id = ?",
+                    (now + lease_seconds, worker, now, row[0]),
+                )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return dict(id=row[0], topic=row[1], key=row[2], payload=json.loads(row[3]), attempts=row[4] + 1, worker=worker)
+
+    def extend(self, task: Task, lease_seconds: float = 900) -> bool:
+        """Push the lease of ``task`` out to ``lease_seconds`` from now; False if it was lost."""
+        cur = self._conn.execute(
+            "UPDATE tasks SET lease_until = ?, updated = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+            (time.time() + lease_seconds, time.time(), task["id"], task["worker"]),
+        )
+        return cur.rowcount > 0
+
+    @contextmanager
+    def heartbeat(self, task: Task, lease_seconds: float = 900) -> Iterator[None]:
+        """Keep extending the lease of ``task`` from a background thread while the block runs."""
+        stop = threading.Event()
+
+        def beat():
+            # sqlite connections belong to one thread; the heartbeat opens its own
+            q = SQLiteQueue(self.path)
+            try:
+                while not stop.wait(max(1.0, lease_seconds / 3)):
+                    if not q.extend(task, lease_seconds):
+                        break
+            finally:
+                q.close()
+
+        thread = threading.Thread(target=beat, name=f"lease-{task['id']}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def ack(self, task: Task, next_topic: str | None = None, payload: Dict | None = None) -> bool:
+        """Mark ``task`` done and, in the same transaction, enqueue its next stage.
+
+        Returns False (and changes nothing) if the caller no longer holds the lease.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = self._conn.execute(
+                "UPDATE tasks SET state = 'done', error = NULL, updated = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+                (time.time(), task["id"], task["worker"]),
+            )
+            if cur.rowcount == 0:
+                self._conn.execute("ROLLBACK")
+                return False
+            if next_topic:
+                self._insert(next_topic, task["key"], payload if payload is not None else task["payload"])
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def fail(self, task: Task, error: str, max_attempts: int = 3) -> bool:
+        """Release ``task`` for another attempt, or park it as failed after ``max_attempts``.
+
+        Returns False if the caller no longer holds the lease.
+        """
+        state = "failed" if task["attempts"] >= max_attempts else "ready"
+        cur = self._conn.execute(
+            "UPDATE tasks SET state = ?, lease_until = 0, error = ?, updated = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+            (state, error[:2000], time.time(), task["id"], task["worker"]),
+        )
+        return cur.rowcount > 0
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Task counts per topic and state."""
+        out: Dict[str, Dict[str, int]] = {}
+        for topic, state, n in self._conn.execute("SELECT topic, state, COUNT(*) FROM tasks GROUP BY topic, state"):
+            out.setdefault(topic, {})[state] = n
+        return out
+
+    def active(self, topics: List[str]) -> int:
+        """Tasks of ``topics`` that are waiting or being worked on."""
+        marks = ",".join("?" * len(topics))
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM tasks WHERE topic IN ({marks}) AND state IN ('ready', 'leased')", tuple(topics)
+        ).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+def open_queue(url: str) -> WorkQueue:
+    """Queue backend for ``url``: ``sqlite:///path/to/queue.db`` or a plain ``.db`` path."""
+    if url.startswith("sqlite:///"):
+        return SQLiteQueue(Path(url[len("sqlite:///"):]))
+    if "://" not in url:
+        return SQLiteQueue(Path(url))
+    raise ValueError(f"Unsupported queue backend: {url}")
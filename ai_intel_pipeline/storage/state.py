@@ -1,59 +1,179 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import time
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, Iterable, Set, Tuple
+
+from .sqlite import connect
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter used to skip SQLite lookups for unseen keys."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01, bits: bytes | None = None):
+        self.capacity = max(1, int(capacity))
+        self.m = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.k = max(1, int(round(self.m / self.capacity * math.log(2))))
+        nbytes = (self.m + 7) // 8
+        self.bits = bytearray(bits) if bits and len(bits) == nbytes else bytearray(nbytes)
+
+    def _positions(self, key: str):
+        h = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(h[:8], "little")
+        h2 = int.from_bytes(h[8:], "little") | 1
+        for i in range(self.k):
+            yield (h1 + i * h2) % self.m
+
+    def add(self, key: str):
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
 
 
 class State:
-    def __init__(self, path: Path):
+    """Seen-set and speech-to-text budget store.
+
+    Backed by SQLite (``state.db`` next to the legacy ``state.json``), so load
+    is constant time and ``save`` only writes keys marked since the last save.
+    A legacy ``state.json`` is imported once on first open. Entries older than
+    ``ttl_days`` are expired on save; ``bloom`` adds an in-memory prefilter for
+    negative lookups. The filter is snapshotted every ``BLOOM_SNAPSHOT_KEYS``
+    new keys and caught up from the ``ts`` index on load.
+    """
+
+    BLOOM_SNAPSHOT_KEYS = 1000
+
+    def __init__(self, path: Path, ttl_days: int | None = None, bloom: bool = False, bloom_capacity: int = 1_000_000):
         self.path = path
-        self.seen_urls: Set[str] = set()
-        self.seen_uids: Set[str] = set()
-        self.stt_budget: Dict[str, int] = {}
+        self.db_path = path.with_suffix(".db") if path.suffix == ".json" else path
+        self.ttl_days = ttl_days
+        self.stt_budget: Dict[str, float] = {}
+        self._pending: Set[Tuple[str, str]] = set()
+        self._conn = connect(self.db_path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen (kind TEXT NOT NULL, key TEXT NOT NULL, ts INTEGER NOT NULL, PRIMARY KEY (kind, key)) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS seen_ts ON seen (ts);
+            CREATE TABLE IF NOT EXISTS stt_budget (date_key TEXT PRIMARY KEY, minutes REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB);
+            """
+        )
+        self.bloom: BloomFilter | None = None
+        self._bloom_unsaved = 0
         self._load()
+        if bloom:
+            self._load_bloom(bloom_capacity)
 
     def _load(self):
-        if self.path.exists():
+        if self.path != self.db_path and self.path.exists() and self._meta("legacy_imported") is None:
             try:
                 data = json.loads(self.path.read_text(encoding="utf-8"))
-                self.seen_urls = set(data.get("seen_urls", []))
-                self.seen_uids = set(data.get("seen_uids", []))
             except Exception:
-                self.seen_urls = set()
-                self.seen_uids = set()
-                self.stt_budget = {}
+                data = {}
+            now = int(time.time())
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO seen (kind, key, ts) VALUES (?, ?, ?)",
+                    [("url", u, now) for u in data.get("seen_urls", [])] + [("uid", u, now) for u in data.get("seen_uids", [])],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO stt_budget (date_key, minutes) VALUES (?, ?)",
+                    list((data.get("stt_budget") or {}).items()),
+                )
+                self._set_meta("legacy_imported", str(now))
+        self.stt_budget = {k: v for k, v in self._conn.execute("SELECT date_key, minutes FROM stt_budget")}
+
+    def _meta(self, key: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _load_bloom(self, capacity: int):
+        count = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        stored = self._meta("bloom")
+        stored_cap = int(self._meta("bloom_capacity") or 0)
+        if stored and count * 2 <= stored_cap:
+            self.bloom = BloomFilter(stored_cap, bits=stored)
+            # keys saved after the snapshot was taken
+            since = int(self._meta("bloom_ts") or 0)
+            for kind, key in self._conn.execute("SELECT kind, key FROM seen WHERE ts >= ?", (since,)):
+                self.bloom.add(f"{kind}:{key}")
+        else:
+            # first use or outgrown: rebuild sized for growth (also drops expired keys)
+            self.bloom = BloomFilter(max(capacity, count * 4))
+            for kind, key in self._conn.execute("SELECT kind, key FROM seen"):
+                self.bloom.add(f"{kind}:{key}")
+            with self._conn:
+                self._snapshot_bloom(int(time.time()))
+
+    def _snapshot_bloom(self, now: int):
+        self._set_meta("bloom", bytes(self.bloom.bits))
+        self._set_meta("bloom_capacity", str(self.bloom.capacity))
+        self._set_meta("bloom_ts", str(now))
+        self._bloom_unsaved = 0
 
     def save(self):
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "seen_urls": sorted(list(self.seen_urls)),
-            "seen_uids": sorted(list(self.seen_uids)),
-            "stt_budget": self.stt_budget,
-        }
-        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        now = int(time.time())
+        with self._conn:
+            # refresh ts on re-mark so expiry only drops keys not seen for ttl_days
+            self._conn.executemany(
+                "INSERT INTO seen (kind, key, ts) VALUES (?, ?, ?) ON CONFLICT (kind, key) DO UPDATE SET ts = excluded.ts",
+                [(kind, key, now) for kind, key in self._pending],
+            )
+            if self.ttl_days:
+                self._conn.execute("DELETE FROM seen WHERE ts < ?", (now - int(self.ttl_days * 86400),))
+            if self.bloom is not None:
+                self._bloom_unsaved += len(self._pending)
+                if self._bloom_unsaved >= self.BLOOM_SNAPSHOT_KEYS:
+                    self._snapshot_bloom(now)
+        self._pending.clear()
 
-    def mark(self, url: str | None = None, uid: str | None = None):
+    def _keys(self, url: str | None, uid: str | None) -> Iterable[Tuple[str, str]]:
         if url:
-            self.seen_urls.add(url)
+            yield ("url", url)
         if uid:
-            self.seen_uids.add(uid)
+            yield ("uid", uid)
+
+    def mark(self, url: str | None = None, uid: str | None = None):
+        for kind, key in self._keys(url, uid):
+            self._pending.add((kind, key))
+            if self.bloom is not None:
+                self.bloom.add(f"{kind}:{key}")
 
     def seen(self, url: str | None = None, uid: str | None = None) -> bool:
-        if url and url in self.seen_urls:
-            return True
-        if uid and uid in self.seen_uids:
-            return True
+        for kind, key in self._keys(url, uid):
+            if (kind, key) in self._pending:
+                return True
+            if self.bloom is not None and f"{kind}:{key}" not in self.bloom:
+                continue
+            if self._conn.execute("SELECT 1 FROM seen WHERE kind = ? AND key = ?", (kind, key)).fetchone():
+                return True
         return False
 
-    # Speech-to-text (Whisper/OpenAI) budget tracking
-    def stt_minutes_used(self, date_key: str) -> int:
-        return int(self.stt_budget.get(date_key, 0))
+    # Speech-to-text (Whisper/OpenAI) budget tracking. The budget is read from and
+    # added to the database directly, so ingest workers sharing state.db see each
+    # other's spending.
+    def stt_minutes_used(self, date_key: str) -> float:
+        row = self._conn.execute("SELECT minutes FROM stt_budget WHERE date_key = ?", (date_key,)).fetchone()
+        self.stt_budget[date_key] = float(row[0]) if row else 0.0
+        return self.stt_budget[date_key]
 
-    def can_spend_stt(self, minutes: int, date_key: str, daily_limit: int) -> bool:
+    def can_spend_stt(self, minutes: float, date_key: str, daily_limit: float) -> bool:
         used = self.stt_minutes_used(date_key)
         return (used + minutes) <= daily_limit
 
-    def spend_stt(self, minutes: int, date_key: str):
-        used = self.stt_minutes_used(date_key)
-        self.stt_budget[date_key] = used + minutes
+    def spend_stt(self, minutes: float, date_key: str):
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO stt_budget (date_key, minutes) VALUES (?, ?) "
+                "ON CONFLICT (date_key) DO UPDATE SET minutes = minutes + excluded.minutes",
+                (date_key, minutes),
+            )
+        self.stt_minutes_used(date_key)
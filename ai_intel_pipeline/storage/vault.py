@@ -1,24 +1,203 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+from .atomic import atomic_write_bytes, atomic_write_json, atomic_write_text
+from .ids import new_item_id
+from .packs import MonthPack, month_of, open_packs
+
+
+class ItemRecord:
+    """In-memory ``item.json`` document.
+
+    Pipeline stages update the record in memory; ``flush`` writes it to disk in
+    one atomic write instead of a read-modify-write per stage.
+    """
+
+    def __init__(self, path: Path, data: Dict):
+        self.path = path
+        self.data = data
+        self.dirty = True
+
+    @classmethod
+    def load(cls, path: Path) -> "ItemRecord":
+        rec = cls(path, json.loads(path.read_text(encoding="utf-8")))
+        rec.dirty = False
+        return rec
+
+    @property
+    def id(self) -> str:
+        return self.data.get("id", "")
+
+    @property
+    def links(self) -> Dict:
+        links = self.data.get("links")
+        return links if isinstance(links, dict) else {}
+
+    def update_scores(self, scores: Dict[str, float]):
+        self.data.setdefault("scores", {}).update(scores)
+        self.dirty = True
+
+    def update_fields(self, fields: Dict):
+        self.data.update(fields)
+        self.dirty = True
+
+    def flush(self):
+        if self.dirty:
+            atomic_write_json(self.path, self.data, ensure_ascii=False)
+            self.dirty = False
 
 
 class Vault:
+    """Item folders under ``items/YYYY-MM/{item_id}``.
+
+    Cold months can be packed into ``packs/YYYY-MM.db`` (see ``pack_month``);
+    readers should go through ``item_ids`` / ``read_*`` so they see loose and
+    packed items alike.
+    """
+
     def __init__(self, root: Path):
         self.root = root
         (self.root).mkdir(parents=True, exist_ok=True)
         (self.root / "items").mkdir(parents=True, exist_ok=True)
+        self.packs_dir = self.root / "packs"
+        self._packs: Dict[str, MonthPack] = {}
 
     def create_item_folder(self, dt: datetime | None = None) -> Tuple[str, Path]:
-        dt = dt or datetime.utcnow()
-        month = dt.strftime("%Y-%m")
-        item_id = dt.strftime("%Y%m%d-%H%M-") + ("%06d" % (dt.microsecond % 1000000))
-        dir_path = self.root / "items" / month / item_id
-        dir_path.mkdir(parents=True, exist_ok=True)
-        return item_id, dir_path
+        """New item id and its (freshly created) folder.
+
+        The folder is created with ``exist_ok=False`` so two writers can never
+        share one item; on the (unlikely) clash a new id is drawn.
+        """
+        for _ in range(5):
+            item_id = new_item_id(dt)
+            dir_path = self.item_dir(item_id)
+            dir_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                dir_path.mkdir(exist_ok=False)
+            except FileExistsError:
+                continue
+            return item_id, dir_path
+        raise RuntimeError("Could not allocate a unique item folder")
+
+    def item_dir(self, item_id: str) -> Path:
+        month = item_id[:4] + "-" + item_id[4:6]
+        return self.root / "items" / month / item_id
+
+    # Loose + packed item access
+    def _pack(self, month: str, create: bool = False) -> MonthPack | None:
+        return open_packs(self.packs_dir, self._packs, month, create=create)
+
+    def months(self) -> List[str]:
+        loose = {p.name for p in (self.root / "items").iterdir() if p.is_dir()}
+        packed = {p.stem for p in self.packs_dir.glob("*.db")} if self.packs_dir.exists() else set()
+        return sorted(loose | packed)
+
+    def item_ids(self, month: str | None = None) -> Iterator[str]:
+        """Item ids month by month (oldest first), whether loose or packed."""
+        for m in [month] if month else self.months():
+            ids = set()
+            month_dir = self.root / "items" / m
+            if month_dir.is_dir():
+                ids.update(p.name for p in month_dir.iterdir() if (p / "item.json").exists())
+            pack = self._pack(m)
+            if pack is not None:
+                ids.update(pack.item_ids())
+            yield from sorted(ids)
+
+    def locate(self, item_id: str) -> str | None:
+        """'dir' for a loose item, 'pack' for a packed one, None if unknown."""
+        if (self.item_dir(item_id) / "item.json").exists():
+            return "dir"
+        pack = self._pack(month_of(item_id))
+        if pack is not None and pack.has(item_id):
+            return "pack"
+        return None
+
+    def read_bytes(self, item_id: str, name: str) -> bytes | None:
+        p = self.item_dir(item_id) / name
+        if p.exists():
+            return p.read_bytes()
+        pack = self._pack(month_of(item_id))
+        return pack.read(item_id, name) if pack is not None else None
+
+    def read_text(self, item_id: str, name: str) -> str | None:
+        data = self.read_bytes(item_id, name)
+        return data.decode("utf-8") if data is not None else None
+
+    def read_json(self, item_id: str, name: str = "item.json") -> Dict | None:
+        try:
+            text = self.read_text(item_id, name)
+            return json.loads(text) if text is not None else None
+        except Exception:
+            return None
+
+    def write_item_file(self, item_id: str, name: str, text: str):
+        """Replace one file of an existing item wherever it is stored."""
+        if self.locate(item_id) == "pack":
+            self._pack(month_of(item_id)).write(item_id, name, text.encode("utf-8"))
+        else:
+            atomic_write_text(self.item_dir(item_id) / name, text)
+
+    def write_item_json(self, item_id: str, data: Dict, name: str = "item.json"):
+        self.write_item_file(item_id, name, json.dumps(data, indent=2, ensure_ascii=False))
+
+    def cold_months(self, keep_months: int = 1, now: datetime | None = None) -> List[str]:
+        """Months with loose items older than the ``keep_months`` most recent calendar months.
+
+        ``keep_months`` is at least 1: the current month is never cold.
+        """
+        now = now or datetime.utcnow()
+        idx = now.year * 12 + now.month - 1 - max(keep_months, 1)
+        cutoff = f"{idx // 12:04d}-{idx % 12 + 1:02d}"
+        return sorted(p.name for p in (self.root / "items").iterdir() if p.is_dir() and p.name <= cutoff)
+
+    def pack_month(self, month: str) -> int:
+        """Move every loose item of ``month`` into its pack; returns items packed.
+
+        Folders are removed only after their pack transaction commits, so an
+        interrupted run leaves each item readable and can simply be repeated.
+        """
+        month_dir = self.root / "items" / month
+        if not month_dir.is_dir():
+            return 0
+        pack = self._pack(month, create=True)
+        n = 0
+        for item_dir in sorted(p for p in month_dir.iterdir() if p.is_dir()):
+            pack.add_item_dir(item_dir.name, item_dir)
+            shutil.rmtree(item_dir)
+            n += 1
+        if not any(month_dir.iterdir()):
+            month_dir.rmdir()
+        return n
+
+    def unpack_item(self, item_id: str) -> Path | None:
+        """Restore a packed item to its folder (no-op for loose items)."""
+        item_dir = self.item_dir(item_id)
+        pack = self._pack(month_of(item_id))
+        if pack is None or not pack.has(item_id):
+            return item_dir if item_dir.exists() else None
+        for name, data in pack.files(item_id):
+            atomic_write_bytes(item_dir / name, data)
+        pack.delete(item_id)
+        return item_dir
+
+    def unpack_month(self, month: str) -> int:
+        pack = self._pack(month)
+        if pack is None:
+            return 0
+        ids = pack.item_ids()
+        for item_id in ids:
+            self.unpack_item(item_id)
+        pack.close()
+        self._packs.pop(month, None)
+        for suffix in ("", "-wal", "-shm"):
+            (self.packs_dir / f"{month}.db{suffix}").unlink(missing_ok=True)
+        return len(ids)
 
     def init_item_json(
         self,
@@ -31,6 +210,23 @@ class Vault:
         content_type: str | None,
         links: Dict | None = None,
     ) -> Dict:
+        record = self.new_item(item_id, title, canonical_url, source_type, source_name, published_at, content_type, links)
+        record.flush()
+        return record.data
+
+    def new_item(
+        self,
+        item_id: str,
+        title: str,
+        canonical_url: str,
+        source_type: str,
+        source_name: str,
+        published_at: str | None,
+        content_type: str | None,
+        links: Dict | None = None,
+        item_dir: Path | None = None,
+    ) -> ItemRecord:
+        """Base item document, kept in memory until ``ItemRecord.flush``."""
         data = {
             "id": item_id,
             "title": title or "",
@@ -51,19 +247,13 @@ class Vault:
             },
             "links": links or {},
         }
-        # Find directory path
-        month = item_id[:4] + "-" + item_id[4:6]
-        path = self.root / "items" / month / item_id / "item.json"
-        self.write_json(path, data)
-        return data
+        return ItemRecord((item_dir or self.item_dir(item_id)) / "item.json", data)
 
     def write_json(self, path: Path, data: Dict):
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        atomic_write_json(path, data, ensure_ascii=False)
 
     def write_text(self, path: Path, text: str):
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding="utf-8")
+        atomic_write_text(path, text)
 
     def update_scores(self, item_json_path: Path, scores: Dict[str, float]):
         try:
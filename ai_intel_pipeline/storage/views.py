@@ -3,12 +3,29 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import re
-from typing import Dict, List
+from typing import Dict, List, Set
+
+from .atomic import atomic_write_json
+
+
+VIEW_FIELDS = ["id", "title", "url", "date"]
 
 
 class Views:
-    def __init__(self, root: Path):
+    """Per-pillar item lists under ``views/pillars/<slug>.json``.
+
+    Views touched during a run are loaded once and kept in memory with their id
+    sets; additions are written by ``flush``, so each view is read and rewritten
+    once per run instead of once per item. Views with more than
+    ``compact_after`` items are stored column-wise (``fields`` + ``rows``)
+    without indentation.
+    """
+
+    def __init__(self, root: Path, compact_after: int = 2000):
         self.root = root
+        self.compact_after = compact_after
+        self._views: Dict[Path, Dict] = {}
+        self._dirty: Set[Path] = set()
         (self.root / "views" / "pillars").mkdir(parents=True, exist_ok=True)
 
     def _pillar_path(self, pillar_slug: str) -> Path:
@@ -17,23 +34,78 @@ class Views:
         slug = re.sub(r"[^a-z0-9]+", "-", slug).strip("-")
         return self.root / "views" / "pillars" / f"{slug}.json"
 
-    def add_item_to_pillars(self, pillars: List[str], item: Dict):
-        for pillar in pillars:
-            slug = pillar.lower().replace(" ", "-")
-            p = self._pillar_path(slug)
+    def _path_for(self, pillar: str) -> Path:
+        return self._pillar_path(pillar.lower().replace(" ", "-"))
+
+    @staticmethod
+    def _decode(data: Dict) -> List[Dict]:
+        if data.get("format") == "compact":
+            fields = data.get("fields") or VIEW_FIELDS
+            return [dict(zip(fields, row)) for row in data.get("rows", [])]
+        return data.get("items", [])
+
+    def _encode(self, pillar: str, items: List[Dict]) -> Dict:
+        if len(items) > self.compact_after:
+            return {
+                "pillar": pillar,
+                "format": "compact",
+                "fields": VIEW_FIELDS,
+                "rows": [[x.get(f) for f in VIEW_FIELDS] for x in items],
+            }
+        return {"pillar": pillar, "items": items}
+
+    def _write(self, p: Path, pillar: str, items: List[Dict]):
+        compact = len(items) > self.compact_after
+        atomic_write_json(p, self._encode(pillar, items), indent=None if compact else 2)
+
+    def _load(self, pillar: str) -> Dict:
+        p = self._path_for(pillar)
+        view = self._views.get(p)
+        if view is None:
             try:
                 data = json.loads(p.read_text(encoding="utf-8"))
             except Exception:
                 data = {"pillar": pillar, "items": []}
-            # Deduplicate by item id
-            ids = {x.get("id") for x in data.get("items", [])}
-            if item.get("id") not in ids:
-                data.setdefault("items", []).append(
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("title"),
-                        "url": item.get("canonical_url"),
-                        "date": item.get("published_at"),
-                    }
-                )
-            p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            items = self._decode(data)
+            view = {"pillar": data.get("pillar") or pillar, "items": items, "ids": {x.get("id") for x in items}}
+            self._views[p] = view
+        return view
+
+    def items(self, pillar: str) -> List[Dict]:
+        return list(self._load(pillar)["items"])
+
+    def add_item_to_pillars(self, pillars: List[str], item: Dict):
+        """Queue ``item`` for each pillar's view (deduplicated by id); written on ``flush``."""
+        for pillar in pillars:
+            view = self._load(pillar)
+            if item.get("id") in view["ids"]:
+                continue
+            view["items"].append(
+                {
+                    "id": item.get("id"),
+                    "title": item.get("title"),
+                    "url": item.get("canonical_url"),
+                    "date": item.get("published_at"),
+                }
+            )
+            view["ids"].add(item.get("id"))
+            self._dirty.add(self._path_for(pillar))
+
+    def flush(self):
+        for p in sorted(self._dirty):
+            view = self._views[p]
+            self._write(p, view["pillar"], view["items"])
+        self._dirty.clear()
+
+    def replace_all(self, items_by_pillar: Dict[str, List[Dict]]):
+        """Rewrite every pillar view from scratch; views of pillars with no items are removed."""
+        self._views.clear()
+        self._dirty.clear()
+        written = set()
+        for pillar, items in items_by_pillar.items():
+            p = self._path_for(pillar)
+            self._write(p, pillar, items)
+            written.add(p)
+        for p in (self.root / "views" / "pillars").glob("*.json"):
+            if p not in written:
+                p.unlink()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+# OpenAI transcription uploads are limited to 25 MB
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+def probe_duration(path: Path) -> Optional[float]:
+    """Audio duration in seconds via ffprobe (None without ffprobe or on error)."""
+    if not shutil.which("ffprobe"):
+        return None
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+            capture_output=True, text=True, timeout=60, check=True,
+        ).stdout.strip()
+        return float(out)
+    except Exception:
+        return None
+
+
+class Chunk(NamedTuple):
+    path: Path
+    offset: float  # seconds from the start of the video
+    duration: Optional[float]  # seconds, None when it could not be probed
+
+
+def _whole(path: Path) -> List[Chunk]:
+    return [Chunk(path, 0.0, probe_duration(path))] if path.stat().st_size <= MAX_UPLOAD_BYTES else []
+
+
+def split_audio(path: Path, out_dir: Path, chunk_seconds: int = 600) -> List[Chunk]:
+    """Cut ``path`` into fixed windows of mono 16 kHz 32 kbps mp3 (small uploads).
+
+    Offsets add up the probed chunk durations, so segment times can be shifted
+    onto the full video. Without ffmpeg the file is returned whole if it fits
+    one upload, else [].
+    """
+    if not shutil.which("ffmpeg"):
+        return _whole(path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y", "-i", str(path), "-vn", "-ac", "1", "-ar", "16000", "-b:a", "32k",
+                "-f", "segment", "-segment_time", str(int(chunk_seconds)), "-reset_timestamps", "1",
+                str(out_dir / "chunk_%04d.mp3"),
+            ],
+            capture_output=True, timeout=1800, check=True,
+        )
+    except Exception:
+        return _whole(path)
+    chunks: List[Chunk] = []
+    offset = 0.0
+    for chunk in sorted(out_dir.glob("chunk_*.mp3")):
+        duration = probe_duration(chunk)
+        chunks.append(Chunk(chunk, offset, duration))
+        offset += duration if duration is not None else float(chunk_seconds)
+    return chunks
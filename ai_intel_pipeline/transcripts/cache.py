@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..storage.atomic import atomic_write_bytes
+
+
+class TranscriptCache:
+    """Transcripts by YouTube video id under ``vault/cache/transcripts/{video_id}.json.gz``.
+
+    Shared by every item, run and ``ingest-url`` call, so a re-ingested video
+    never downloads captions or pays for speech-to-text twice. Entries keep
+    their provenance (``source``: captions or fallback, ``model``, ``minutes``)
+    and store segments as ``[t_start, t_end, text]`` rows.
+    """
+
+    def __init__(self, root: Path = Path("vault/cache/transcripts")):
+        self.root = root
+
+    def _path(self, video_id: str) -> Path:
+        return self.root / f"{video_id}.json.gz"
+
+    def has(self, video_id: str | None) -> bool:
+        return bool(video_id) and self._path(video_id).exists()
+
+    def get(self, video_id: str | None) -> Optional[Dict]:
+        """``{"segments", "source", "model", "minutes", "complete", "created"}`` or None."""
+        if not video_id:
+            return None
+        try:
+            data = json.loads(gzip.decompress(self._path(video_id).read_bytes()))
+        except Exception:
+            return None
+        data["segments"] = [{"t_start": s, "t_end": e, "text": t} for s, e, t in data.get("segments", [])]
+        return data
+
+    def put(
+        self,
+        video_id: str | None,
+        segments: List[Dict],
+        source: str,
+        model: str | None = None,
+        minutes: float | None = None,
+        complete: bool = True,
+    ):
+        if not video_id or not segments:
+            return
+        data = {
+            "video_id": video_id,
+            "source": source,
+            "model": model,
+            "minutes": minutes,
+            "complete": complete,
+            "created": datetime.utcnow().isoformat() + "Z",
+            "segments": [[s.get("t_start", 0.0), s.get("t_end", 0.0), s.get("text", "")] for s in segments],
+        }
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write_bytes(self._path(video_id), gzip.compress(raw, 6))
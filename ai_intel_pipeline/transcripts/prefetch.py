@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from ..fetchers.youtube import YouTubeInfoCache
+from .youtube import extract_video_id, fetch_captions_segments
+
+
+class TranscriptPrefetcher:
+    """Caption downloads for a run's YouTube candidates on a bounded thread pool.
+
+    ``submit`` starts fetching as soon as candidates are known; ``captions``
+    waits for (or, for a URL never submitted, performs) the fetch when the
+    item reaches its transcript stage. Only captions are prefetched: the paid
+    Whisper fallback stays inline, behind the daily budget check.
+
+    Each prefetch extracts the video's yt-dlp info into ``info`` first, so
+    metadata enrichment later in the item reads it from memory.
+    """
+
+    def __init__(self, max_workers: int = 4, info: YouTubeInfoCache | None = None):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="captions")
+        self._futures: Dict[str, Future] = {}
+        self.info = info or YouTubeInfoCache()
+
+    def _fetch(self, url: str) -> Optional[List[Dict]]:
+        return fetch_captions_segments(url, info=self.info.get(url))
+
+    def submit(self, url: str | None):
+        vid = extract_video_id(url or "")
+        if vid and vid not in self._futures:
+            self._futures[vid] = self._pool.submit(self._fetch, url)
+
+    def captions(self, url: str | None, timeout: float | None = None) -> Optional[List[Dict]]:
+        fut = self._futures.get(extract_video_id(url or "") or "")
+        if fut is None:
+            return self._fetch(url or "")
+        try:
+            return fut.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "TranscriptPrefetcher":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
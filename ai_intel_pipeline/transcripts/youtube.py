@@ -1,26 +1,69 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import os
 import tempfile
 
+import requests
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 
+from ..utils.canonical import youtube_video_id
+from .audio import Chunk, split_audio
+from .cache import TranscriptCache
+
 
 def extract_video_id(url: str) -> Optional[str]:
-    # Basic parsing for watch?v= and youtu.be links
-    if "watch?v=" in url:
-        return url.split("watch?v=")[-1].split("&")[0]
-    if "youtu.be/" in url:
-        return url.split("youtu.be/")[-1].split("?")[0]
+    # watch?v=, youtu.be, shorts/embed/live links
+    return youtube_video_id(url)
+
+
+_CAPTION_LANGS = ("en", "en-US", "en-GB")
+
+
+def _caption_track_url(info: Dict) -> Optional[str]:
+    """json3 URL of the preferred English track in a yt-dlp info dict (manual before automatic)."""
+    for key in ("subtitles", "automatic_captions"):
+        tracks = info.get(key) or {}
+        langs = [l for l in _CAPTION_LANGS if l in tracks] + sorted(l for l in tracks if l.startswith("en-") and l not in _CAPTION_LANGS)
+        for lang in langs:
+            for fmt in tracks.get(lang) or []:
+                if fmt.get("ext") == "json3" and fmt.get("url"):
+                    return fmt["url"]
     return None
 
 
-def fetch_captions_segments(url: str) -> Optional[List[Dict]]:
+def captions_from_info(info: Dict | None) -> Optional[List[Dict]]:
+    """Segments from the caption track listed in ``info``, without a second lookup."""
+    url = _caption_track_url(info or {})
+    if not url:
+        return None
+    try:
+        r = requests.get(url, timeout=20)
+        r.raise_for_status()
+        events = r.json().get("events") or []
+    except Exception:
+        return None
+    segments = []
+    for ev in events:
+        text = "".join(seg.get("utf8", "") for seg in ev.get("segs") or []).strip()
+        if not text:
+            continue
+        start = float(ev.get("tStartMs", 0)) / 1000.0
+        segments.append({"t_start": start, "t_end": start + float(ev.get("dDurationMs", 0)) / 1000.0, "text": text})
+    return segments or None
+
+
+def fetch_captions_segments(url: str, info: Dict | None = None) -> Optional[List[Dict]]:
+    """English captions; uses the track URLs of an existing yt-dlp ``info`` when given."""
     vid = extract_video_id(url)
     if not vid:
         return None
+    if info:
+        segs = captions_from_info(info)
+        if segs:
+            return segs
     try:
         transcript_list = YouTubeTranscriptApi.list_transcripts(vid)
         # Prefer English
@@ -42,9 +85,39 @@ def fetch_captions_segments(url: str) -> Optional[List[Dict]]:
         return None
 
 
-def transcribe_with_openai(url: str) -> Optional[List[Dict]]:
-    """Download audio via yt-dlp and transcribe with OpenAI if key present.
-    Returns segments if available, else single segment.
+def _transcribe_chunk(client, model: str, chunk: Chunk) -> Tuple[List[Dict], Optional[float]]:
+    """Segments of one chunk shifted by its offset, plus the audio seconds billed."""
+    with chunk.path.open("rb") as f:
+        try:
+            resp = client.audio.transcriptions.create(model=model, file=f, response_format="verbose_json")
+        except Exception:
+            # gpt-4o transcribe models only return plain json (text, no segments)
+            f.seek(0)
+            resp = client.audio.transcriptions.create(model=model, file=f, response_format="json")
+    duration = getattr(resp, "duration", None) or chunk.duration
+    segments = []
+    # openai>=2 returns a pydantic model or dict-like
+    if getattr(resp, "segments", None):
+        for s in resp.segments:
+            segments.append({
+                "t_start": chunk.offset + float(getattr(s, "start", 0.0) or 0.0),
+                "t_end": chunk.offset + float(getattr(s, "end", 0.0) or 0.0),
+                "text": getattr(s, "text", "") or "",
+            })
+    else:
+        text = getattr(resp, "text", None) or (resp.get("text") if isinstance(resp, dict) else "")
+        end = chunk.offset + float(duration or 0.0)
+        segments = [{"t_start": chunk.offset, "t_end": end, "text": text or ""}]
+    return segments, float(duration) if duration else None
+
+
+def transcribe_audio(url: str, chunk_seconds: int = 600, max_workers: int = 3, info: Dict | None = None) -> Optional[Dict]:
+    """Whisper-style fallback: download low-bitrate audio, transcribe fixed windows in parallel.
+
+    An ``info`` dict from an earlier extraction is reused for format selection
+    and download instead of extracting the video again. Returns ``{"segments", "minutes", "model", "complete"}`` where ``minutes``
+    is the audio actually sent for transcription (what the budget is charged),
+    or None when nothing was transcribed. Temp files are always removed.
     """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -54,55 +127,81 @@ def transcribe_with_openai(url: str) -> Optional[List[Dict]]:
         from openai import OpenAI
     except Exception:
         return None
-    # Download audio to temp file
-    tmpdir = Path(tempfile.mkdtemp())
-    outtmpl = str(tmpdir / "%(id)s.%(ext)s")
-    ydl_opts = {
-        "quiet": True,
-        "skip_download": False,
-        "format": "bestaudio/best",
-        "outtmpl": outtmpl,
-        "noplaylist": True,
-    }
-    audio_path: Optional[Path] = None
-    try:
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            fn = ydl.prepare_filename(info)
-            audio_path = Path(fn)
-    except Exception:
-        return None
-
-    if not audio_path or not audio_path.exists():
-        return None
+    # Prefer the modern lightweight transcribe model; fallback to whisper-1
+    model = os.getenv("OPENAI_TRANSCRIBE_MODEL", "gpt-4o-mini-transcribe")
+    with tempfile.TemporaryDirectory(prefix="ai-intel-stt-") as tmp:
+        tmpdir = Path(tmp)
+        ydl_opts = {
+            "quiet": True,
+            "skip_download": False,
+            # smallest audio-only stream is plenty for speech
+            "format": "bestaudio[abr<=64]/worstaudio/bestaudio/best",
+            "outtmpl": str(tmpdir / "%(id)s.%(ext)s"),
+            "noplaylist": True,
+        }
+        try:
+            with YoutubeDL(ydl_opts) as ydl:
+                if info and info.get("formats"):
+                    info = ydl.process_ie_result(dict(info), download=True)
+                else:
+                    info = ydl.extract_info(url, download=True)
+                audio_path = Path(ydl.prepare_filename(info))
+        except Exception:
+            return None
+        if not audio_path.exists():
+            return None
 
-    try:
+        chunks = split_audio(audio_path, tmpdir / "chunks", chunk_seconds=chunk_seconds)
+        if not chunks:
+            return None
         client = OpenAI()
-        # Prefer the modern lightweight transcribe model; fallback to whisper-1
-        model = os.getenv("OPENAI_TRANSCRIBE_MODEL", "gpt-4o-mini-transcribe")
-        with audio_path.open("rb") as f:
-            resp = client.audio.transcriptions.create(model=model, file=f, response_format="verbose_json")
-        # openai>=2 returns a pydantic model or dict-like
-        segments = []
-        if hasattr(resp, "segments") and resp.segments:
-            for s in resp.segments:
-                segments.append({
-                    "t_start": float(getattr(s, "start", 0.0) or 0.0),
-                    "t_end": float(getattr(s, "end", 0.0) or 0.0),
-                    "text": getattr(s, "text", "") or "",
-                })
-        else:
-            text = getattr(resp, "text", None) or (resp.get("text") if isinstance(resp, dict) else "")
-            segments = [{"t_start": 0.0, "t_end": 0.0, "text": text or ""}]
-        return segments
-    except Exception:
+        results: List[Optional[Tuple[List[Dict], Optional[float]]]] = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as pool:
+            futures = {pool.submit(_transcribe_chunk, client, model, ch): i for i, ch in enumerate(chunks)}
+            for fut in as_completed(futures):
+                try:
+                    results[futures[fut]] = fut.result()
+                except Exception:
+                    pass
+
+    done = [(chunks[i], r) for i, r in enumerate(results) if r is not None]
+    if not done:
         return None
+    total = float(info.get("duration") or 0.0)
+    seconds = 0.0
+    for ch, (_, duration) in done:
+        # unknown chunk length: a full window, or the whole video when it was sent in one piece
+        seconds += duration or ch.duration or (total if len(chunks) == 1 else float(chunk_seconds))
+    return {
+        "segments": [seg for _, (segs, _) in done for seg in segs],
+        "minutes": round(seconds / 60.0, 2),
+        "model": model,
+        "complete": len(done) == len(chunks),
+    }
 
 
-def get_transcript_segments(url: str) -> Optional[List[Dict]]:
-    """Try captions first, then OpenAI fallback."""
+def transcribe_with_openai(url: str) -> Optional[List[Dict]]:
+    """Download audio via yt-dlp and transcribe with OpenAI if key present.
+    Returns segments if available, else single segment.
+    """
+    res = transcribe_audio(url)
+    return res["segments"] if res else None
+
+
+def get_transcript_segments(url: str, cache: TranscriptCache | None = None) -> Optional[List[Dict]]:
+    """Try the transcript cache, then captions, then OpenAI fallback (results are cached)."""
+    cache = cache or TranscriptCache()
+    vid = extract_video_id(url)
+    cached = cache.get(vid)
+    if cached:
+        return cached["segments"]
     segs = fetch_captions_segments(url)
     if segs:
+        cache.put(vid, segs, "captions")
         return segs
-    return transcribe_with_openai(url)
+    res = transcribe_audio(url)
+    if not res:
+        return None
+    cache.put(vid, res["segments"], "fallback", model=res["model"], minutes=res["minutes"], complete=res["complete"])
+    return res["segments"]
 
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query parameters that only carry tracking/presentation state. ``ref`` and
+# ``source`` are kept: on GitHub and elsewhere they select different content.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref_src", "ref_url", "si", "feature", "pp", "ab_channel",
+    "_hsenc", "_hsmi", "spm", "cmpid", "s_kwcid",
+}
+YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "music.youtube.com", "youtube-nocookie.com", "youtu.be"}
+_VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Titles shorter than this are too generic ("v1.2.0", "Release notes") to dedup on
+MIN_TITLE_TOKENS = 4
+
+
+def _host(netloc: str) -> str:
+    host = netloc.lower().rsplit("@", 1)[-1]
+    host = re.sub(r":(80|443)$", "", host)
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def youtube_video_id(url: str) -> Optional[str]:
+    """Video id from watch, youtu.be, shorts, embed and live URLs."""
+    if not url:
+        return None
+    parts = urlsplit(url if "://" in url else "https://" + url)
+    host = _host(parts.netloc)
+    if host not in YOUTUBE_HOSTS:
+        return None
+    if host == "youtu.be":
+        vid = parts.path.strip("/").split("/")[0]
+    else:
+        vid = dict(parse_qsl(parts.query)).get("v", "")
+        if not vid:
+            segs = [s for s in parts.path.split("/") if s]
+            if len(segs) >= 2 and segs[0] in ("shorts", "embed", "live", "v", "e"):
+                vid = segs[1]
+    return vid if _VIDEO_ID_RE.match(vid or "") else None
+
+
+def canonical_url(url: str | None) -> str:
+    """Normalize a URL so the same resource fetched via different feeds compares equal.
+
+    YouTube links collapse to ``https://www.youtube.com/watch?v=ID``; other URLs
+    lose tracking params, fragments, default ports, ``www.`` and trailing slashes.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    vid = youtube_video_id(url)
+    if vid:
+        return f"https://www.youtube.com/watch?v={vid}"
+    try:
+        parts = urlsplit(url if "://" in url else "https://" + url)
+    except ValueError:
+        return url
+    host = _host(parts.netloc)
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+    if host == "github.com":
+        path = re.sub(r"\.git$", "", path)
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    scheme = "https" if parts.scheme in ("http", "https", "") else parts.scheme
+    return urlunsplit((scheme, host, path if path != "/" else "", urlencode(sorted(query)), ""))
+
+
+def title_fingerprint(title: str | None) -> Optional[str]:
+    """Hash of a normalized title, or None when the title is too generic to trust."""
+    if not title:
+        return None
+    text = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("ascii").lower()
+    tokens = _WORD_RE.findall(text)
+    if len(tokens) < MIN_TITLE_TOKENS:
+        return None
+    return hashlib.sha1(" ".join(tokens).encode("utf-8")).hexdigest()[:16]
+
+
+def title_scope(url: str | None) -> Optional[str]:
+    """Where a title is unique: the repo for GitHub URLs, else the host."""
+    if not url:
+        return None
+    parts = urlsplit(url if "://" in url else "https://" + url)
+    host = _host(parts.netloc)
+    if host == "github.com":
+        segs = [s for s in parts.path.split("/") if s]
+        return f"{host}/{segs[0].lower()}/{segs[1].lower()}" if len(segs) >= 2 else None
+    return host or None
+
+
+def candidate_fingerprints(candidate: Dict) -> List[str]:
+    """Fingerprint keys for a candidate: canonical URL plus a scoped title hash.
+
+    The title key only matches within the same host (repo, for GitHub) and
+    publication day, so recurring titles ("v1.2.0 Bug fixes", "This Week in AI")
+    from other repos, sources or days never collide. Candidates without a
+    publication date get no title key.
+    """
+    keys = []
+    url = canonical_url(candidate.get("url"))
+    if url:
+        keys.append(f"url:{url}")
+    th = title_fingerprint(candidate.get("title"))
+    scope = title_scope(url)
+    day = (candidate.get("published_at") or "")[:10]
+    if th and scope and day:
+        keys.append(f"title:{scope}:{day}:{th}")
+    return keys
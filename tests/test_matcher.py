@@ -0,0 +1,47 @@
+"""Pillar keyword matching: stems in pillars.yaml must still tag inflected forms."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ai_intel_pipeline.classify.matcher import KeywordMatcher
+from ai_intel_pipeline.classify.pillars import classify_pillars
+from ai_intel_pipeline.normalize.highlights import extract_keyphrases
+
+
+PILLARS_CFG = yaml.safe_load((Path(__file__).resolve().parents[1] / "config" / "pillars.yaml").read_text(encoding="utf-8"))
+
+
+def _keywords():
+    for p in PILLARS_CFG["pillars"]:
+        for kw in p.get("keywords") or []:
+            if kw.isalpha():
+                yield p["name"], kw
+
+
+@pytest.mark.parametrize("pillar,kw", list(_keywords()))
+@pytest.mark.parametrize("suffix", ["s", "ing"])
+def test_inflected_keyword_tags_its_pillar(pillar, kw, suffix):
+    text = f"Notes on {kw}{suffix} in practice"
+    assert pillar in KeywordMatcher([(p["name"], p.get("keywords") or []) for p in PILLARS_CFG["pillars"]]).counts(text)
+
+
+@pytest.mark.parametrize(
+    "title,pillars",
+    [
+        ("Building effective agents", {"Agents"}),
+        ("Realtime API updates for voice agents", {"Agents"}),
+        ("New LLMs and prompts for RAG pipelines", {"Automation", "Claude/OpenAI Best Practices"}),
+        ("Claude Code now supports subagents for parallel workflows", {"Agents", "Hygienic Workflow"}),
+    ],
+)
+def test_titles_keep_their_pillars(title, pillars):
+    assert pillars <= set(classify_pillars(title, extract_keyphrases(title), PILLARS_CFG))
+
+
+def test_keyword_needs_a_leading_word_boundary():
+    m = KeywordMatcher([("AI UI/UX", ["ui"])])
+    assert m.counts("How to build a dashboard") == {}
+    assert m.counts("A new UI for builds") == {"AI UI/UX": 1}
@@ -596,6 +596,90 @@ const PillarGrid = ({ report, items, onPillarClick }) => {
   )
 }
 
+// Ingest Health: stage timings of the last ingest run and per-run history (report.json)
+const IngestHealth = ({ report }) => {
+  const profile = report?.ingest_profile
+  const history = report?.ingest_profile_history || []
+  if (!profile?.stages && !history.length) return null
+
+  const stages = Object.entries(profile?.stages || {}).slice(0, 8)
+  const runs = history.slice(-15)
+  const maxTotal = Math.max(...runs.map(r => r.total_seconds || 0), 1)
+  const slowest = (r) => Object.entries(r.stages || {}).sort(([, a], [, b]) => b - a)[0]
+
+  return (
+    <div
+      className="w-full max-w-4xl mx-auto animate-fadeInUp"
+      style={{ animationDelay: '0.7s', animationFillMode: 'both' }}
+    >
+      <div style={{ textAlign: 'center', marginBottom: '24px' }}>
+        <h3 style={{ fontSize: '20px', fontWeight: 'bold', marginBottom: '8px' }}>
+          ⏱️ Ingest Health
+        </h3>
+        <p style={{ color: 'var(--muted-foreground)' }}>Where the last ingest runs spent their time</p>
+      </div>
+
+      <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(320px, 1fr))', gap: '16px' }}>
+        {profile?.stages && (
+          <div className="pillar-card">
+            <h4 style={{ fontWeight: '600', fontSize: '14px', marginBottom: '4px' }}>Last run</h4>
+            <p style={{ fontSize: '12px', color: 'var(--muted-foreground)', margin: '0 0 12px 0' }}>
+              {new Date(profile.started).toLocaleString()} · {profile.total_seconds?.toFixed(1)}s ·{' '}
+              {profile.created ?? 0}/{profile.candidates ?? 0} items created
+            </p>
+            {stages.map(([name, st]) => (
+              <div key={name} style={{ marginBottom: '8px' }}>
+                <div style={{ display: 'flex', justifyContent: 'space-between', fontSize: '12px' }}>
+                  <span>{name}</span>
+                  <span style={{ color: 'var(--muted-foreground)' }}>
+                    {st.seconds.toFixed(1)}s · {st.items} items
+                  </span>
+                </div>
+                <div style={{ height: '6px', borderRadius: '3px', background: 'var(--muted)' }}>
+                  <div style={{
+                    height: '100%',
+                    width: `${Math.min(100, (st.share || 0) * 100)}%`,
+                    borderRadius: '3px',
+                    background: 'var(--primary)'
+                  }} />
+                </div>
+              </div>
+            ))}
+          </div>
+        )}
+
+        {runs.length > 0 && (
+          <div className="pillar-card">
+            <h4 style={{ fontWeight: '600', fontSize: '14px', marginBottom: '12px' }}>Recent runs</h4>
+            {runs.slice().reverse().map((r) => {
+              const top = slowest(r)
+              return (
+                <div key={r.started} style={{ display: 'flex', alignItems: 'center', gap: '8px', marginBottom: '6px', fontSize: '12px' }}>
+                  <span style={{ width: '88px', color: 'var(--muted-foreground)' }}>
+                    {new Date(r.started).toLocaleDateString()}
+                  </span>
+                  <div style={{ flex: 1, height: '6px', borderRadius: '3px', background: 'var(--muted)' }}>
+                    <div style={{
+                      height: '100%',
+                      width: `${((r.total_seconds || 0) / maxTotal) * 100}%`,
+                      borderRadius: '3px',
+                      background: 'var(--blue)'
+                    }} />
+                  </div>
+                  <span style={{ width: '56px', textAlign: 'right' }}>{(r.total_seconds || 0).toFixed(1)}s</span>
+                  <span style={{ width: '110px', color: 'var(--muted-foreground)', overflow: 'hidden', textOverflow: 'ellipsis', whiteSpace: 'nowrap' }}>
+                    {top ? `${top[0]} ${top[1].toFixed(1)}s` : ''}
+                  </span>
+                </div>
+              )
+            })}
+          </div>
+        )}
+      </div>
+    </div>
+  )
+}
+
 // Main Dashboard Component
 export default function ProperDashboard() {
   const { report, items, health } = useData()
@@ -818,6 +902,11 @@ placeholder="Search knowledge base..."
             <div style={{ display: 'flex', justifyContent: 'center' }}>
               <PillarGrid report={report} items={items} onPillarClick={navigateToPillar} />
             </div>
+
+            {/* Ingest Health */}
+            <div style={{ display: 'flex', justifyContent: 'center' }}>
+              <IngestHealth report={report} />
+            </div>
           </div>
         )}
         